@@ -17,21 +17,36 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import bpy
+import bpy.utils.previews
+import concurrent.futures
 import ctypes
 import datetime
-import filecmp
+import fnmatch
+import functools
+import glob
+import hashlib
 import json
+import math
 import os
+import queue
+import re
 import shutil
+import struct
+import subprocess
+import tempfile
 import threading
 import time
 import urllib.request
 import webbrowser
+import zipfile
+import zlib
+
+import numpy as np
 
 from bpy.app.handlers import persistent
 from bpy_extras.io_utils import ImportHelper
-from bpy.props import (CollectionProperty, EnumProperty, FloatVectorProperty,
-                       IntProperty, PointerProperty, StringProperty)
+from bpy.props import (BoolProperty, CollectionProperty, EnumProperty, FloatProperty,
+                       FloatVectorProperty, IntProperty, PointerProperty, StringProperty)
 from bpy.types import (Menu, Operator, Panel, PropertyGroup, Scene, UIList)
 
   
@@ -107,6 +122,12 @@ class RENDER_PT_main_panel(Panel):
         
         if context.scene.render_palette_autosave_props.enable_autosave:
             row.operator("render.autosave_operator", text="Render Image", icon="RESTRICT_RENDER_OFF")
+
+            history = context.scene.render_palette_autosave_props.history
+            if history and context.scene.render_type == 'IMAGE':
+                last = history[-1]
+                layout.label(text=f"Last: {bpy.path.basename(last.filepath)}, {format_duration(last.duration)}"
+                                  + (f", peak {last.peak_memory}" if last.peak_memory else ""), icon='TIME')
         else:
             op = row.operator("render.render", text="Render Image", icon="RENDER_STILL")
             op.write_still = False
@@ -697,6 +718,141 @@ class RENDER_OT_Camera_Orientation(Operator):
 
         return {'FINISHED'}
 
+class RENDER_OT_crop_to_subject(Operator):
+    bl_idname = "render.crop_to_subject"
+    bl_label = "Crop to Subject"
+    bl_options = {'REGISTER', 'UNDO'}
+    bl_description = "Set the render border to the area the subject covers in the camera view"
+
+    action: bpy.props.EnumProperty(
+        items=[
+            ('SET', 'Set', 'Fit the render border to the subject'),
+            ('CLEAR', 'Clear', 'Render the full frame again'),
+        ],
+        default='SET'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return is_camera_selected(context)
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.render_palette_border_props
+
+        if self.action == 'CLEAR':
+            scene.render.use_border = False
+            return {'FINISHED'}
+
+        objects = get_subject_objects(props)
+        if not objects:
+            self.report({'ERROR'}, "Choose a subject object or collection first")
+            return {'CANCELLED'}
+
+        border = get_subject_border(scene, scene.camera, objects, props.padding)
+        if border is None:
+            self.report({'WARNING'}, "The subject is not visible from the active camera")
+            return {'CANCELLED'}
+
+        set_render_border(scene.render, border, props.crop_output)
+        return {'FINISHED'}
+
+class RENDER_PG_border_props(PropertyGroup):
+    subject_type: bpy.props.EnumProperty(
+        name="Subject",
+        items=[
+            ('OBJECT', 'Object', 'Frame a single object'),
+            ('COLLECTION', 'Collection', 'Frame every object of a collection'),
+        ],
+        default='OBJECT',
+    )
+    subject_object: PointerProperty(
+        name="Subject Object",
+        type=bpy.types.Object,
+    )
+    subject_collection: PointerProperty(
+        name="Subject Collection",
+        type=bpy.types.Collection,
+    )
+    padding: bpy.props.FloatProperty(
+        name="Padding",
+        description="Extra space around the subject as a fraction of the frame",
+        default=0.02,
+        min=0.0,
+        max=0.5,
+        subtype='FACTOR',
+    )
+    crop_output: bpy.props.BoolProperty(
+        name="Crop Output",
+        description="Save only the border region. When off, the border is padded back to the full canvas",
+        default=True,
+    )
+    use_in_batch: bpy.props.BoolProperty(
+        name="Crop to Subject",
+        description="Fit the render border to the subject for every camera of a batch render",
+        default=False,
+    )
+
+def get_subject_objects(props):
+    """Return the objects that make up the subject to frame."""
+    if props.subject_type == 'OBJECT':
+        return [props.subject_object] if props.subject_object else []
+
+    collection = props.subject_collection
+    return [obj for obj in collection.all_objects if obj.type in RENDERABLE_TYPES] if collection else []
+
+def get_subject_border(scene, cam, objects, padding):
+    """Return the (min_x, max_x, min_y, max_y) border framing the objects, or None if they are off screen."""
+    clip = get_clip_corners(scene, cam, objects).reshape(-1, 4)
+
+    # Corners behind the camera cannot be projected, keep the full frame
+    if np.any(clip[:, 3] <= 1e-6):
+        return (0.0, 1.0, 0.0, 1.0)
+
+    ndc = clip[:, :2] / clip[:, 3:4]
+    low = np.clip((ndc.min(axis=0) + 1.0) / 2.0 - padding, 0.0, 1.0)
+    high = np.clip((ndc.max(axis=0) + 1.0) / 2.0 + padding, 0.0, 1.0)
+
+    if np.any(high <= low):
+        return None
+
+    return (float(low[0]), float(high[0]), float(low[1]), float(high[1]))
+
+def set_render_border(render, border, crop):
+    render.border_min_x, render.border_max_x, render.border_min_y, render.border_max_y = border
+    render.use_border = True
+    render.use_crop_to_border = crop
+
+class RENDER_PT_subject_border(Panel):
+    """Subject Border Panel"""
+    bl_label = "Subject Border"
+    bl_parent_id = "RENDER_PT_camera_controls"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return is_camera_selected(context)
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.render_palette_border_props
+
+        layout_sep(layout, 'prop', props, "subject_type", expand=True)
+
+        if props.subject_type == 'OBJECT':
+            scaled_row(layout, "Object:", props, "subject_object")
+        else:
+            scaled_row(layout, "Collection:", props, "subject_collection")
+
+        scaled_row(layout, "Padding:", props, "padding")
+        layout_sep(layout, 'prop', props, "crop_output")
+
+        row = layout.row(align=True)
+        row.operator("render.crop_to_subject", text="Crop to Subject").action = 'SET'
+        row.operator("render.crop_to_subject", text="Clear").action = 'CLEAR'
+
 # ------------------------------------
 
 class OBJECT_OT_apply_remove_constraint(Operator):
@@ -779,14 +935,55 @@ class RENDER_OT_align_camera_to_view(Operator):
 # ----------------------------------------------------------------------------
 
 # define camera list
+# Bumped whenever the batch list is edited, so the list filter knows when to run again
+batch_camera_revision = 0
+
+# (key, flags, order) of the last filter pass, by list
+batch_camera_filter_cache = {}
+
+def bump_batch_camera_revision():
+    global batch_camera_revision
+    batch_camera_revision += 1
+
 class RENDER_CAM_UL_List(bpy.types.UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
+        camera = get_batch_camera(item)
+
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            layout.prop(item, "name", text="", icon="CAMERA_DATA", emboss=False)
+            if camera:
+                layout.prop(camera, "name", text="", icon="CAMERA_DATA", emboss=False)
+            else:
+                layout.label(text=item.name, icon="ERROR")
         elif self.layout_type in {'GRID'}:
             layout.alignment = 'CENTER'
             layout.label(text="", icon_value=icon)            
 
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        cache_id = (data.as_pointer(), propname)
+        # Renaming a camera doesn't bump the revision, the filter catches up with the next list edit
+        key = (self.filter_name, self.use_filter_sort_alpha, len(items), batch_camera_revision)
+        cached = batch_camera_filter_cache.get(cache_id)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        names = [camera.name if camera else item.name
+                 for item in items
+                 for camera in (get_batch_camera(item),)]
+
+        if self.filter_name:
+            pattern = f"*{self.filter_name.lower()}*"
+            flags = [self.bitflag_filter_item if fnmatch.fnmatchcase(name.lower(), pattern) else 0 for name in names]
+        else:
+            flags = [self.bitflag_filter_item] * len(names)
+
+        order = []
+        if self.use_filter_sort_alpha:
+            order = bpy.types.UI_UL_list.sort_items_helper(list(enumerate(names)), key=lambda entry: entry[1].lower())
+
+        batch_camera_filter_cache[cache_id] = (key, flags, order)
+        return flags, order
+
 class RENDER_PT_Batch_Render(Panel):
     """Creates a Panel in the Object properties window"""
     bl_label = "Batch Render"
@@ -824,6 +1021,7 @@ class RENDER_PT_Batch_Render(Panel):
             col = row.column(align=True)
             col.operator("render.camera_list_operators", icon='ADD', text="").action = 'ADD'
             col.operator("render.camera_list_operators", icon='REMOVE', text="").action = 'REMOVE'
+            col.operator("render.camera_list_bulk_add", icon='FILTER', text="")
 
             col.separator()
             col.separator()
@@ -834,8 +1032,407 @@ class RENDER_PT_Batch_Render(Panel):
         
         layout.operator("render.render_multicam", text='Batch Render')
 
+class RENDER_PT_batch_optimization(Panel):
+    """Batch Render Optimization Panel"""
+    bl_label = "Optimization"
+    bl_idname = "RENDER_PT_batch_optimization"
+    bl_parent_id = "OBJECT_PT_multicam"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Render Palette"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.render_palette_batch_props
+
+        layout.prop(props, "use_frustum_culling")
+        if props.use_frustum_culling:
+            split_row(layout, "Margin:", props, "culling_margin")
+            split_row(layout, "Always Render:", props, "culling_keep_collection")
+
+        layout.prop(props, "use_lod")
+        if props.use_lod:
+            split_row(layout, "Full Detail:", props, "lod_screen_size")
+
+        layout.prop(context.scene.render_palette_border_props, "use_in_batch")
+
+        if context.scene.render_type == 'ANIMATION':
+            layout.prop(props, "use_prebake")
+            if props.use_prebake:
+                split_row(layout, "Objects:", props, "prebake_collection")
+
+class RENDER_PT_batch_lut_bake(Panel):
+    """Batch Render LUT Bake Panel"""
+    bl_label = "LUT Bake"
+    bl_idname = "RENDER_PT_batch_lut_bake"
+    bl_parent_id = "OBJECT_PT_multicam"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Render Palette"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        self.layout.prop(context.scene.render_palette_batch_props, "use_lut_bake", text="")
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.render_palette_batch_props
+        layout.active = props.use_lut_bake
+
+        layout.prop(props, "lut_bake_file", text="")
+        split_row(layout, "Interpolation:", props, "lut_bake_interpolation")
+        split_row(layout, "Workers:", props, "lut_bake_workers")
+        layout.label(text="Graded copies go to a '_graded' folder", icon='INFO')
+
+class RENDER_PG_batch_props(PropertyGroup):
+    use_frustum_culling: BoolProperty(
+        name="Frustum Culling",
+        description="Exclude objects outside each camera's view from rendering",
+        default=False,
+    )
+    culling_margin: FloatProperty(
+        name="Margin",
+        description="Grow the camera frustum by this fraction before testing objects against it",
+        default=0.1,
+        min=0.0,
+        max=2.0,
+        subtype='FACTOR',
+    )
+    culling_keep_collection: PointerProperty(
+        name="Always Render",
+        description="Objects in this collection are never culled, e.g. shadow casters or objects seen in reflections",
+        type=bpy.types.Collection,
+    )
+    use_lod: BoolProperty(
+        name="Level of Detail",
+        description="Lower subdivision levels and child particle counts of objects that are small in each camera's view",
+        default=False,
+    )
+    lod_screen_size: FloatProperty(
+        name="Full Detail Size",
+        description="Objects covering at least this fraction of the frame keep their full detail",
+        default=0.5,
+        min=0.01,
+        max=1.0,
+        subtype='FACTOR',
+    )
+    use_prebake: BoolProperty(
+        name="Pre-bake Animation",
+        description="Evaluate animated geometry once into an Alembic cache that every camera reuses",
+        default=False,
+    )
+    prebake_collection: PointerProperty(
+        name="Bake Objects",
+        description="Only bake the meshes in this collection. When empty, every mesh with modifiers is baked",
+        type=bpy.types.Collection,
+    )
+    use_lut_bake: BoolProperty(
+        name="LUT Bake",
+        description="Apply a LUT to every rendered image and save the graded copy next to the output folder",
+        default=False,
+    )
+    lut_bake_file: StringProperty(
+        name="LUT File",
+        description=".cube LUT to burn into the graded copies",
+        subtype='FILE_PATH',
+    )
+    lut_bake_interpolation: EnumProperty(
+        name="Interpolation",
+        items=[
+            ('TETRAHEDRAL', "Tetrahedral", "Interpolate between 4 LUT entries, like the installed looks"),
+            ('TRILINEAR', "Trilinear", "Interpolate between 8 LUT entries"),
+        ],
+        default='TETRAHEDRAL',
+    )
+    lut_bake_workers: IntProperty(
+        name="Workers",
+        description="Background processes grading images while the next ones render",
+        default=2,
+        min=1,
+        max=16,
+    )
+
+# ------------------------------------
+
+# Object types that add geometry to a render
+RENDERABLE_TYPES = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'VOLUME', 'GPENCIL', 'POINTCLOUD', 'CURVES'}
+
+def get_camera_matrix(scene, cam):
+    """Return the projection matrix times the view matrix of a camera as a NumPy array."""
+    render = scene.render
+    projection = cam.calc_matrix_camera(
+        bpy.context.evaluated_depsgraph_get(),
+        x=render.resolution_x,
+        y=render.resolution_y,
+        scale_x=render.pixel_aspect_x,
+        scale_y=render.pixel_aspect_y,
+    )
+    return np.array(projection @ cam.matrix_world.inverted())
+
+def get_clip_corners(scene, cam, objects):
+    """Return the bounding box corners of objects in the camera's clip space, shape (N, 8, 4)."""
+    corners = np.array([obj.bound_box for obj in objects], dtype=np.float64).reshape(-1, 8, 3)
+    matrices = np.array([obj.matrix_world for obj in objects], dtype=np.float64).reshape(-1, 4, 4)
+
+    homogeneous = np.concatenate((corners, np.ones((len(objects), 8, 1))), axis=2)
+    world = np.einsum('nij,nkj->nki', matrices, homogeneous)
+
+    return world @ get_camera_matrix(scene, cam).T
+
+def get_cull_candidates(scene, batch_props):
+    """Return the renderable objects that frustum culling is allowed to hide."""
+    keep = batch_props.culling_keep_collection
+    keep_objects = set(keep.all_objects) if keep else set()
+
+    return [obj for obj in scene.objects
+            if obj.type in RENDERABLE_TYPES and not obj.hide_render and obj not in keep_objects]
+
+def apply_frustum_culling(scene, cam, candidates, margin):
+    """Hide the candidates whose bounding box lies outside the camera frustum."""
+    x, y, z, w = np.moveaxis(get_clip_corners(scene, cam, candidates), 2, 0)
+    limit = w * (1.0 + margin)
+
+    # An object is outside when all of its corners are behind the same frustum plane
+    outside = (np.all(x < -limit, axis=1) | np.all(x > limit, axis=1) |
+               np.all(y < -limit, axis=1) | np.all(y > limit, axis=1) |
+               np.all(z < -w, axis=1) | np.all(z > w, axis=1))
+
+    for obj, hide in zip(candidates, outside.tolist()):
+        if obj.hide_render != hide:
+            obj.hide_render = hide
+
+def restore_frustum_culling(candidates):
+    for obj in candidates:
+        obj.hide_render = False
+
+def get_screen_sizes(scene, cam, objects):
+    """Return the largest on-screen extent of each object as a fraction of the frame."""
+    clip = get_clip_corners(scene, cam, objects)
+    w = clip[..., 3]
+    in_front = w > 1e-6
+
+    ndc = clip[..., :2] / np.where(in_front, w, 1.0)[..., None]
+    sizes = (ndc.max(axis=1) - ndc.min(axis=1)).max(axis=1) / 2.0
+
+    # Objects crossing the camera plane are treated as filling the frame
+    sizes[~np.all(in_front, axis=1)] = np.inf
+    return sizes
+
+def get_lod_targets(scene):
+    """Collect the subdivision levels and child particle counts that level of detail may lower."""
+    objects, targets = [], []
+
+    for obj in scene.objects:
+        if obj.type not in RENDERABLE_TYPES or obj.hide_render:
+            continue
+
+        entries = [(mod, 'render_levels') for mod in obj.modifiers
+                   if mod.type in {'SUBSURF', 'MULTIRES'} and mod.show_render and mod.render_levels > 0]
+        entries += [(psys.settings, 'rendered_child_count') for psys in getattr(obj, "particle_systems", ())
+                    if psys.settings.child_type != 'NONE']
+
+        if entries:
+            for owner, attr in entries:
+                targets.append((len(objects), owner, attr, getattr(owner, attr)))
+            objects.append(obj)
+
+    return objects, targets
+
+def apply_level_of_detail(scene, cam, objects, targets, full_detail_size):
+    sizes = np.clip(get_screen_sizes(scene, cam, objects), 1e-6, full_detail_size)
+
+    # Halving the on-screen size halves the edge length in pixels, one subdivision level less keeps the density
+    drops = np.ceil(np.log2(full_detail_size / sizes)).astype(int)
+    ratios = (sizes / full_detail_size) ** 2
+
+    # Particle settings can be shared, the largest user decides
+    values = {}
+    for index, owner, attr, original in targets:
+        if attr == 'render_levels':
+            value = max(original - int(drops[index]), 0)
+        else:
+            value = max(int(original * ratios[index]), 1)
+
+        key = owner.as_pointer()
+        if key not in values or values[key][2] < value:
+            values[key] = (owner, attr, value)
+
+    for owner, attr, value in values.values():
+        if getattr(owner, attr) != value:
+            setattr(owner, attr, value)
+
+def restore_level_of_detail(targets):
+    for _index, owner, attr, original in targets:
+        setattr(owner, attr, original)
+
+def has_prebake_modifiers(obj):
+    """Return True when obj has modifiers to cache, particle systems stay live and don't count.
+
+    A particle system that follows a cached modifier would lose the geometry it emits from, so those objects are skipped.
+    """
+    found = False
+    for mod in obj.modifiers:
+        if not mod.show_render:
+            continue
+        if mod.type != 'PARTICLE_SYSTEM':
+            found = True
+        elif found:
+            return False
+    return found
+
+def get_prebake_objects(scene, batch_props):
+    """Return the meshes whose evaluated geometry is worth caching.
+
+    Objects that instance other geometry are left out, the cache would drop the instances.
+    """
+    collection = batch_props.prebake_collection
+    objects = collection.all_objects if collection else scene.objects
+    view_layer_objects = set(bpy.context.view_layer.objects)
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    instancers = {inst.parent.original.name for inst in depsgraph.object_instances
+                  if inst.is_instance and inst.parent is not None}
+
+    return [obj for obj in objects
+            if obj.type == 'MESH' and not obj.hide_render and obj in view_layer_objects
+            and obj.name not in instancers and has_prebake_modifiers(obj)]
+
+def get_alembic_name(name):
+    """Return a name the way the Alembic exporter writes it."""
+    for char in " .:":
+        name = name.replace(char, "_")
+    return name
+
+def prebake_animation(scene, objects, cache_path):
+    """Export the evaluated frame range of objects to Alembic and replace their modifiers by the cache."""
+    view_layer = bpy.context.view_layer
+    selected = [obj for obj in view_layer.objects if obj.select_get()]
+    active = view_layer.objects.active
+
+    for obj in selected:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+
+    cache_file = None
+    baked = []
+    try:
+        try:
+            bpy.ops.wm.alembic_export(
+                filepath=cache_path,
+                start=scene.frame_start,
+                end=scene.frame_end,
+                selected=True,
+                flatten=True,
+                vcolors=True,
+                face_sets=True,
+                export_hair=False,
+                export_particles=False,
+                evaluation_mode='RENDER',
+                as_background_job=False,
+            )
+        finally:
+            for obj in objects:
+                obj.select_set(False)
+            for obj in selected:
+                obj.select_set(True)
+            view_layer.objects.active = active
+
+        bpy.ops.cachefile.open(filepath=cache_path)
+        cache_file = next((cf for cf in bpy.data.cache_files if bpy.path.abspath(cf.filepath) == cache_path), None)
+        if cache_file is None:
+            raise RuntimeError(f"could not open {cache_path}")
+
+        for obj in objects:
+            # Recorded before anything changes, so a failure part way through can be undone
+            states = [(mod, mod.show_render, mod.show_viewport) for mod in obj.modifiers if mod.type != 'PARTICLE_SYSTEM']
+            modifier = obj.modifiers.new("Render Palette Bake", 'MESH_SEQUENCE_CACHE')
+            baked.append((obj, modifier, states))
+
+            for mod, _show_render, _show_viewport in states:
+                mod.show_render = False
+                mod.show_viewport = False
+            modifier.cache_file = cache_file
+            modifier.object_path = f"/{get_alembic_name(obj.name)}/{get_alembic_name(obj.data.name)}"
+    except Exception:
+        restore_prebake(cache_path, cache_file, baked)
+        raise
+
+    return cache_file, baked
+
+def restore_prebake(cache_path, cache_file, baked):
+    for obj, modifier, states in baked:
+        obj.modifiers.remove(modifier)
+        for mod, show_render, show_viewport in states:
+            mod.show_render = show_render
+            mod.show_viewport = show_viewport
+
+    if cache_file is not None:
+        bpy.data.batch_remove([cache_file])
+
+    if os.path.isfile(cache_path):
+        os.remove(cache_path)
+
 # ------------------------------------
 
+LUT_BAKE_CHUNK_ROWS = 64
+
+LUT_BAKE_WORKER_SCRIPT = """
+import json
+import sys
+import addon_utils
+
+args = sys.argv[sys.argv.index("--") + 1:]
+module_name, lut_path, method, compression, cache_dir, cache_bytes = args[:6]
+
+module = addon_utils.enable(module_name, default_set=False)
+# The batch already parsed the LUT, so this maps the cached table
+lut = module.load_lut(lut_path, int(cache_bytes), cache_dir)
+
+# One dumped render per line, until the batch closes stdin
+for line in sys.stdin:
+    graded_path, tga_path = json.loads(line)
+    try:
+        module.bake_lut_from_targa(tga_path, graded_path, lut, method, int(compression))
+        error = None
+    except Exception as e:
+        error = str(e)
+    print(module.WORKER_RESULT_PREFIX + json.dumps([graded_path, error]), flush=True)
+"""
+
+def get_graded_root(output_dir):
+    """Return the folder for graded copies, a sibling of the output folder."""
+    output_dir = os.path.normpath(bpy.path.abspath(output_dir))
+    return os.path.join(os.path.dirname(output_dir), os.path.basename(output_dir) + "_graded")
+
+def bake_lut_from_targa(tga_path, filepath, lut, method, compression, chunk_rows=LUT_BAKE_CHUNK_ROWS):
+    """Write a dumped render as an 8-bit PNG with the LUT applied, runs in a background Blender process.
+
+    The image is read and graded a few rows at a time, so memory use does not grow with the resolution.
+    The dump is removed afterwards.
+    """
+    pixels = None
+    try:
+        pixels = read_targa(tga_path)
+        height, width, channels = pixels.shape
+        order = get_rgb_order(channels)
+
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with PNGStreamWriter(filepath + ".tmp", width, height, channels, 8, compression) as writer:
+            for row in range(0, height, chunk_rows):
+                chunk = np.array(pixels[row:row + chunk_rows][..., order])
+                if channels >= 3:
+                    rgb = chunk[..., :3].reshape(-1, 3) / np.float32(255.0)
+                    graded = np.clip(lut.apply(rgb, method), 0.0, 1.0) * 255.0 + 0.5
+                    chunk[..., :3] = graded.reshape(chunk.shape[:2] + (3,))
+                writer.write_rows(chunk)
+        os.replace(filepath + ".tmp", filepath)
+    finally:
+        # The memory map has to be closed before the file can be removed on Windows
+        del pixels
+        os.remove(tga_path)
+
 class RENDER_OT_Batch_Render(Operator):
     bl_idname = "render.render_multicam"
     bl_description = "Start Batch render"
@@ -850,14 +1447,57 @@ class RENDER_OT_Batch_Render(Operator):
             # Render with all cameras in the scene
             cameras_to_render = [obj for obj in bpy.data.objects if obj.type == 'CAMERA']
         else:
-            cameras_to_render = [bpy.data.objects.get(cam.name) for cam in scene.batch_render_cameras if bpy.data.objects.get(cam.name) is not None]
+            cameras_to_render = [cam for cam in map(get_batch_camera, scene.batch_render_cameras) if cam is not None]
 
         total_frames = len(cameras_to_render) * (scene.frame_end - scene.frame_start + 1)
         current_frame = 0
 
+        batch_props = scene.render_palette_batch_props
+        self.cull_candidates = get_cull_candidates(scene, batch_props) if batch_props.use_frustum_culling else []
+        self.lod_objects, self.lod_targets = get_lod_targets(scene) if batch_props.use_lod else ([], [])
+
+        border_props = scene.render_palette_border_props
+        self.subject_objects = get_subject_objects(border_props) if border_props.use_in_batch else []
+        rd = scene.render
+        original_border = (rd.use_border, rd.use_crop_to_border,
+                           (rd.border_min_x, rd.border_max_x, rd.border_min_y, rd.border_max_y))
+
+        prebake = None
+        prebake_path = os.path.join(bpy.app.tempdir, "render_palette_bake.abc")
+
+        self.bake_workers = None
+        self.bake_dumps = {}
+        if batch_props.use_lut_bake:
+            lut_path = bpy.path.abspath(batch_props.lut_bake_file)
+            try:
+                # Parsing it here reports a bad LUT up front and leaves it in the cache for the workers
+                load_lut(lut_path, get_lut_cache_bytes(context))
+            except (OSError, ValueError) as e:
+                self.report({'ERROR'}, f"Could not read LUT {batch_props.lut_bake_file}: {e}")
+                return {'CANCELLED'}
+            self.graded_root = get_graded_root(original_filepath)
+
         try:
             bpy.context.window_manager.progress_begin(0, total_frames)
 
+            # Separate processes, the render holds the interpreter of this one until it is done.
+            # They start once and grade every image of the batch.
+            if batch_props.use_lut_bake:
+                self.bake_workers = BackgroundWorkers(batch_props.lut_bake_workers, get_background_command(
+                    None, LUT_BAKE_WORKER_SCRIPT,
+                    [__name__, lut_path, batch_props.lut_bake_interpolation,
+                     min(9, rd.image_settings.compression // 10), get_lut_cache_dir(), get_lut_cache_bytes(context)]))
+
+            # Evaluating modifiers and simulations once pays off as soon as a second camera reuses them
+            if batch_props.use_prebake and scene.render_type == 'ANIMATION' and len(cameras_to_render) > 1:
+                prebake_objects = get_prebake_objects(scene, batch_props)
+                if prebake_objects:
+                    try:
+                        prebake = prebake_animation(scene, prebake_objects, prebake_path)
+                    except RuntimeError as e:
+                        self.report({'ERROR'}, f"Could not pre-bake the animation: {e}")
+                        return {'CANCELLED'}
+
             for i, cam in enumerate(cameras_to_render):
                 scene.camera = cam
 
@@ -866,18 +1506,79 @@ class RENDER_OT_Batch_Render(Operator):
                 else:
                     self._render_single_frame(scene, original_filepath, cam, total_frames, current_frame)
 
+            if self.bake_workers is not None:
+                failed = self._finish_lut_bake()
+                if failed:
+                    self.report({'WARNING'}, f"Rendering completed, {len(failed)} graded copies failed: {'; '.join(failed)}")
+                    return {'FINISHED'}
+
             self.report({'INFO'}, "Rendering completed")
 
         finally:
+            if self.bake_workers is not None:
+                self.bake_workers.cancel()
+                for tga_path in self.bake_dumps.values():
+                    if os.path.isfile(tga_path):
+                        os.remove(tga_path)
             bpy.context.window_manager.progress_end()
+            restore_frustum_culling(self.cull_candidates)
+            restore_level_of_detail(self.lod_targets)
+            if prebake:
+                restore_prebake(prebake_path, *prebake)
+            if self.subject_objects:
+                set_render_border(rd, original_border[2], original_border[1])
+                rd.use_border = original_border[0]
             scene.camera = original_cam
             bpy.context.scene.render.filepath = original_filepath
 
         return {'FINISHED'}
 
+    def _prepare_frame(self, scene, cam):
+        """Apply the per-camera optimizations before rendering a frame."""
+        batch_props = scene.render_palette_batch_props
+
+        if self.cull_candidates:
+            apply_frustum_culling(scene, cam, self.cull_candidates, batch_props.culling_margin)
+
+        if self.lod_targets:
+            apply_level_of_detail(scene, cam, self.lod_objects, self.lod_targets, batch_props.lod_screen_size)
+
+        if self.subject_objects:
+            border = get_subject_border(scene, cam, self.subject_objects, scene.render_palette_border_props.padding)
+            if border is None:
+                scene.render.use_border = False
+            else:
+                set_render_border(scene.render, border, scene.render_palette_border_props.crop_output)
+
+    def _bake_frame(self, scene, original_filepath, filepath):
+        """Grade the image that was just rendered in a background process, while the next one renders."""
+        if self.bake_workers is None:
+            return
+
+        # Only a few dumps wait on disk at a time, so a slow bake holds back rendering instead of filling the disk
+        while self.bake_workers.update() and self.bake_workers.get_queued_count() >= self.bake_workers.count * 2:
+            time.sleep(0.1)
+
+        tga_path = os.path.join(bpy.app.tempdir, f"render_palette_lut_bake_{len(self.bake_dumps)}.tga")
+        save_render_result(scene, tga_path, 'TARGA_RAW')
+
+        relative = os.path.relpath(bpy.path.abspath(filepath), os.path.normpath(bpy.path.abspath(original_filepath)))
+        graded_path = os.path.join(self.graded_root, relative + ".png")
+        self.bake_dumps[graded_path] = tga_path
+        self.bake_workers.add(graded_path, tga_path)
+
+    def _finish_lut_bake(self):
+        """Wait for the graded copies and return the ones that failed, with the reason."""
+        self.bake_workers.close()
+        while self.bake_workers.update():
+            time.sleep(0.1)
+
+        return [f"{os.path.basename(graded_path)} ({error})" for graded_path, error in self.bake_workers.failed]
+
     def _render_animation_frames(self, scene, original_filepath, cam, total_frames, current_frame):
         for frame in range(scene.frame_start, scene.frame_end + 1):
             bpy.context.scene.frame_set(frame)
+            self._prepare_frame(scene, cam)
 
             bpy.context.scene.render_file_format = 'PNG'
 
@@ -892,11 +1593,14 @@ class RENDER_OT_Batch_Render(Operator):
 
             bpy.context.scene.render.filepath = filepath
             bpy.ops.render.render(write_still=True)
+            self._bake_frame(scene, original_filepath, filepath)
 
             current_frame += 1
             bpy.context.window_manager.progress_update(current_frame)
 
     def _render_single_frame(self, scene, original_filepath, cam, total_frames, current_frame):
+        self._prepare_frame(scene, cam)
+
         bpy.context.scene.render_file_format = 'PNG'
 
         if scene.location_type == 'SEPARATE_FOLDERS':
@@ -910,6 +1614,7 @@ class RENDER_OT_Batch_Render(Operator):
 
         bpy.context.scene.render.filepath = filepath
         bpy.ops.render.render(write_still=True)
+        self._bake_frame(scene, original_filepath, filepath)
 
         current_frame += 1
         bpy.context.window_manager.progress_update(current_frame)
@@ -942,37 +1647,553 @@ class RENDER_OT_Camera_List(Operator):
         scene = context.scene
 
         if self.action == 'ADD':
-            selected_objects = bpy.context.selected_objects
-
-            if selected_objects:
-                for obj in selected_objects:
-                    if obj.type == 'CAMERA' and obj.name not in [cam.name for cam in scene.batch_render_cameras]:
-                        item = scene.batch_render_cameras.add()
-                        item.name = obj.name
-            else:
-                for obj in bpy.data.objects:
-                    if obj.type == 'CAMERA' and obj.name not in [cam.name for cam in scene.batch_render_cameras]:
-                        item = scene.batch_render_cameras.add()
-                        item.name = obj.name
+            candidates = bpy.context.selected_objects or scene.objects
+            add_batch_cameras(scene, [obj for obj in candidates if obj.type == 'CAMERA'])
 
         elif self.action == 'REMOVE':
             idx = scene.active_camera_index
 
             if scene.batch_render_cameras:
                 scene.batch_render_cameras.remove(idx)
+                bump_batch_camera_revision()
 
         elif self.action == 'MOVE_UP':
             if scene.active_camera_index > 0:
                 scene.batch_render_cameras.move(scene.active_camera_index, scene.active_camera_index - 1)
                 scene.active_camera_index -= 1
+                bump_batch_camera_revision()
 
         elif self.action == 'MOVE_DOWN':
             if scene.active_camera_index < len(scene.batch_render_cameras) - 1:
                 scene.batch_render_cameras.move(scene.active_camera_index, scene.active_camera_index + 1)
                 scene.active_camera_index += 1
+                bump_batch_camera_revision()
+
+        return {'FINISHED'}
+
+class RENDER_OT_Camera_List_Bulk_Add(Operator):
+    bl_idname = "render.camera_list_bulk_add"
+    bl_label = "Add Cameras"
+    bl_description = "Add every camera of a collection or every camera whose name matches a pattern"
+
+    mode: bpy.props.EnumProperty(
+        name="Match",
+        items=[
+            ('COLLECTION', 'Collection', 'Add the cameras of a collection'),
+            ('GLOB', 'Wildcard', 'Add the cameras whose name matches a wildcard pattern such as "SH010_*"'),
+            ('REGEX', 'Regex', 'Add the cameras whose name matches a regular expression'),
+        ],
+        default='GLOB'
+    )
+    pattern: bpy.props.StringProperty(name="Pattern", default="*")
+    collection: bpy.props.StringProperty(name="Collection")
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout_sep(layout, 'prop', self, "mode", expand=True)
+
+        if self.mode == 'COLLECTION':
+            layout.prop_search(self, "collection", bpy.data, "collections", text="")
+        else:
+            layout.prop(self, "pattern", text="")
+
+    def execute(self, context):
+        scene = context.scene
+
+        if self.mode == 'COLLECTION':
+            collection = bpy.data.collections.get(self.collection)
+            if collection is None:
+                self.report({'ERROR'}, "Choose a collection")
+                return {'CANCELLED'}
+            cameras = [obj for obj in collection.all_objects if obj.type == 'CAMERA']
+        else:
+            cameras = [obj for obj in scene.objects if obj.type == 'CAMERA']
+
+            if self.mode == 'GLOB':
+                cameras = [obj for obj in cameras if fnmatch.fnmatchcase(obj.name, self.pattern)]
+            else:
+                try:
+                    regex = re.compile(self.pattern)
+                except re.error as e:
+                    self.report({'ERROR'}, f"Invalid regular expression: {str(e)}")
+                    return {'CANCELLED'}
+                cameras = [obj for obj in cameras if regex.search(obj.name)]
+
+        added = add_batch_cameras(scene, cameras)
+
+        self.report({'INFO'}, f"Added {added} cameras to the batch list")
+        return {'FINISHED'}
+
+class RENDER_PG_batch_camera(PropertyGroup):
+    camera: PointerProperty(
+        name="Camera",
+        type=bpy.types.Object,
+        poll=lambda self, obj: obj.type == 'CAMERA',
+    )
+
+def get_batch_camera(item):
+    """Return the camera of a batch list entry, lists saved before pointers were used store the name only."""
+    if item.camera:
+        return item.camera
+    # The name of a deleted camera may have been reused by another object
+    obj = bpy.data.objects.get(item.name)
+    return obj if obj is not None and obj.type == 'CAMERA' else None
+
+def add_batch_cameras(scene, cameras):
+    """Append the cameras that are not in the batch list yet and return how many were added."""
+    existing = {cam for cam in map(get_batch_camera, scene.batch_render_cameras) if cam is not None}
+    added = 0
+
+    for cam in cameras:
+        if cam not in existing:
+            item = scene.batch_render_cameras.add()
+            item.camera = cam
+            item.name = cam.name
+            existing.add(cam)
+            added += 1
+
+    if added:
+        bump_batch_camera_revision()
+    return added
+
+# ----------------------------------------------------------------------------
+
+def save_temp_blend_copy(name):
+    """Save a copy of the current file, with unsaved changes, for background Blender processes."""
+    filepath = os.path.join(bpy.app.tempdir, name)
+    bpy.ops.wm.save_as_mainfile(filepath=filepath, copy=True)
+    return filepath
+
+def get_background_command(blend_path, script, args, threads=0):
+    """Return the command line that runs a script in a background Blender process."""
+    command = [bpy.app.binary_path, "-b"]
+    if blend_path:
+        command.append(blend_path)
+    if threads:
+        command += ["-t", str(threads)]
+    return command + ["--python-expr", script, "--"] + [str(arg) for arg in args]
+
+def read_log_tail(log_path, lines=1):
+    try:
+        with open(log_path, "r", errors="replace") as file:
+            return "".join(file.readlines()[-lines:]).strip()
+    except OSError:
+        return ""
+
+class BackgroundJobs:
+    """Runs background Blender processes with a limit on how many run at the same time."""
+
+    def __init__(self, max_jobs):
+        self.max_jobs = max(1, max_jobs)
+        self.pending = []
+        self.running = []
+        self.results = []
+
+    def add(self, key, command):
+        self.pending.append((key, command))
+
+    def update(self):
+        """Collect finished processes and start queued ones, returns True while work remains."""
+        for job in list(self.running):
+            key, process, log = job
+            if process.poll() is not None:
+                log.close()
+                self.running.remove(job)
+                self.results.append((key, process.returncode, log.name))
+
+        while self.pending and len(self.running) < self.max_jobs:
+            key, command = self.pending.pop(0)
+            log = tempfile.NamedTemporaryFile("w", prefix="render_palette_", suffix=".log", delete=False)
+            process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+            self.running.append((key, process, log))
+
+        return bool(self.pending or self.running)
+
+    def cancel(self):
+        for _key, process, log in self.running:
+            process.kill()
+            process.wait()
+            log.close()
+        self.pending.clear()
+        self.running.clear()
+
+# Marks the lines a background worker answers a job with, the rest of its output is Blender's own
+WORKER_RESULT_PREFIX = "render_palette_result:"
+
+class BackgroundWorkers:
+    """Long-lived background Blender processes that take jobs as JSON lines on stdin.
+
+    A worker answers each job, in order, with WORKER_RESULT_PREFIX and the JSON [key, error], error being
+    None on success. Jobs of a worker that exits are counted as failed.
+    """
+
+    def __init__(self, count, command):
+        self.count = max(1, count)
+        self.results = queue.Queue()
+        self.processes = []
+        self.jobs = []
+        self.alive = set()
+        self.failed = []
+
+        for index in range(self.count):
+            process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       text=True, encoding="utf-8", errors="replace", bufsize=1)
+            self.processes.append(process)
+            self.jobs.append([])
+            self.alive.add(index)
+            threading.Thread(target=self._read_output, args=(index, process), daemon=True).start()
+
+    def _read_output(self, index, process):
+        last_line = ""
+        for line in process.stdout:
+            if line.startswith(WORKER_RESULT_PREFIX):
+                try:
+                    self.results.put((index, json.loads(line[len(WORKER_RESULT_PREFIX):]), None))
+                    continue
+                except ValueError:
+                    pass
+            if line.strip():
+                last_line = line.strip()
+        self.results.put((index, None, last_line or "worker exited"))
+
+    def add(self, key, *args):
+        if not self.alive:
+            self.failed.append((key, "no worker running"))
+            return
+
+        # The worker with the fewest queued jobs gets the next one
+        index = min(self.alive, key=lambda index: len(self.jobs[index]))
+        self.jobs[index].append(key)
+        try:
+            self.processes[index].stdin.write(json.dumps([key, *args]) + "\n")
+            self.processes[index].stdin.flush()
+        except OSError:
+            # The worker is exiting, its reader fails the job
+            pass
+
+    def get_queued_count(self):
+        return sum(len(jobs) for jobs in self.jobs)
+
+    def update(self):
+        """Collect the answers of the workers, returns True while a worker is running."""
+        while True:
+            try:
+                index, result, exit_reason = self.results.get_nowait()
+            except queue.Empty:
+                break
+
+            if result is not None:
+                key, error = result
+                self.jobs[index].remove(key)
+                if error:
+                    self.failed.append((key, error))
+                continue
+
+            self.processes[index].wait()
+            self.alive.discard(index)
+            self.failed += [(key, exit_reason) for key in self.jobs[index]]
+            self.jobs[index].clear()
+
+        return bool(self.alive)
+
+    def close(self):
+        """Let the workers exit once their queued jobs are done."""
+        for process in self.processes:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+
+    def cancel(self):
+        for process in self.processes:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+        self.close()
+
+class PNGStreamWriter:
+    """Writes a PNG image row by row so the full image never has to be held in memory."""
+
+    def __init__(self, filepath, width, height, channels=4, bit_depth=8, compression=6):
+        self.file = open(filepath, "wb")
+        self.dtype = np.dtype(">u2") if bit_depth == 16 else np.dtype("u1")
+        self.compressor = zlib.compressobj(compression)
+
+        color_type = {1: 0, 2: 4, 3: 2, 4: 6}[channels]
+        self.file.write(b"\x89PNG\r\n\x1a\n")
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_chunk(self, tag, data):
+        self.file.write(struct.pack(">I", len(data)) + tag + data)
+        self.file.write(struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    def write_rows(self, rows):
+        """Append rows, top to bottom, given as an integer array of shape (rows, width, channels)."""
+        rows = np.ascontiguousarray(rows, dtype=self.dtype)
+        # Each row starts with filter type 0 (None)
+        data = b"".join(b"\x00" + row.tobytes() for row in rows)
+        compressed = self.compressor.compress(data)
+        if compressed:
+            self._write_chunk(b"IDAT", compressed)
+
+    def close(self):
+        if self.file.closed:
+            return
+        self._write_chunk(b"IDAT", self.compressor.flush())
+        self._write_chunk(b"IEND", b"")
+        self.file.close()
+
+# ------------------------------------
+
+TILE_WORKER_SCRIPT = """
+import sys
+import bpy
+import numpy as np
+
+args = sys.argv[sys.argv.index("--") + 1:]
+border = [float(value) for value in args[:4]]
+tile_path = args[4]
+
+rd = bpy.context.scene.render
+rd.use_border = True
+rd.use_crop_to_border = True
+rd.border_min_x, rd.border_max_x, rd.border_min_y, rd.border_max_y = border
+rd.image_settings.file_format = 'PNG'
+rd.image_settings.color_mode = 'RGBA'
+rd.image_settings.color_depth = '16'
+rd.image_settings.compression = 0
+rd.use_file_extension = False
+rd.filepath = tile_path + ".png"
+bpy.ops.render.render(write_still=True)
+
+image = bpy.data.images.load(rd.filepath)
+image.colorspace_settings.is_data = True
+width, height = image.size
+pixels = np.empty(width * height * 4, dtype=np.float32)
+image.pixels.foreach_get(pixels)
+np.save(tile_path, np.round(pixels.reshape(height, width, 4)[::-1] * 65535.0).astype(np.uint16))
+"""
+
+def get_tile_layout(width, height, tiles_x, tiles_y, overlap):
+    """Split the frame into tiles, returns (expanded, core) rectangles as (x0, x1, y0, y1) from the top left."""
+    xs = np.linspace(0, width, tiles_x + 1).round().astype(int).tolist()
+    ys = np.linspace(0, height, tiles_y + 1).round().astype(int).tolist()
+
+    tiles = []
+    for y0, y1 in zip(ys, ys[1:]):
+        for x0, x1 in zip(xs, xs[1:]):
+            expanded = (max(0, x0 - overlap), min(width, x1 + overlap), max(0, y0 - overlap), min(height, y1 + overlap))
+            tiles.append((expanded, (x0, x1, y0, y1)))
+    return tiles
+
+def get_tile_border(rect, width, height):
+    """Return the render border of a pixel rectangle, Blender truncates the border to whole pixels."""
+    x0, x1, y0, y1 = rect
+    return (min(1.0, (x0 + 0.25) / width), min(1.0, (x1 + 0.25) / width),
+            min(1.0, (height - y1 + 0.25) / height), min(1.0, (height - y0 + 0.25) / height))
+
+def get_feather_weights(start, end, core_start, core_end, overlap):
+    """Blend weights along one axis of a tile that fade across the overlap with its neighbours."""
+    positions = np.arange(start, end) + 0.5
+    weights = np.ones(end - start, dtype=np.float32)
+
+    if start < core_start:
+        weights = np.minimum(weights, (positions - start) / (2 * overlap))
+    if end > core_end:
+        weights = np.minimum(weights, (end - positions) / (2 * overlap))
+    return weights
+
+def load_tile(tile_path, width, height):
+    """Memory-map a rendered tile, padding it in case the border rounded to a pixel less."""
+    tile = np.load(tile_path, mmap_mode='r')
+    if tile.shape[:2] != (height, width):
+        tile = np.pad(tile[:height, :width], ((0, max(0, height - tile.shape[0])), (0, max(0, width - tile.shape[1])), (0, 0)), mode='edge')
+    return tile
+
+def stitch_tiles(tiles, width, height, overlap, output_path, chunk_rows=64):
+    """Blend rendered tiles into a 16-bit PNG, writing a few rows at a time."""
+    loaded = [(load_tile(path, ex1 - ex0, ey1 - ey0), (ex0, ex1, ey0, ey1),
+               get_feather_weights(ex0, ex1, x0, x1, overlap), get_feather_weights(ey0, ey1, y0, y1, overlap))
+              for path, (ex0, ex1, ey0, ey1), (x0, x1, y0, y1) in tiles]
+
+    with PNGStreamWriter(output_path, width, height, 4, 16) as writer:
+        for c0 in range(0, height, chunk_rows):
+            c1 = min(c0 + chunk_rows, height)
+            color = np.zeros((c1 - c0, width, 4), dtype=np.float32)
+            weight = np.zeros((c1 - c0, width, 1), dtype=np.float32)
+
+            for tile, (ex0, ex1, ey0, ey1), weights_x, weights_y in loaded:
+                r0, r1 = max(c0, ey0), min(c1, ey1)
+                if r0 >= r1:
+                    continue
+
+                w = (weights_y[r0 - ey0:r1 - ey0, None] * weights_x[None, :])[..., None]
+                color[r0 - c0:r1 - c0, ex0:ex1] += tile[r0 - ey0:r1 - ey0] * w
+                weight[r0 - c0:r1 - c0, ex0:ex1] += w
+
+            writer.write_rows(np.round(color / np.maximum(weight, 1e-8)))
+
+class RENDER_OT_tiled_render(Operator):
+    bl_idname = "render.tiled_still"
+    bl_label = "Render Tiled"
+    bl_description = "Render the image as tiles in parallel background processes and stitch them into a 16-bit PNG"
+
+    _timer = None
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.render_palette_tiled_props
+        rd = scene.render
+
+        self.width = rd.resolution_x * rd.resolution_percentage // 100
+        self.height = rd.resolution_y * rd.resolution_percentage // 100
+        self.overlap = props.overlap
+        self.output_path = get_tiled_output_path(scene)
+
+        self.blend_path = save_temp_blend_copy("render_palette_tiles.blend")
+        threads = max(1, (os.cpu_count() or 1) // props.workers)
+
+        self.tiles = []
+        self.jobs = BackgroundJobs(props.workers)
+        for index, (expanded, core) in enumerate(get_tile_layout(self.width, self.height, props.tiles_x, props.tiles_y, self.overlap)):
+            tile_path = os.path.join(bpy.app.tempdir, f"render_palette_tile_{index}.npy")
+            self.tiles.append((tile_path, expanded, core))
+            self.jobs.add(index, get_background_command(self.blend_path, TILE_WORKER_SCRIPT,
+                                                        [*get_tile_border(expanded, self.width, self.height), tile_path[:-4]], threads))
+
+        self.stitch_thread = None
+        self.error = None
+
+        context.window_manager.progress_begin(0, len(self.tiles) + 1)
+        self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.jobs.cancel()
+            self.finish(context)
+            self.report({'WARNING'}, "Tiled render cancelled")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
 
+        if self.stitch_thread is None:
+            if self.jobs.update():
+                context.window_manager.progress_update(len(self.jobs.results))
+                return {'PASS_THROUGH'}
+
+            failed = [(key, log) for key, code, log in self.jobs.results if code != 0]
+            if failed:
+                self.finish(context)
+                self.report({'ERROR'}, f"Tile {failed[0][0] + 1} failed: {read_log_tail(failed[0][1])}")
+                return {'CANCELLED'}
+
+            self.stitch_thread = threading.Thread(target=self.stitch)
+            self.stitch_thread.start()
+            return {'PASS_THROUGH'}
+
+        if self.stitch_thread.is_alive():
+            return {'PASS_THROUGH'}
+
+        self.finish(context)
+        if self.error:
+            self.report({'ERROR'}, f"Error stitching tiles: {self.error}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Tiled render saved to {self.output_path}")
         return {'FINISHED'}
 
+    def stitch(self):
+        try:
+            stitch_tiles(self.tiles, self.width, self.height, self.overlap, self.output_path)
+        except Exception as e:
+            self.error = str(e)
+
+    def finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.window_manager.progress_end()
+
+        for tile_path, _expanded, _core in self.tiles:
+            for path in (tile_path, tile_path[:-4] + ".png"):
+                if os.path.isfile(path):
+                    os.remove(path)
+
+        if os.path.isfile(self.blend_path):
+            os.remove(self.blend_path)
+
+def get_tiled_output_path(scene):
+    output = bpy.path.abspath(scene.render.filepath)
+
+    if os.path.isdir(output) or not os.path.basename(output):
+        project_name = os.path.splitext(bpy.path.basename(bpy.data.filepath))[0] if bpy.data.is_saved else "Render"
+        output = os.path.join(output, f"{project_name}_tiled.png")
+    elif not output.lower().endswith(".png"):
+        output += ".png"
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    return output
+
+class RENDER_PG_tiled_props(PropertyGroup):
+    tiles_x: bpy.props.IntProperty(name="Tiles X", default=2, min=1, max=16)
+    tiles_y: bpy.props.IntProperty(name="Tiles Y", default=2, min=1, max=16)
+    overlap: bpy.props.IntProperty(
+        name="Overlap",
+        description="Pixels rendered beyond each tile edge and blended to hide seams, e.g. from denoising",
+        default=32,
+        min=1,
+        max=512,
+        subtype='PIXEL',
+    )
+    workers: bpy.props.IntProperty(
+        name="Processes",
+        description="Number of tiles rendered at the same time, the CPU threads are shared between them",
+        default=2,
+        min=1,
+        max=64,
+    )
+
+class RENDER_PT_tiled_render(Panel):
+    """Tiled Render Panel"""
+    bl_label = "Tiled Render"
+    bl_idname = "RENDER_PT_tiled_render"
+    bl_parent_id = "RENDER_PT_main_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Render Palette"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.render_type == 'IMAGE'
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.render_palette_tiled_props
+
+        row = layout.row(align=True)
+        row.label(text="Tiles:")
+        row.scale_x = 1.525
+        row.prop(props, "tiles_x", text="X")
+        row.prop(props, "tiles_y", text="Y")
+        layout.separator()
+
+        scaled_row(layout, "Overlap:", props, "overlap")
+        scaled_row(layout, "Processes:", props, "workers")
+        layout.separator()
+
+        layout.operator("render.tiled_still", icon="MESH_GRID")
+
 # ----------------------------------------------------------------------------
 
 class RENDER_PT_preset_panel(Panel):
@@ -1008,8 +2229,9 @@ class RENDER_PT_preset_panel(Panel):
             col.operator("renderpalette.move_preset", icon='TRIA_UP', text="").direction = 'UP'
             col.operator("renderpalette.move_preset", icon='TRIA_DOWN', text="").direction = 'DOWN'
             
-            row = layout.row()
+            row = layout.row(align=True)
             row.operator("renderpalette.apply_preset")
+            row.operator("renderpalette.benchmark_preset", icon='TIME', text="")
             
         else:
             layout.operator("renderpalette.initialize")
@@ -1025,6 +2247,10 @@ class RENDER_MT_preset_menu(Menu):
         layout.operator("renderpalette.save_preset", icon='FILE_TICK', text="Save Preset")
         layout.operator("renderpalette.export_preset", icon='EXPORT', text="Export Preset")
         layout.operator("renderpalette.import_preset", icon='IMPORT', text="Import Preset")
+        layout.operator("renderpalette.export_preset_bundle", icon='PACKAGE', text="Export Bundle")
+        layout.operator("renderpalette.import_preset_bundle", icon='UGLYPACKAGE', text="Import Bundle")
+        layout.operator("renderpalette.apply_preset", icon='SCENE_DATA', text="Apply to All Scenes").all_scenes = True
+        layout.operator("renderpalette.apply_preset_to_files", icon='FILE_BLEND', text="Apply to Files")
         layout.operator("renderpalette.show_preset_info", icon='QUESTION', text="Preset Info").index = context.scene.render_palette_presets_index
         layout.operator("renderpalette.open_preset_directory", icon='FILE_FOLDER', text="Open Preset Folder")
     
@@ -1090,26 +2316,34 @@ class RENDER_OT_add_preset(Operator):
     bl_description = "Add a new preset"
 
     name: StringProperty(name="Name", default="New Preset")
+    parent: StringProperty(name="Parent", description="Preset this preset inherits from, saving it then only stores the settings that differ")
 
     def execute(self, context):
         presets = context.scene.render_palette_presets
         preset = presets.add()
         self.update_preset_properties(preset, context.scene)
+        preset.parent = self.parent if self.parent != self.name else ""
+        # Names can repeat, e.g. after a bundle import, so the parent is also recorded by file
+        parent = presets.get(preset.parent) if preset.parent else None
+        preset.parent_file = parent.filepath if parent is not None else ""
         return {'FINISHED'}
     
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "name")
+        layout.prop_search(self, "parent", context.scene, "render_palette_presets", icon='PRESET')
+
     def update_preset_properties(self, preset, scene):
-        scene = context.scene
-        
         # Update preset properties based on the current scene
         preset.name = self.name
         preset.resolution_preset = scene.resolution_preset
         
         if scene.resolution_preset == 'Custom':
-            preset.custom_resolution_x = scene.custom_resolution_x
-            preset.custom_resolution_y = scene.custom_resolution_y
+            preset.custom_resolution_x = scene.render.resolution_x
+            preset.custom_resolution_y = scene.render.resolution_y
             
         preset.render_engine = scene.render.engine
         preset.device = scene.cycles.device
@@ -1133,6 +2367,8 @@ class RENDER_OT_add_preset(Operator):
             if scene.framerate_preset == 'CUSTOM':
                 preset.fps = scene.render.fps
         
+        preset.performance = json.dumps(capture_performance_settings(scene))
+        
         return {'FINISHED'}
     
 # ------------------------------------
@@ -1169,6 +2405,166 @@ class RENDER_OT_remove_preset(Operator):
     
 # ------------------------------------
 
+def load_preset_data(preset, data, scene):
+    """Fill a preset list entry from the parsed JSON of a preset file.
+
+    Raises KeyError, TypeError or ValueError when the data doesn't fit, the entry is then left unchanged.
+    """
+    fps_value = data.get("fps", 24.0)
+    values = {
+        "name": data["name"],
+        "render_type": data.get("render_type", "IMAGE"),
+        "frame_start": data.get("frame_start", 1),
+        "frame_end": data.get("frame_end", 250),
+        "framerate_preset": data.get("framerate_preset", "24"),
+        "fps": float(fps_value) if fps_value is not None else 24.0,
+        "resolution_preset": data["resolution_preset"],
+        "render_engine": data["render_engine"],
+    }
+
+    if data["resolution_preset"] == 'Custom':
+        values["custom_resolution_x"] = data.get("custom_resolution_x", 1920)
+        values["custom_resolution_y"] = data.get("custom_resolution_y", 1080)
+
+    if data["render_engine"] == 'CYCLES':
+        values["device"] = data.get("device", "CPU")
+        values["samples_preset"] = data["samples_preset"]
+        values["custom_samples"] = data.get("custom_samples", scene.cycles.samples)
+    else:
+        values["device"] = "CPU"
+        values["samples_preset"] = "PRESET"
+        values["custom_samples"] = scene.cycles.samples
+
+    values["look"] = data["look"]
+    values["view_transform"] = data.get("view_transform", "Filmic")
+    values["render_file_format"] = data["render_file_format"]
+    values["output"] = data.get("output", "")
+    values["performance"] = json.dumps(data.get("performance") or {})
+    values["benchmark"] = json.dumps(data["benchmark"]) if data.get("benchmark") else ""
+
+    # Enum values are only checked on assignment, so a failure part way through is rolled back
+    previous = {key: getattr(preset, key) for key in values}
+    try:
+        for key, value in values.items():
+            setattr(preset, key, value)
+    except (TypeError, ValueError):
+        for key, value in previous.items():
+            setattr(preset, key, value)
+        raise
+
+# Bump when the catalog layout changes, older catalogs are then rebuilt
+PRESET_CATALOG_VERSION = 1
+
+def get_preset_catalog_path(directory):
+    """Return the local catalog file of a preset directory, kept off the (possibly shared) preset drive."""
+    config_dir = bpy.utils.user_resource('CONFIG', path="render_palette", create=True)
+    key = hashlib.sha1(os.path.abspath(directory).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(config_dir, f"preset_catalog_{key}.json")
+
+def read_preset_catalog(catalog_path):
+    try:
+        with open(catalog_path, "r") as file:
+            catalog = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    if catalog.get("version") != PRESET_CATALOG_VERSION:
+        return {}
+    return catalog.get("presets", {})
+
+def write_preset_catalog(catalog_path, entries):
+    temp_path = catalog_path + ".tmp"
+    with open(temp_path, "w") as file:
+        json.dump({"version": PRESET_CATALOG_VERSION, "presets": entries}, file, separators=(",", ":"))
+    os.replace(temp_path, catalog_path)
+
+def scan_preset_directory(directory, catalog):
+    """Return the catalog entries of the directory, whether they differ from the given catalog and the
+    names of the files that could not be read.
+
+    Only files whose size or modification time changed are parsed again.
+    """
+    entries = {}
+    unreadable = []
+    changed = False
+
+    for entry in os.scandir(directory):
+        if not entry.name.endswith('.json') or not entry.is_file():
+            continue
+
+        stat = entry.stat()
+        cached = catalog.get(entry.name)
+        if cached and cached["size"] == stat.st_size and cached["mtime"] == stat.st_mtime_ns:
+            entries[entry.name] = cached
+            continue
+
+        try:
+            with open(entry.path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            unreadable.append(entry.name)
+            continue
+
+        entries[entry.name] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "data": data}
+        changed = True
+
+    return entries, changed or catalog.keys() != entries.keys(), unreadable
+
+def get_file_signature(signature):
+    """Return the signature of a preset file and its ancestors as stored on the list entry."""
+    return "|".join(f"{size}:{mtime}" for _path, size, mtime in signature)
+
+def sync_preset_collection(scene, directory, entries, keep_unsaved=False):
+    """Update the preset list in place to match the catalog entries, returns the names of invalid files."""
+    presets = scene.render_palette_presets
+    items = {preset.filepath: preset for preset in presets}
+    paths = {os.path.join(directory, filename): entry for filename, entry in entries.items()}
+    invalid = []
+
+    # Remove entries whose file is gone, walking backwards keeps the indices valid
+    for index in reversed(range(len(presets))):
+        filepath = presets[index].filepath
+        if filepath not in paths and (filepath or not keep_unsaved):
+            presets.remove(index)
+
+    for filepath, entry in paths.items():
+        # The catalog already holds the parsed files, so only changed ancestors are read again
+        if isinstance(entry["data"], dict):
+            preset_file_cache[filepath] = (entry["size"], entry["mtime"], entry["data"])
+
+        preset = items.get(filepath)
+        try:
+            data = read_preset_file(filepath)
+        except (OSError, ValueError):
+            invalid.append(os.path.basename(filepath))
+            continue
+
+        # A preset is reloaded when its file or any file it inherits from changed
+        signature = get_file_signature(resolved_preset_cache[filepath][0])
+        if preset is not None and preset.file_signature == signature:
+            continue
+
+        is_new = preset is None
+        if is_new:
+            preset = presets.add()
+
+        try:
+            load_preset_data(preset, data, scene)
+        except (KeyError, TypeError, ValueError):
+            invalid.append(os.path.basename(filepath))
+            if is_new:
+                presets.remove(len(presets) - 1)
+            continue
+
+        preset.parent = entry["data"].get("parent", "")
+        chain = resolved_preset_cache[filepath][0]
+        preset.parent_file = chain[1][0] if len(chain) > 1 else ""
+        preset.filepath = filepath
+        preset.file_signature = signature
+
+    scene.render_palette_presets_index = min(scene.render_palette_presets_index, max(0, len(presets) - 1))
+    return invalid
+
 class RENDER_OT_refresh_presets(Operator):
     bl_idname = "renderpalette.refresh_presets"
     bl_label = "Refresh Presets"
@@ -1182,56 +2578,148 @@ class RENDER_OT_refresh_presets(Operator):
             self.report({'WARNING'}, "Preset directory does not exist")
             return {'CANCELLED'}
 
-        preset_files = [f for f in os.listdir(directory) if f.endswith('.json')]
+        catalog_path = get_preset_catalog_path(directory)
+        entries, changed, unreadable = scan_preset_directory(directory, read_preset_catalog(catalog_path))
 
-        if not preset_files:
-            self.report({'WARNING'}, "No presets found in the directory")
+        if not entries:
+            if unreadable:
+                self.report({'WARNING'}, f"No valid presets found, could not read: {', '.join(unreadable)}")
+            else:
+                self.report({'WARNING'}, "No presets found in the directory")
             return {'CANCELLED'}
 
-        scene.render_palette_presets.clear()
+        if changed:
+            write_preset_catalog(catalog_path, entries)
 
-        for file in preset_files:
-            filepath = os.path.join(directory, file)
-            with open(filepath, "r") as json_file:
-                data = json.load(json_file)
+        invalid = unreadable + sync_preset_collection(scene, directory, entries)
 
-                preset = scene.render_palette_presets.add()
-                preset.name = data["name"]
-                preset.render_type = data.get("render_type", "IMAGE")
-                
-                preset.frame_start = data.get("frame_start", 1)
-                preset.frame_end = data.get("frame_end", 250)
-                preset.framerate_preset = data.get("framerate_preset", "24")
-                fps_value = data.get("fps", 24.0)
-                if fps_value is not None:
-                    preset.fps = float(fps_value)
-                else:
-                    preset.fps = 24.0
-                    
-                preset.resolution_preset = data["resolution_preset"]
-                preset.render_engine = data["render_engine"]
+        if invalid:
+            self.report({'WARNING'}, f"Presets reloaded, skipped invalid presets: {', '.join(invalid)}")
+        else:
+            self.report({'INFO'}, "Presets reloaded")
+        return {'FINISHED'}
+    
+# ------------------------------------
 
-                if preset.resolution_preset == 'Custom':
-                    preset.custom_resolution_x = data.get("custom_resolution_x", 1920)
-                    preset.custom_resolution_y = data.get("custom_resolution_y", 1080)
+class PresetDirectoryWatcher(threading.Thread):
+    """Polls the preset directory and queues the preset files that changed once the changes settle."""
 
-                if data["render_engine"] == 'CYCLES':
-                    preset.device = data.get("device", "CPU")
-                    preset.samples_preset = data["samples_preset"]
-                    preset.custom_samples = data.get("custom_samples", scene.cycles.samples)
-                else:
-                    preset.device = "CPU"
-                    preset.samples_preset = "PRESET"
-                    preset.custom_samples = scene.cycles.samples
+    def __init__(self, directory, interval, debounce):
+        super().__init__(daemon=True)
+        self.directory = directory
+        self.interval = interval
+        self.debounce = debounce
+        self.events = queue.Queue()
+        self.stop_event = threading.Event()
 
-                preset.look = data["look"]
-                preset.view_transform = data.get("view_transform", "Filmic")
-                preset.render_file_format = data["render_file_format"]
-                preset.output = data.get("output", "")
+    def get_listing(self):
+        try:
+            return {entry.name: (entry.stat().st_size, entry.stat().st_mtime_ns)
+                    for entry in os.scandir(self.directory) if entry.name.endswith('.json') and entry.is_file()}
+        except OSError:
+            return None
+
+    def run(self):
+        known = self.get_listing() or {}
+        latest = known
+        changed_at = 0.0
+
+        while not self.stop_event.wait(self.interval):
+            listing = self.get_listing()
+            if listing is None:
+                continue
+
+            # Restart the debounce period while files keep changing, e.g. during a large copy
+            if listing != latest:
+                latest = listing
+                changed_at = time.monotonic()
+            elif latest != known and time.monotonic() - changed_at >= self.debounce:
+                added = latest.keys() - known.keys()
+                removed = known.keys() - latest.keys()
+                modified = {name for name in latest.keys() & known.keys() if latest[name] != known[name]}
+                self.events.put((added, modified, removed))
+                known = latest
+
+    def stop(self):
+        self.stop_event.set()
+
+preset_watcher = None
+# Why the last directory change could not be applied, shown in the preferences
+preset_watcher_error = ""
+
+def process_preset_watcher_events():
+    """Timer on the main thread that applies the queued preset directory changes."""
+    global preset_watcher_error
+
+    if preset_watcher is None:
+        return None
+
+    changed = set()
+    while True:
+        try:
+            added, modified, removed = preset_watcher.events.get_nowait()
+        except queue.Empty:
+            break
+        changed.update(added, modified, removed)
+
+    if changed:
+        directory = preset_watcher.directory
+        # The whole folder is compared with the catalog, so presets saved while nothing watched are kept.
+        # Only files that changed since the catalog was written are read.
+        catalog_path = get_preset_catalog_path(directory)
+        try:
+            entries, catalog_changed, _unreadable = scan_preset_directory(directory, read_preset_catalog(catalog_path))
+        except OSError as e:
+            preset_watcher_error = f"Could not read the preset folder: {e}"
+            return 0.5
+
+        preset_watcher_error = ""
+        if catalog_changed:
+            try:
+                write_preset_catalog(catalog_path, entries)
+            except OSError as e:
+                preset_watcher_error = f"Could not write the preset catalog: {e}"
+
+        for scene in bpy.data.scenes:
+            if scene.show_render_preset_panel:
+                sync_preset_collection(scene, directory, entries, keep_unsaved=True)
+
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+
+    return 0.5
+
+def start_preset_watcher(preferences):
+    global preset_watcher
+
+    stop_preset_watcher()
+    if bpy.app.background or not preferences.watch_preset_directory or not os.path.isdir(preferences.preset_directory):
+        return
+
+    preset_watcher = PresetDirectoryWatcher(preferences.preset_directory, preferences.watch_interval,
+                                            preferences.watch_debounce)
+    preset_watcher.start()
+
+    if not bpy.app.timers.is_registered(process_preset_watcher_events):
+        bpy.app.timers.register(process_preset_watcher_events, first_interval=0.5, persistent=True)
+
+def stop_preset_watcher():
+    global preset_watcher
+
+    if preset_watcher is not None:
+        preset_watcher.stop()
+        preset_watcher = None
+
+def update_preset_watcher(self, context):
+    start_preset_watcher(self)
+
+def start_preset_watcher_on_load():
+    """Timer that starts watching the preset directory once the preferences are available."""
+    start_preset_watcher(bpy.context.preferences.addons[__name__].preferences)
+    return None
 
-        self.report({'INFO'}, "Presets reloaded")
-        return {'FINISHED'}
-    
 # ------------------------------------
 
 class RENDER_OT_save_preset(Operator):
@@ -1248,17 +2736,22 @@ class RENDER_OT_save_preset(Operator):
         scene = context.scene
         rd = context.scene.render
 
-        directory = context.preferences.addons[__name__].preferences.preset_directory
-
-        os.makedirs(directory, exist_ok=True)
-
         index = scene.render_palette_presets_index
         selected_preset = presets[index]
 
-        filepath = os.path.join(directory, f"{selected_preset.name}.json")
+        # A preset keeps its own file, numbered copies share the name of the preset they were copied from
+        if selected_preset.filepath:
+            filepath = selected_preset.filepath
+            directory = os.path.dirname(filepath)
+        else:
+            directory = context.preferences.addons[__name__].preferences.preset_directory
+            filepath = os.path.join(directory, f"{selected_preset.name}.json")
+
+        os.makedirs(directory, exist_ok=True)
 
         # Create a dictionary with the preset data
         data = {
+            "schema_version": PRESET_SCHEMA_VERSION,
             "name": selected_preset.name,
             "render_type": scene.render_type,
             "resolution_preset": scene.resolution_preset,
@@ -1286,10 +2779,26 @@ class RENDER_OT_save_preset(Operator):
             if scene.samples_preset == 'CUSTOM':
                 data["custom_samples"] = scene.cycles.samples
 
+        data["performance"] = capture_performance_settings(scene)
+
+        # Presets with a parent only store the settings they change
+        if selected_preset.parent:
+            parent_path = selected_preset.parent_file or os.path.join(directory, f"{selected_preset.parent}.json")
+            if os.path.dirname(os.path.abspath(parent_path)) != os.path.abspath(directory):
+                self.report({'ERROR'}, f"Parent preset '{selected_preset.parent}' must be saved in the preset folder")
+                return {'CANCELLED'}
+            try:
+                parent_data = read_preset_file(parent_path)
+            except (OSError, ValueError) as e:
+                self.report({'ERROR'}, f"Error reading parent preset '{selected_preset.parent}': {str(e)}")
+                return {'CANCELLED'}
+            data = get_preset_overrides(data, selected_preset.parent, os.path.basename(parent_path), parent_data)
+
         try:
             with open(filepath, "w") as file:
                 json.dump(data, file, indent=4)
 
+            selected_preset.filepath = filepath
             self.report({'INFO'}, f"Preset '{selected_preset.name}' saved to {directory}")
         except Exception as e:
             self.report({'ERROR'}, f"Error saving preset: {str(e)}")
@@ -1315,41 +2824,18 @@ class RENDER_OT_export_preset(Operator):
         index = scene.render_palette_presets_index
         preset = presets[index]
         
-        directory = context.preferences.addons[__name__].preferences.preset_directory
 
-        # Create a dictionary with the preset data
-        data = {
-            "name": preset.name,
-            "render_type": scene.render_type,
-            "resolution_preset": scene.resolution_preset,
-            "render_engine": scene.render.engine,
-            "look": scene.view_settings.look,
-            "view_transform": scene.view_settings.view_transform,
-            "render_file_format": scene.render_file_format,
-            "output": scene.render.filepath,
-        }
-        
-        if scene.render_type == 'ANIMATION':
-            data["frame_start"] = scene.frame_start
-            data["frame_end"] = scene.frame_end
-            data["framerate_preset"] = scene.framerate_preset
-            data["fps"] = scene.render.fps if scene.framerate_preset == 'CUSTOM' else None
-        
-        if scene.resolution_preset == 'Custom':
-            data["custom_resolution_x"] = scene.render.resolution_x
-            data["custom_resolution_y"] = scene.render.resolution_y
-        
-        if scene.render.engine == 'CYCLES':
-            data["samples_preset"] = scene.samples_preset
-            data["device"] = scene.cycles.device
-            if scene.samples_preset == 'CUSTOM':
-                data["custom_samples"] = scene.cycles.samples
+        try:
+            data = get_preset_data(preset)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Error reading preset '{preset.name}': {str(e)}")
+            return {'CANCELLED'}
         
         try:
             with open(self.filepath, "w") as file:
                 json.dump(data, file, indent=4)
             
-            self.report({'INFO'}, f"Preset '{preset.name}' exported to {directory}")
+            self.report({'INFO'}, f"Preset '{preset.name}' exported to {self.filepath}")
         except Exception as e:
             self.report({'ERROR'}, f"Error exporting preset: {str(e)}")
 
@@ -1367,115 +2853,758 @@ class RENDER_OT_export_preset(Operator):
     
 # ------------------------------------
 
+# Presets added to the list per timer tick while importing
+PRESET_IMPORT_BATCH = 50
+
+def parse_preset_files(file_paths, existing_paths, results, cancel):
+    """Parse preset files on a worker thread.
+
+    First puts the set of content hashes of the presets in existing_paths on the results queue, then
+    (file path, size, mtime, parsed JSON, error) for every file and None when done. The preset caches
+    are left alone, inheritance of the imported files is resolved on the main thread.
+    """
+    raw_files = {}
+
+    def read_raw(filepath):
+        if filepath not in raw_files:
+            with open(filepath, "r") as file:
+                data = json.load(file)
+            if not isinstance(data, dict):
+                raise ValueError("not a JSON object")
+            raw_files[filepath] = data
+        return raw_files[filepath]
+
+    existing = set()
+    for file_path in existing_paths:
+        if cancel.is_set():
+            break
+        try:
+            existing.add(get_resolved_preset_hash(file_path, read_raw))
+        except (OSError, ValueError):
+            continue
+    results.put(existing)
+
+    for file_path in file_paths:
+        if cancel.is_set():
+            break
+        try:
+            stat = os.stat(file_path)
+            with open(file_path, "r") as file:
+                data = json.load(file)
+            if not isinstance(data, dict):
+                raise ValueError("not a JSON object")
+        except (OSError, ValueError) as e:
+            results.put((file_path, None, None, None, str(e)))
+        else:
+            results.put((file_path, stat.st_size, stat.st_mtime_ns, data, None))
+    results.put(None)
+
 class RENDER_OT_import_preset(Operator):
     bl_idname = "renderpalette.import_preset"
     bl_label = "Import Preset"
-    bl_description = "Import a preset"
+    bl_description = "Import a preset file, or all preset files of a folder, into the preset list"
 
     filepath: bpy.props.StringProperty(subtype='FILE_PATH')
 
-    data = {
-        "render_type": "IMAGE",
-        "frame_start": 1,
-        "frame_end": 250,
-        "framerate_preset": "24",
-        "fps": 24,
-        "device": "CPU",
-        "samples_preset": "PRESET",
-        "view_transform": "Filmic",
-        "output": "",
-        "custom_samples": 128
-    }
+    _timer = None
 
-    def import_single_preset(self, context, file_path):
-        with open(file_path, "r") as file:
-            data = json.load(file)
-        
-        scene = context.scene
-        rd = context.scene.render
+    def execute(self, context):
+        if os.path.isdir(self.filepath):
+            file_paths = [os.path.join(self.filepath, filename) for filename in sorted(os.listdir(self.filepath)) if filename.endswith(".json")]
+        else:
+            file_paths = [self.filepath]
+
+        self.total = len(file_paths)
+        self.processed = 0
+        self.imported = 0
+        self.skipped = 0
+        self.rejected = []
+        self.existing = get_unsaved_preset_hashes(context.scene)
+        # Presets with a file are hashed on the worker, resolving them reads the file and its parents
+        existing_paths = [preset.filepath for preset in context.scene.render_palette_presets if preset.filepath]
+
+        # Files are parsed on a worker thread, only adding to the list happens here
+        self.results = queue.Queue()
+        self.cancel = threading.Event()
+        threading.Thread(target=parse_preset_files, args=(file_paths, existing_paths, self.results, self.cancel),
+                         daemon=True).start()
+
+        context.window_manager.progress_begin(0, max(1, self.total))
+        self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.cancel.set()
+            self.finish(context)
+            self.report({'WARNING'}, f"Import cancelled, {self.imported} preset(s) imported")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
 
-        # Extract the preset data from the dictionary
-        name = data.get("name", "Unnamed")
+        done = self.add_batch(context.scene)
+        context.window_manager.progress_update(self.processed)
+        context.workspace.status_text_set(f"Importing presets: {self.processed}/{self.total}")
+        if not done:
+            return {'PASS_THROUGH'}
 
-        render_type = data.get("render_type", self.data["render_type"])
-        frame_start = data.get("frame_start", self.data["frame_start"])
-        frame_end = data.get("frame_end", self.data["frame_end"])
-        framerate_preset = data.get("framerate_preset", self.data["framerate_preset"])
-        fps = data.get("fps", self.data["fps"])
+        self.finish(context)
 
-        resolution_preset = data.get("resolution_preset", "HD")
-        render_engine = data.get("render_engine", "BLENDER_EEVEE")
-        device = data.get("device", self.data["device"])
+        summary = f"{self.imported} preset(s) imported, {self.skipped} already existing skipped"
+        if self.rejected:
+            self.report({'WARNING'}, f"{summary}, {len(self.rejected)} rejected: {'; '.join(self.rejected)}")
+        else:
+            self.report({'INFO'}, summary)
+        return {'FINISHED'}
 
-        samples_preset = data.get("samples_preset", self.data["samples_preset"])
+    def add_batch(self, scene):
+        """Add parsed presets to the list, a batch at a time, returns True once every file is processed."""
+        presets = scene.render_palette_presets
 
-        look = data.get("look", "None")
-        valid_look_options = ['None', 'AgX - Punchy', 'AgX - Greyscale', 'AgX - Very High Contrast', 'AgX - High Contrast', 'AgX - Medium High Contrast', 'AgX - Base Contrast', 'AgX - Medium Low Contrast', 'AgX - Low Contrast', 'AgX - Very Low Contrast']
-        if look not in valid_look_options:
-            look = 'None'
+        for _ in range(PRESET_IMPORT_BATCH):
+            try:
+                result = self.results.get_nowait()
+            except queue.Empty:
+                return False
+            if result is None:
+                return True
+            if isinstance(result, set):
+                self.existing |= result
+                continue
+
+            file_path, size, mtime, raw_data, error = result
+            self.processed += 1
+
+            if error is None:
+                # The file was already parsed, only its parents are read here
+                preset_file_cache[file_path] = (size, mtime, raw_data)
+                try:
+                    data = read_preset_file(file_path)
+                except (OSError, ValueError) as e:
+                    error = str(e)
+
+            if error:
+                self.rejected.append(f"{os.path.basename(file_path)} ({error})")
+                continue
+
+            content_hash = get_preset_hash(data)
+            # Presets with the same content as an existing one are not added again
+            if content_hash in self.existing:
+                self.skipped += 1
+                continue
+
+            preset = presets.add()
+            try:
+                load_preset_data(preset, data, scene)
+            except (KeyError, TypeError, ValueError) as e:
+                presets.remove(len(presets) - 1)
+                self.rejected.append(f"{os.path.basename(file_path)} ({str(e)})")
+                continue
+
+            self.existing.add(content_hash)
+            self.imported += 1
 
-        view_transform = data.get("view_transform", "Standard")  # Set "Standard" as the default view_transform
+        return False
 
-        render_file_format = data.get("render_file_format", "PNG")
-        output = data.get("output", self.data["output"])
+    def finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.window_manager.progress_end()
+        context.workspace.status_text_set(None)
 
-        presets = scene.render_palette_presets
-        presets.add()
-        new_preset = presets[-1]
-        new_preset.name = name
-
-        if new_preset.render_type == 'ANIMATION':
-            new_preset.frame_start = frame_start
-            new_preset.frame_end = frame_end
-            new_preset.framerate_preset = framerate_preset
-            if framerate_preset == 'CUSTOM':
-                new_preset.fps = fps
-        
-        if scene.resolution_preset == 'Custom':
-            rd.resolution_x = data.get("custom_resolution_x", 1920)
-            rd.resolution_y = data.get("custom_resolution_y", 1080)
-        
-        if scene.render.engine == 'CYCLES':
-            scene.cycles.device = device
-            scene.samples_preset = samples_preset
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+# ------------------------------------
+
+BUNDLE_FORMAT = "render_palette_bundle"
+BUNDLE_VERSION = 1
+BUNDLE_EXTENSION = ".rpbundle"
+
+# Keys that describe a preset file rather than its settings and are left out of the content hash
+PRESET_HASH_IGNORED = {"schema_version", "benchmark"}
+
+def get_preset_hash(data):
+    """Return the content hash of validated preset data, equal for presets with the same settings."""
+    content = {key: value for key, value in data.items() if key not in PRESET_HASH_IGNORED}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+def get_unsaved_preset_hashes(scene):
+    """Return the content hashes of the list entries that have no preset file, without any file access."""
+    hashes = set()
+    for preset in scene.render_palette_presets:
+        if preset.filepath:
+            continue
+        try:
+            hashes.add(get_preset_hash(validate_preset_data(preset_to_dict(preset))))
+        except ValueError:
+            continue
+    return hashes
+
+def get_resolved_preset_hash(filepath, read_raw):
+    """Return the content hash of a preset file with the settings it inherits, read through read_raw."""
+    chain = get_preset_chain(filepath, read_raw)
+    return get_preset_hash(validate_preset_data(flatten_preset(chain, read_raw)))
+
+def get_catalog_preset_hashes(directory, entries):
+    """Return the content hashes of the presets in the catalog entries of a directory.
+
+    Inheritance is resolved from the catalog, so no preset file is read or even checked.
+    """
+    def read_raw(filepath):
+        entry = entries.get(os.path.basename(filepath))
+        if entry is None:
+            raise FileNotFoundError(filepath)
+        if not isinstance(entry["data"], dict):
+            raise ValueError("not a JSON object")
+        return entry["data"]
+
+    hashes = set()
+    for filename in entries:
+        try:
+            hashes.add(get_resolved_preset_hash(os.path.join(directory, filename), read_raw))
+        except ValueError:
+            continue
+    return hashes
+
+def get_unique_preset_path(directory, name):
+    """Return a preset file path for the name, numbered like Blender data when the file exists.
+
+    Raises ValueError for names that are not a plain file name, e.g. from a crafted bundle.
+    """
+    name = str(name).strip()
+    if not name or name in {".", ".."} or os.path.basename(name) != name or (os.altsep and os.altsep in name):
+        raise ValueError(f"invalid preset name '{name}'")
+
+    directory = os.path.realpath(directory)
+    filepath = os.path.join(directory, f"{name}.json")
+    if os.path.dirname(os.path.realpath(filepath)) != directory:
+        raise ValueError(f"invalid preset name '{name}'")
+
+    number = 1
+    while os.path.exists(filepath):
+        filepath = os.path.join(directory, f"{name}.{number:03d}.json")
+        number += 1
+    return filepath
+
+def write_preset_bundle(bundle_path, presets):
+    """Write validated preset data into one compressed bundle, presets with equal content are stored once."""
+    manifest = {"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION, "presets": []}
+    written = set()
+
+    temp_path = bundle_path + ".tmp"
+    with zipfile.ZipFile(temp_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for data in presets:
+            content_hash = get_preset_hash(data)
+            if content_hash in written:
+                continue
+            written.add(content_hash)
+
+            member = f"presets/{content_hash}.json"
+            bundle.writestr(member, json.dumps(data, indent=4))
+            manifest["presets"].append({"name": data["name"], "hash": content_hash, "path": member})
+
+        bundle.writestr("manifest.json", json.dumps(manifest, indent=4))
+    os.replace(temp_path, bundle_path)
+
+    return len(manifest["presets"])
+
+def read_preset_bundle(bundle_path, skip_hashes):
+    """Return the validated presets of a bundle whose hash is not in skip_hashes, and the names of
+    damaged entries. Skipped presets are not even decompressed."""
+    presets, damaged = [], []
+
+    with zipfile.ZipFile(bundle_path, "r") as bundle:
+        manifest = json.loads(bundle.read("manifest.json"))
+        if manifest.get("format") != BUNDLE_FORMAT or manifest.get("version", 0) > BUNDLE_VERSION:
+            raise ValueError("not a supported preset bundle")
+
+        for entry in manifest["presets"]:
+            if entry["hash"] in skip_hashes:
+                continue
+            try:
+                data = validate_preset_data(json.loads(bundle.read(entry["path"])))
+            except (KeyError, ValueError):
+                damaged.append(entry["name"])
+                continue
+            if get_preset_hash(data) != entry["hash"]:
+                damaged.append(entry["name"])
+                continue
+
+            skip_hashes.add(entry["hash"])
+            presets.append(data)
+
+    return presets, damaged
+
+class RENDER_OT_export_preset_bundle(Operator):
+    bl_idname = "renderpalette.export_preset_bundle"
+    bl_label = "Export Preset Bundle"
+    bl_description = "Export all presets into a single bundle file"
 
-            if samples_preset == 'CUSTOM':
-                custom_samples = data.get("custom_samples", self.data["custom_samples"])
-                scene.cycles.samples = custom_samples
+    filepath: StringProperty(subtype='FILE_PATH')
+    filter_glob: StringProperty(default="*" + BUNDLE_EXTENSION, options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.render_palette_presets
+
+    def execute(self, context):
+        filepath = bpy.path.ensure_ext(self.filepath, BUNDLE_EXTENSION)
 
-        scene.view_settings.look = look
-        scene.view_settings.view_transform = view_transform
-        scene.render_file_format = render_file_format
-        scene.render.filepath = output
+        presets = []
+        for preset in context.scene.render_palette_presets:
+            try:
+                presets.append(get_preset_data(preset))
+            except (OSError, ValueError) as e:
+                self.report({'WARNING'}, f"Skipped '{preset.name}': {str(e)}")
 
-        self.report({'INFO'}, f"Preset '{new_preset.name}' imported")
+        try:
+            count = write_preset_bundle(filepath, presets)
+        except OSError as e:
+            self.report({'ERROR'}, f"Error exporting preset bundle: {str(e)}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"{count} preset(s) exported to {filepath}")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        self.filepath = bpy.path.abspath("//") + "presets" + BUNDLE_EXTENSION
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
 
-    def import_multiple_presets(self, context, folder_path):
-        preset_files = [os.path.join(folder_path, filename) for filename in os.listdir(folder_path) if filename.endswith(".json")]
-        for file_path in preset_files:
-            self.import_single_preset(context, file_path)
+class RENDER_OT_import_preset_bundle(Operator):
+    bl_idname = "renderpalette.import_preset_bundle"
+    bl_label = "Import Preset Bundle"
+    bl_description = "Import the presets of a bundle file into the preset folder, skipping presets that already exist"
 
-        self.report({'INFO'}, f"All presets from '{folder_path}' imported")
+    filepath: StringProperty(subtype='FILE_PATH')
+    filter_glob: StringProperty(default="*" + BUNDLE_EXTENSION, options={'HIDDEN'})
 
     def execute(self, context):
-        if os.path.isdir(self.filepath):
-            self.import_multiple_presets(context, self.filepath)
+        scene = context.scene
+        directory = context.preferences.addons[__name__].preferences.preset_directory
+
+        if not os.path.isdir(directory):
+            self.report({'WARNING'}, "Preset directory does not exist")
+            return {'CANCELLED'}
+
+        # Duplicates are looked for in the preset folder, which is where the bundle is written
+        catalog_path = get_preset_catalog_path(directory)
+        try:
+            entries, changed, _unreadable = scan_preset_directory(directory, read_preset_catalog(catalog_path))
+            if changed:
+                write_preset_catalog(catalog_path, entries)
+        except OSError as e:
+            self.report({'ERROR'}, f"Error reading the preset folder: {str(e)}")
+            return {'CANCELLED'}
+
+        try:
+            presets, damaged = read_preset_bundle(self.filepath, get_catalog_preset_hashes(directory, entries))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            self.report({'ERROR'}, f"Error reading preset bundle: {str(e)}")
+            return {'CANCELLED'}
+
+        filenames = []
+        for data in presets:
+            try:
+                filepath = get_unique_preset_path(directory, data["name"])
+            except ValueError as e:
+                damaged.append(str(e))
+                continue
+
+            try:
+                with open(filepath, "w") as file:
+                    json.dump(data, file, indent=4)
+            except OSError as e:
+                write_error = f"Error writing preset '{data['name']}': {str(e)}"
+                if os.path.isfile(filepath):
+                    os.remove(filepath)
+                break
+            filenames.append(os.path.basename(filepath))
         else:
-            self.import_single_preset(context, self.filepath)
+            write_error = None
+
+        # One catalog update and list sync for the whole bundle
+        if filenames:
+            try:
+                entries, _changed, _unreadable = scan_preset_directory(directory, entries)
+            except OSError as e:
+                self.report({'WARNING'}, f"Could not read the preset folder: {str(e)}")
+            else:
+                try:
+                    write_preset_catalog(catalog_path, entries)
+                except OSError as e:
+                    self.report({'WARNING'}, f"Could not write the preset catalog: {str(e)}")
+                sync_preset_collection(scene, directory, entries, keep_unsaved=True)
 
+        if write_error:
+            self.report({'ERROR'}, f"{write_error}, {len(filenames)} preset(s) imported before the error")
+            return {'CANCELLED'}
+
+        if damaged:
+            self.report({'WARNING'}, f"{len(filenames)} preset(s) imported, damaged entries skipped: {', '.join(damaged)}")
+        else:
+            self.report({'INFO'}, f"{len(filenames)} preset(s) imported, the others already exist")
         return {'FINISHED'}
 
     def invoke(self, context, event):
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
-    
+
 # ------------------------------------
 
+# Values used for settings a preset file leaves out
+PRESET_DEFAULTS = {
+    "render_type": "IMAGE",
+    "frame_start": 1,
+    "frame_end": 250,
+    "framerate_preset": "24",
+    "fps": 24,
+    "device": "CPU",
+    "samples_preset": "LOW",
+    "custom_samples": 64,
+    "look": "None",
+    "view_transform": "Filmic",
+    "render_file_format": "PNG",
+    "output": "",
+    "custom_resolution_x": 1920,
+    "custom_resolution_y": 1080,
+}
+
+# Version 2 added the performance settings
+PRESET_SCHEMA_VERSION = 2
+
+# Settings that decide render time: (preset key, owner, property, value type)
+PERFORMANCE_SETTINGS = [
+    ("use_adaptive_sampling", "cycles", "use_adaptive_sampling", bool),
+    ("adaptive_threshold", "cycles", "adaptive_threshold", float),
+    ("time_limit", "cycles", "time_limit", float),
+    ("max_bounces", "cycles", "max_bounces", int),
+    ("diffuse_bounces", "cycles", "diffuse_bounces", int),
+    ("glossy_bounces", "cycles", "glossy_bounces", int),
+    ("transmission_bounces", "cycles", "transmission_bounces", int),
+    ("volume_bounces", "cycles", "volume_bounces", int),
+    ("transparent_max_bounces", "cycles", "transparent_max_bounces", int),
+    ("use_denoising", "cycles", "use_denoising", bool),
+    ("denoiser", "cycles", "denoiser", str),
+    ("use_auto_tile", "cycles", "use_auto_tile", bool),
+    ("tile_size", "cycles", "tile_size", int),
+    ("texture_limit_render", "cycles", "texture_limit_render", str),
+    ("use_persistent_data", "render", "use_persistent_data", bool),
+    ("threads_mode", "render", "threads_mode", str),
+    ("threads", "render", "threads", int),
+    ("use_simplify", "render", "use_simplify", bool),
+    ("simplify_subdivision_render", "render", "simplify_subdivision_render", int),
+    ("simplify_child_particles_render", "render", "simplify_child_particles_render", float),
+]
+PERFORMANCE_TYPES = {key: value_type for key, _owner, _attr, value_type in PERFORMANCE_SETTINGS}
+
+def get_performance_owner(scene, owner):
+    return scene.cycles if owner == "cycles" else scene.render
+
+def capture_performance_settings(scene):
+    """Return the performance settings of a scene, Cycles settings only when Cycles is the engine."""
+    settings = {}
+    for key, owner, attr, _value_type in PERFORMANCE_SETTINGS:
+        if owner == "cycles" and scene.render.engine != 'CYCLES':
+            continue
+        owner_struct = get_performance_owner(scene, owner)
+        # Some settings only exist in newer Blender versions
+        if hasattr(owner_struct, attr):
+            settings[key] = getattr(owner_struct, attr)
+    return settings
+
+# Parsed preset files by path: (size, mtime, data)
+preset_file_cache = {}
+
+# Presets flattened with everything they inherit, by path: (signature, data)
+# The signature holds (path, size, mtime) of the file and each of its ancestors
+resolved_preset_cache = {}
+
+def validate_performance_settings(settings):
+    """Return the known performance settings with their values checked, unset values are left out."""
+    performance = {}
+    for key, value in settings.items():
+        value_type = PERFORMANCE_TYPES.get(key)
+        if value_type is None or value is None:
+            continue
+        # JSON has no separate float type, so whole numbers are accepted for float settings
+        if value_type is float and type(value) is int:
+            value = float(value)
+        if type(value) is not value_type:
+            raise ValueError(f"invalid value for performance setting {key}")
+        performance[key] = value
+    return performance
+
+def validate_preset_data(data):
+    """Return a copy of parsed preset JSON with defaults filled in, raises ValueError if it is not a preset."""
+    if not isinstance(data, dict):
+        raise ValueError("not a JSON object")
+
+    missing = [key for key in ("name", "resolution_preset", "render_engine") if key not in data]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    preset = dict(PRESET_DEFAULTS)
+    preset.update((key, value) for key, value in data.items() if value is not None)
+
+    if not isinstance(preset.get("performance", {}), dict):
+        raise ValueError("invalid value for performance")
+    preset["performance"] = validate_performance_settings(preset.get("performance", {}))
+
+    for key, convert in (("frame_start", int), ("frame_end", int), ("fps", float), ("custom_samples", int),
+                         ("custom_resolution_x", int), ("custom_resolution_y", int)):
+        try:
+            preset[key] = convert(preset[key])
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid value for {key}")
+
+    return preset
+
+def read_raw_preset_file(filepath):
+    """Return the parsed JSON of a preset file, parsing it again only when the file changed."""
+    stat = os.stat(filepath)
+    cached = preset_file_cache.get(filepath)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+
+    with open(filepath, "r") as file:
+        data = json.load(file)
+    if not isinstance(data, dict):
+        raise ValueError("not a JSON object")
+
+    preset_file_cache[filepath] = (stat.st_size, stat.st_mtime_ns, data)
+    return data
+
+def get_preset_chain(filepath, read_raw=read_raw_preset_file):
+    """Return the paths of a preset file and the presets it inherits from, the file itself first.
+
+    Parents are looked up in the folder of the preset, by the file name stored with the preset, or
+    by name for presets saved before file names were stored.
+    """
+    chain = [filepath]
+    data = read_raw(filepath)
+
+    while data.get("parent"):
+        parent = data["parent"]
+        parent_file = os.path.basename(str(data.get("parent_file") or f"{parent}.json"))
+        parent_path = os.path.join(os.path.dirname(filepath), parent_file)
+        if parent_path in chain:
+            raise ValueError(f"preset inherits from itself through '{parent}'")
+
+        chain.append(parent_path)
+        try:
+            data = read_raw(parent_path)
+        except FileNotFoundError:
+            raise ValueError(f"parent preset '{parent}' not found")
+
+    return chain
+
+def is_signature_current(signature):
+    try:
+        for path, size, mtime in signature:
+            stat = os.stat(path)
+            if stat.st_size != size or stat.st_mtime_ns != mtime:
+                return False
+    except OSError:
+        return False
+    return True
+
+def flatten_preset(chain, read_raw=read_raw_preset_file):
+    """Merge the files of a preset chain, each preset overriding the settings of its ancestors."""
+    merged = {}
+    for path in reversed(chain):
+        data = read_raw(path)
+        overrides = data.get("performance") or {}
+        if not isinstance(overrides, dict):
+            raise ValueError("invalid value for performance")
+        # An unset value in a child keeps the value of its parent
+        performance = {**merged.get("performance", {}), **{key: value for key, value in overrides.items() if value is not None}}
+        merged.update((key, value) for key, value in data.items() if value is not None)
+        merged["performance"] = performance
+
+    # Benchmarks were measured for the preset itself and are not inherited
+    merged.pop("benchmark", None)
+    benchmark = read_raw(chain[0]).get("benchmark")
+    if benchmark:
+        merged["benchmark"] = benchmark
+
+    merged.pop("parent", None)
+    merged.pop("parent_file", None)
+    return merged
+
+def read_preset_file(filepath):
+    """Return the validated data of a preset file with the settings it inherits.
+
+    The result is resolved again only when the file or one of its ancestors changed.
+    """
+    cached = resolved_preset_cache.get(filepath)
+    if cached and is_signature_current(cached[0]):
+        return cached[1]
+
+    chain = get_preset_chain(filepath)
+    signature = []
+    for path in chain:
+        stat = os.stat(path)
+        signature.append((path, stat.st_size, stat.st_mtime_ns))
+    data = validate_preset_data(flatten_preset(chain))
+
+    resolved_preset_cache[filepath] = (tuple(signature), data)
+    return data
+
+def get_preset_overrides(data, parent, parent_file, parent_data):
+    """Return the preset data reduced to the settings that differ from its parent."""
+    overrides = {key: value for key, value in data.items()
+                 if key in ("schema_version", "name") or (value is not None and key != "performance" and parent_data.get(key) != value)}
+
+    performance = {key: value for key, value in data.get("performance", {}).items()
+                   if parent_data.get("performance", {}).get(key) != value}
+    if performance:
+        overrides["performance"] = performance
+
+    overrides["parent"] = parent
+    overrides["parent_file"] = parent_file
+    return overrides
+
+def preset_to_dict(preset):
+    """Return the data of a preset list entry in the preset file layout."""
+    data = {
+        "name": preset.name,
+        "render_type": preset.render_type,
+        "resolution_preset": preset.resolution_preset,
+        "render_engine": preset.render_engine,
+        "look": preset.look,
+        "view_transform": preset.view_transform,
+        "render_file_format": preset.render_file_format,
+        "output": preset.output,
+    }
+
+    if preset.render_type == 'ANIMATION':
+        data["frame_start"] = preset.frame_start
+        data["frame_end"] = preset.frame_end
+        data["framerate_preset"] = preset.framerate_preset
+        data["fps"] = preset.fps if preset.framerate_preset == 'CUSTOM' else None
+
+    if preset.resolution_preset == 'Custom':
+        data["custom_resolution_x"] = preset.custom_resolution_x
+        data["custom_resolution_y"] = preset.custom_resolution_y
+
+    if preset.render_engine == 'CYCLES':
+        data["device"] = preset.device
+        data["samples_preset"] = preset.samples_preset
+        if preset.samples_preset == 'CUSTOM':
+            data["custom_samples"] = preset.custom_samples
+
+    if preset.performance:
+        data["schema_version"] = PRESET_SCHEMA_VERSION
+        data["performance"] = json.loads(preset.performance)
+    if preset.benchmark:
+        data["benchmark"] = json.loads(preset.benchmark)
+
+    return data
+
+def get_preset_data(preset):
+    """Return the validated data of a preset, from its own file when it has one or else from the list entry.
+
+    Presets that were imported but not saved have no file, even when a saved preset has the same name.
+    """
+    if preset.filepath and os.path.isfile(preset.filepath):
+        return read_preset_file(preset.filepath)
+
+    return validate_preset_data(preset_to_dict(preset))
+
+def get_preset_targets(scene, data):
+    """Return the (owner, property, value) writes that apply a preset, including the values
+    the update callbacks of the preset enums would derive. Dependent properties come last."""
+    rd = scene.render
+    targets = []
+
+    if scene.render_type == 'ANIMATION':
+        targets += [(scene, 'frame_start', data["frame_start"]),
+                    (scene, 'frame_end', data["frame_end"]),
+                    (scene, 'framerate_preset', data["framerate_preset"])]
+
+        if data["framerate_preset"] == 'CUSTOM':
+            fps, fps_base = int(data["fps"]), 1.0
+        else:
+            fps, fps_base = FPS_PRESETS.get(data["framerate_preset"], (24, 1.0))
+        targets += [(rd, 'fps', fps), (rd, 'fps_base', fps_base)]
+
+    targets.append((scene, 'resolution_preset', data["resolution_preset"]))
+    if data["resolution_preset"] == 'Custom':
+        resolution = (data["custom_resolution_x"], data["custom_resolution_y"])
+    else:
+        resolution = RESOLUTION_PRESETS.get(data["resolution_preset"])
+    if resolution:
+        targets += [(rd, 'resolution_x', resolution[0]), (rd, 'resolution_y', resolution[1])]
+
+    targets.append((rd, 'engine', data["render_engine"]))
+
+    if data["render_engine"] == 'CYCLES':
+        targets.append((scene.cycles, 'device', data["device"]))
+        if data["samples_preset"] == 'CUSTOM':
+            targets += [(scene, 'samples_preset', 'CUSTOM'), (scene.cycles, 'samples', data["custom_samples"])]
+        elif data["samples_preset"] in SAMPLES_PRESETS:
+            targets += [(scene, 'samples_preset', data["samples_preset"]),
+                        (scene.cycles, 'samples', SAMPLES_PRESETS[data["samples_preset"]])]
+
+    targets.append((scene, 'render_file_format', data["render_file_format"]))
+    targets += get_file_format_settings(rd, data["render_file_format"])
+
+    # The available looks depend on the view transform
+    targets += [(scene.view_settings, 'view_transform', data["view_transform"]),
+                (scene.view_settings, 'look', data["look"])]
+
+    # Presets saved before schema version 2 have no performance settings and leave them alone
+    performance = data.get("performance", {})
+    for key, owner, attr, _value_type in PERFORMANCE_SETTINGS:
+        if key not in performance or (owner == "cycles" and data["render_engine"] != 'CYCLES'):
+            continue
+        owner_struct = get_performance_owner(scene, owner)
+        if hasattr(owner_struct, attr):
+            targets.append((owner_struct, attr, performance[key]))
+
+    return targets
+
+def is_same_value(current, value):
+    if isinstance(current, float) or isinstance(value, float):
+        return math.isclose(current, value, rel_tol=1e-6)
+    return current == value
+
+def apply_preset_data(scene, data):
+    """Apply a preset in one pass, writing only the settings that differ from the scene.
+
+    Returns the names of the changed settings and of the settings the scene rejected.
+    """
+    global preset_updates_suspended
+
+    changed, rejected = [], []
+    preset_updates_suspended = True
+    try:
+        for owner, attr, value in get_preset_targets(scene, data):
+            # Comparing is guarded too, a hand-edited preset can hold a string or null for a number
+            try:
+                if is_same_value(getattr(owner, attr), value):
+                    continue
+                setattr(owner, attr, value)
+            except (TypeError, ValueError):
+                rejected.append(attr)
+            else:
+                changed.append(attr)
+    finally:
+        preset_updates_suspended = False
+
+    return changed, rejected
+
 class RENDER_OT_apply_preset(Operator):
     bl_idname = "renderpalette.apply_preset"
     bl_label = "Apply Preset"
     bl_description = "Apply the selected preset"
     
+    all_scenes: bpy.props.BoolProperty(name="All Scenes", description="Apply the preset to every scene of the file", default=False)
+
     @classmethod
     def poll(cls, context):
         return context.scene.render_palette_presets
@@ -1484,70 +3613,437 @@ class RENDER_OT_apply_preset(Operator):
         index = context.scene.render_palette_presets_index
         scene = context.scene
         preset = context.scene.render_palette_presets[index]
-        preset_name = preset.name
 
-        directory = context.preferences.addons[__name__].preferences.preset_directory
 
-        filepath = os.path.join(directory, f"{preset_name}.json")
+        try:
+            data = get_preset_data(preset)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Error reading preset '{preset.name}': {str(e)}")
+            return {'CANCELLED'}
+
+        scenes = bpy.data.scenes if self.all_scenes else [scene]
+        changed, rejected = set(), set()
+        for target_scene in scenes:
+            scene_changed, scene_rejected = apply_preset_data(target_scene, data)
+            changed.update(scene_changed)
+            rejected.update(scene_rejected)
+
+        if rejected:
+            self.report({'WARNING'}, f"'{preset.name}' Preset applied, unsupported values for: {', '.join(sorted(rejected))}")
+        elif changed:
+            self.report({'INFO'}, f"'{preset.name}' Preset applied, changed: {', '.join(sorted(changed))}")
+        else:
+            self.report({'INFO'}, f"'{preset.name}' Preset already matches")
+        return {'FINISHED'}
+    
+# ------------------------------------
+
+BULK_APPLY_WORKER_SCRIPT = """
+import json
+import sys
+import addon_utils
+import bpy
+
+args = sys.argv[sys.argv.index("--") + 1:]
+module_name, data_path, result_path, all_scenes = args[0], args[1], args[2], args[3] == "1"
+
+def get_setting_path(scene, owner, attr):
+    path = "" if owner == scene else owner.path_from_id()
+    return f"{scene.name}: {path}.{attr}" if path else f"{scene.name}: {attr}"
+
+def get_value(value):
+    return value if isinstance(value, (bool, int, float, str)) else str(value)
+
+module = addon_utils.enable(module_name, default_set=False)
+with open(data_path) as file:
+    data = json.load(file)
+
+diff, rejected = [], []
+for scene in (bpy.data.scenes if all_scenes else [bpy.context.scene]):
+    targets = module.get_preset_targets(scene, data)
+    before = [get_value(getattr(owner, attr)) for owner, attr, _value in targets]
+    _changed, scene_rejected = module.apply_preset_data(scene, data)
+    rejected += [f"{scene.name}: {attr}" for attr in scene_rejected]
+
+    for (owner, attr, _value), old in zip(targets, before):
+        new = get_value(getattr(owner, attr))
+        if new != old:
+            diff.append({"setting": get_setting_path(scene, owner, attr), "old": old, "new": new})
+
+if diff:
+    bpy.ops.wm.save_mainfile()
+
+with open(result_path, "w") as file:
+    json.dump({"diff": diff, "rejected": rejected, "saved": bool(diff)}, file)
+"""
+
+def get_bulk_apply_files(directory, filenames, pattern):
+    """Return the .blend files picked in the file browser, or matched by the glob pattern when one is given."""
+    if pattern:
+        matches = glob.glob(os.path.join(directory, pattern), recursive=True)
+    else:
+        matches = [os.path.join(directory, filename) for filename in filenames]
+    return sorted({os.path.normpath(path) for path in matches if path.endswith(".blend") and os.path.isfile(path)})
+
+class RENDER_OT_apply_preset_to_files(Operator, ImportHelper):
+    bl_idname = "renderpalette.apply_preset_to_files"
+    bl_label = "Apply Preset to Files"
+    bl_description = "Apply the selected preset to .blend files in background processes and save them"
+
+    filter_glob: StringProperty(default="*.blend", options={'HIDDEN'})
+    files: CollectionProperty(type=bpy.types.OperatorFileListElement, options={'HIDDEN', 'SKIP_SAVE'})
+    directory: StringProperty(subtype='DIR_PATH')
+
+    pattern: StringProperty(
+        name="Pattern",
+        description="Glob pattern relative to the folder, e.g. **/*_lighting.blend, used instead of the selected files",
+        default="",
+    )
+    all_scenes: bpy.props.BoolProperty(name="All Scenes", description="Apply the preset to every scene of each file", default=False)
+    workers: IntProperty(
+        name="Processes",
+        description="Number of files processed at the same time, 0 uses one per CPU core",
+        default=0,
+        min=0,
+        max=64,
+    )
+
+    _timer = None
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.render_palette_presets
 
-        # Check if the file exists
-        if not os.path.isfile(filepath):
-            self.report({'WARNING'}, "Please save the current preset before applying it.")
+    def execute(self, context):
+        scene = context.scene
+        preset = scene.render_palette_presets[scene.render_palette_presets_index]
+
+        try:
+            data = get_preset_data(preset)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Error reading preset '{preset.name}': {str(e)}")
+            return {'CANCELLED'}
+
+        blend_files = get_bulk_apply_files(self.directory, [file.name for file in self.files], self.pattern)
+        # The open file would be overwritten by the next save from the UI
+        current = os.path.normpath(bpy.data.filepath) if bpy.data.filepath else None
+        if current in blend_files:
+            blend_files.remove(current)
+            self.report({'WARNING'}, f"Skipped the open file {bpy.path.basename(current)}, apply the preset to it directly")
+
+        if not blend_files:
+            self.report({'WARNING'}, "No .blend files to process")
+            return {'CANCELLED'}
+
+        self.preset_name = preset.name
+        self.blend_files = blend_files
+        self.data_path = os.path.join(bpy.app.tempdir, "render_palette_bulk_preset.json")
+        with open(self.data_path, "w") as file:
+            json.dump(data, file)
+
+        self.jobs = BackgroundJobs(min(len(blend_files), self.workers or os.cpu_count() or 1))
+        for index, blend_path in enumerate(blend_files):
+            result_path = os.path.join(bpy.app.tempdir, f"render_palette_bulk_{index}.json")
+            self.jobs.add(index, get_background_command(blend_path, BULK_APPLY_WORKER_SCRIPT,
+                                                        [__name__, self.data_path, result_path, int(self.all_scenes)]))
+
+        context.window_manager.progress_begin(0, len(blend_files))
+        self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.jobs.cancel()
+            log_path = self.finish(context)
+            self.report({'WARNING'}, f"Cancelled, files finished so far are listed in {log_path}")
             return {'CANCELLED'}
 
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if self.jobs.update():
+            context.window_manager.progress_update(len(self.jobs.results))
+            return {'PASS_THROUGH'}
+
+        log_path = self.finish(context)
+        failed = [entry for entry in self.log_entries if not entry["success"]]
+        if failed:
+            self.report({'ERROR'}, f"{len(failed)} of {len(self.blend_files)} file(s) failed, see {log_path}")
+            return {'CANCELLED'}
+
+        changed = sum(1 for entry in self.log_entries if entry["diff"])
+        self.report({'INFO'}, f"'{self.preset_name}' applied to {len(self.blend_files)} file(s), {changed} changed, log: {log_path}")
+        return {'FINISHED'}
+
+    def finish(self, context):
+        """Stop the timer, write the log of the processed files and return its path."""
+        context.window_manager.event_timer_remove(self._timer)
+        context.window_manager.progress_end()
+
+        self.log_entries = []
+        for index, code, log in sorted(self.jobs.results):
+            result_path = os.path.join(bpy.app.tempdir, f"render_palette_bulk_{index}.json")
+            entry = {"file": self.blend_files[index], "success": False, "saved": False, "diff": [], "rejected": []}
+            try:
+                with open(result_path, "r") as file:
+                    entry.update(json.load(file))
+                entry["success"] = code == 0
+                os.remove(result_path)
+            except (OSError, ValueError):
+                pass
+            if not entry["success"]:
+                entry["error"] = read_log_tail(log, 5)
+            self.log_entries.append(entry)
+
+        if os.path.isfile(self.data_path):
+            os.remove(self.data_path)
+
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_path = os.path.join(os.path.dirname(self.blend_files[0]), f"render_palette_apply_{timestamp}.json")
+        with open(log_path, "w") as file:
+            json.dump({"preset": self.preset_name, "files": self.log_entries}, file, indent=4)
+        return log_path
+
+# ------------------------------------
+
+BENCHMARK_WORKER_SCRIPT = """
+import json
+import sys
+import time
+import addon_utils
+import bpy
+
+args = sys.argv[sys.argv.index("--") + 1:]
+module_name, data_path, result_path, scale, camera_name, frame = args[0], args[1], args[2], int(args[3]), args[4], int(args[5])
+
+def get_peak_memory():
+    try:
+        import resource
+    except ImportError:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + \\
+                       [(name, ctypes.c_size_t) for name in ("PeakWorkingSetSize", "WorkingSetSize",
+                        "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage",
+                        "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+module = addon_utils.enable(module_name, default_set=False)
+scene = bpy.context.scene
+rd = scene.render
+
+with open(data_path) as file:
+    module.apply_preset_data(scene, json.load(file))
+
+if camera_name:
+    scene.camera = bpy.data.objects[camera_name]
+scene.frame_set(frame)
+
+full_pixels = (rd.resolution_x * rd.resolution_percentage // 100) * (rd.resolution_y * rd.resolution_percentage // 100)
+rd.resolution_percentage = max(1, rd.resolution_percentage * scale // 100)
+pixels = (rd.resolution_x * rd.resolution_percentage // 100) * (rd.resolution_y * rd.resolution_percentage // 100)
+
+start = time.perf_counter()
+bpy.ops.render.render()
+render_time = time.perf_counter() - start
+
+with open(result_path, "w") as file:
+    json.dump({"time": render_time, "pixels": pixels, "full_pixels": full_pixels, "peak_memory": get_peak_memory()}, file)
+"""
+
+def get_benchmark_presets(scene):
+    """Return (list index, preset) of the presets ticked for benchmarking, or of the active preset when none are."""
+    presets = [(index, preset) for index, preset in enumerate(scene.render_palette_presets) if preset.use_benchmark]
+    if not presets and scene.render_palette_presets:
+        index = scene.render_palette_presets_index
+        presets = [(index, scene.render_palette_presets[index])]
+    return presets
+
+def find_benchmarked_preset(presets, filepath, index, name):
+    """Return the list entry a benchmark was started for, or None when it is gone.
+
+    Names are not unique, so presets with a file are found by their file and the others by their list index.
+    """
+    if filepath:
+        return next((preset for preset in presets if preset.filepath == filepath), None)
+    if index < len(presets) and not presets[index].filepath and presets[index].name == name:
+        return presets[index]
+    return None
+
+def store_preset_benchmark(preset, benchmark):
+    """Store a benchmark result on the preset and in its own preset file when it has one."""
+    preset.benchmark = json.dumps(benchmark)
+
+    filepath = preset.filepath
+    if filepath and os.path.isfile(filepath):
         with open(filepath, "r") as file:
             data = json.load(file)
+        data["benchmark"] = benchmark
+
+        temp_path = filepath + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(data, file, indent=4)
+        os.replace(temp_path, filepath)
+
+def format_duration(seconds):
+    seconds = round(seconds)
+    if seconds < 60:
+        return f"{seconds} s"
+    if seconds < 3600:
+        return f"{seconds // 60} min {seconds % 60} s"
+    return f"{seconds // 3600} h {seconds % 3600 // 60} min"
+
+class RENDER_PG_benchmark_props(PropertyGroup):
+    scale: bpy.props.IntProperty(
+        name="Scale",
+        description="Resolution of the calibration frame, in percent of the preset resolution",
+        default=25,
+        min=1,
+        max=100,
+        subtype='PERCENTAGE',
+    )
+    camera: PointerProperty(
+        name="Camera",
+        description="Camera of the calibration frame, the scene camera when empty",
+        type=bpy.types.Object,
+        poll=lambda self, obj: obj.type == 'CAMERA',
+    )
+    frame: bpy.props.IntProperty(name="Frame", description="Frame rendered for the calibration", default=1)
 
-        # Extract the preset data from the dictionary
-        name = data["name"]
-        render_type = data.get("render_type", "IMAGE")
-        frame_start = data.get("frame_start", 1)
-        frame_end = data.get("frame_end", 250)
-        framerate_preset = data.get("framerate_preset", "24")
-        fps = data.get("fps", 24)
-        resolution_preset = data["resolution_preset"]
-        render_engine = data["render_engine"]
-        device = data.get("device", "CPU")
-        samples_preset = data.get("samples_preset", "LOW")
-        look = data.get("look", "None")
-        view_transform = data.get("view_transform", "Filmic")
-
-        # Set default value to 'Standard' if the provided value is not in the enum
-        if look not in {'None', 'AgX - Punchy', 'AgX - Greyscale', 'AgX - Very High Contrast', 'AgX - High Contrast',
-                        'AgX - Medium High Contrast', 'AgX - Base Contrast', 'AgX - Medium Low Contrast',
-                        'AgX - Low Contrast', 'AgX - Very Low Contrast'}:
-            bpy.context.scene.view_settings.view_transform = 'Standard'
-
-        # Apply the values
-        if scene.render_type == 'ANIMATION':
-            scene.frame_start = frame_start
-            scene.frame_end = frame_end
-            scene.framerate_preset = framerate_preset
-            if framerate_preset == 'CUSTOM':
-                scene.render.fps = fps
+class RENDER_OT_benchmark_preset(Operator):
+    bl_idname = "renderpalette.benchmark_preset"
+    bl_label = "Benchmark Presets"
+    bl_description = "Render a calibration frame under each ticked preset, or the selected one, in a background process and store its time and memory"
+
+    _timer = None
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.render_palette_presets
 
-        scene.resolution_preset = resolution_preset
-        scene.render.engine = render_engine
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
 
-        if resolution_preset == 'Custom':
-            rd = scene.render
-            rd.resolution_x = data.get("custom_resolution_x", 1920)
-            rd.resolution_y = data.get("custom_resolution_y", 1080)
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.render_palette_benchmark_props
 
-        if render_engine == 'CYCLES':
-            scene.cycles.device = device
-            scene.samples_preset = samples_preset
+        scaled_row(layout, "Scale:", props, "scale")
+        scaled_row(layout, "Camera:", props, "camera")
+        scaled_row(layout, "Frame:", props, "frame")
 
-            if samples_preset == 'CUSTOM':
-                custom_samples = data.get("custom_samples", 64)
-                scene.cycles.samples = custom_samples
+    def execute(self, context):
+        scene = context.scene
+        props = scene.render_palette_benchmark_props
+
+        self.presets = {}
+        self.temp_files = []
+        # Run one preset at a time so the timings don't compete for the CPU
+        self.jobs = BackgroundJobs(1)
+        blend_path = save_temp_blend_copy("render_palette_benchmark.blend")
+        self.temp_files.append(blend_path)
+
+        for index, preset in get_benchmark_presets(scene):
+            try:
+                data = get_preset_data(preset)
+            except (OSError, ValueError) as e:
+                self.report({'WARNING'}, f"Skipped '{preset.name}': {str(e)}")
+                continue
+
+            data_path = os.path.join(bpy.app.tempdir, f"render_palette_benchmark_{index}.json")
+            result_path = os.path.join(bpy.app.tempdir, f"render_palette_benchmark_{index}_result.json")
+            with open(data_path, "w") as file:
+                json.dump(data, file)
+            self.temp_files += [data_path, result_path]
+
+            self.presets[index] = (preset.name, preset.filepath, result_path)
+            self.jobs.add(index, get_background_command(blend_path, BENCHMARK_WORKER_SCRIPT,
+                                                        [__name__, data_path, result_path, props.scale,
+                                                         props.camera.name if props.camera else "", props.frame]))
+
+        if not self.presets:
+            self.finish(context)
+            return {'CANCELLED'}
 
-        scene.view_settings.look = look
-        scene.view_settings.view_transform = view_transform
+        self.scale = props.scale
+        context.window_manager.progress_begin(0, len(self.presets))
+        self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
 
-        self.report({'INFO'}, f"'{preset.name}' Preset applied")
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.jobs.cancel()
+            self.finish(context)
+            self.report({'WARNING'}, "Benchmark cancelled")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        if self.jobs.update():
+            context.window_manager.progress_update(len(self.jobs.results))
+            return {'PASS_THROUGH'}
+
+        failed = []
+        for index, code, log in self.jobs.results:
+            name, filepath, result_path = self.presets[index]
+            preset = find_benchmarked_preset(context.scene.render_palette_presets, filepath, index, name)
+
+            try:
+                with open(result_path, "r") as file:
+                    result = json.load(file)
+            except (OSError, ValueError):
+                failed.append(f"{name} ({read_log_tail(log)})")
+                continue
+
+            if preset is None:
+                continue
+
+            # Extrapolated linearly by pixel count, scene preparation is counted in full
+            benchmark = {
+                "time": round(result["time"], 3),
+                "peak_memory": result["peak_memory"],
+                "scale": self.scale,
+                "estimated_time": round(result["time"] * result["full_pixels"] / max(1, result["pixels"]), 3),
+                "date": datetime.datetime.now().isoformat(timespec='seconds'),
+                "blend_file": bpy.path.basename(bpy.data.filepath),
+            }
+            try:
+                store_preset_benchmark(preset, benchmark)
+            except (OSError, ValueError) as e:
+                failed.append(f"{name} ({str(e)})")
+
+        self.finish(context)
+
+        if failed:
+            self.report({'ERROR'}, f"Benchmark failed for: {', '.join(failed)}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Benchmarked {len(self.presets)} preset(s)")
         return {'FINISHED'}
-    
+
+    def finish(self, context):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            context.window_manager.progress_end()
+
+        for path in self.temp_files:
+            if os.path.isfile(path):
+                os.remove(path)
+
 # ------------------------------------
 
 class RENDER_OT_show_preset_info(Operator):
@@ -1572,6 +4068,8 @@ class RENDER_OT_show_preset_info(Operator):
         preset = context.scene.render_palette_presets[self.index]
 
         layout.label(text=f"Name: {preset.name}")
+        if preset.parent:
+            layout.label(text=f"Inherits From: {preset.parent}")
 
         layout.label(text=f"Render Type: {preset.render_type}")
 
@@ -1599,6 +4097,22 @@ class RENDER_OT_show_preset_info(Operator):
         layout.label(text=f"View Transform: {preset.view_transform}")
         layout.label(text=f"Render File Format: {preset.render_file_format}")
         layout.label(text=f"Output: {preset.output}")
+
+        performance = json.loads(preset.performance) if preset.performance else {}
+        if performance:
+            layout.separator()
+            layout.label(text="Performance:")
+            for key, value in performance.items():
+                layout.label(text=f"{key.replace('_', ' ').title()}: {value}")
+
+        benchmark = json.loads(preset.benchmark) if preset.benchmark else {}
+        if benchmark:
+            layout.separator()
+            layout.label(text="Benchmark:")
+            layout.label(text=f"Render Time: {format_duration(benchmark['time'])} at {benchmark['scale']}%")
+            layout.label(text=f"Full Frame Estimate: {format_duration(benchmark['estimated_time'])}")
+            layout.label(text=f"Peak Memory: {benchmark['peak_memory'] / 1024 ** 3:.2f} GB")
+            layout.label(text=f"Measured: {benchmark['date']} {benchmark['blend_file']}")
     
 # ------------------------------------
 
@@ -1621,6 +4135,13 @@ class RENDER_PG_preset(PropertyGroup):
     view_transform: StringProperty(name="View Transform", default="")
     render_file_format: StringProperty(name="Render File Format", default="")
     output: bpy.props.StringProperty(name="Output")
+    parent: StringProperty(name="Parent", description="Preset this preset inherits its settings from")
+    parent_file: StringProperty(name="Parent File", description="Preset file of the parent", subtype='FILE_PATH')
+    performance: StringProperty(name="Performance Settings", description="Performance settings of the preset as JSON")
+    benchmark: StringProperty(name="Benchmark", description="Last benchmark result of the preset as JSON")
+    use_benchmark: bpy.props.BoolProperty(name="Benchmark", description="Include the preset in the next benchmark", default=False)
+    filepath: StringProperty(name="File Path", subtype='FILE_PATH')
+    file_signature: StringProperty(name="File Signature")
     
 # ------------------------------------
 
@@ -1630,112 +4151,713 @@ class RENDER_UL_presets(UIList):
         
         row = layout.row(align=True)
         row.prop(item, "name", text="", emboss=False)
+        row.prop(item, "use_benchmark", text="", icon='TIME' if item.use_benchmark else 'BLANK1', emboss=False)
+
+# ----------------------------------------------------------------------------
+
+LUT_BLOCK_BEGIN = "  # BEGIN Render Palette LUTs"
+LUT_BLOCK_END = "  # END Render Palette LUTs"
+LUT_MANIFEST_NAME = "render_palette_luts.json"
+
+# Look entries appended by earlier versions, before the managed block
+LEGACY_LUT_LOOK = re.compile(r"\n[ \t]*\n  - !<Look>\n    name: .*\n    process_space: sRGB\n"
+                             r"    transform: !<FileTransform> \{src: (.+?), interpolation: tetrahedral\}\n")
+
+def get_colormanagement_dir():
+    return os.path.join(bpy.utils.resource_path('LOCAL'), 'datafiles', 'colormanagement')
+
+def get_file_hash(filepath):
+    sha = hashlib.sha256()
+    with open(filepath, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def read_lut_manifest(colormanagement_dir):
+    """Return the LUTs installed by the add-on as {filename: content hash}."""
+    try:
+        with open(os.path.join(colormanagement_dir, LUT_MANIFEST_NAME), "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def get_lut_look_name(filename):
+    return os.path.splitext(filename)[0].replace('_', ' ').title()
+
+def get_lut_looks_block(filenames):
+    looks = "".join(f"""  - !<Look>
+    name: {get_lut_look_name(filename)}
+    process_space: sRGB
+    transform: !<FileTransform> {{src: {filename}, interpolation: tetrahedral}}
+""" for filename in filenames)
+    return f"{LUT_BLOCK_BEGIN}\n{looks}{LUT_BLOCK_END}\n"
+
+def update_lut_config(config, filenames, managed):
+    """Return config.ocio text with exactly one Look per LUT in a single marked block at the end of the looks.
+
+    Looks that earlier versions appended for managed LUTs are removed.
+    """
+    begin = config.find(LUT_BLOCK_BEGIN)
+    if begin != -1:
+        end = config.find(LUT_BLOCK_END, begin)
+        config = config[:begin] + config[end + len(LUT_BLOCK_END) + 1 if end != -1 else len(config):]
+
+    config = LEGACY_LUT_LOOK.sub(lambda match: "" if match.group(1) in managed else match.group(0), config)
+
+    if not filenames:
+        return config
+    if not config.endswith("\n"):
+        config += "\n"
+    return config + get_lut_looks_block(filenames)
+
+def sync_luts(source_dir, colormanagement_dir):
+    """Install the .cube files of a folder into Blender, copying only new or changed files.
+
+    Returns the installed, copied and removed file names, and the files skipped because an
+    installed file already gives the same look name.
+    """
+    luts_dir = os.path.join(colormanagement_dir, 'luts')
+    config_file = os.path.join(colormanagement_dir, 'config.ocio')
+    manifest = read_lut_manifest(colormanagement_dir)
+
+    sources = {}
+    looks = {}
+    duplicates = []
+    for filename in sorted(os.listdir(source_dir)):
+        if not filename.lower().endswith('.cube'):
+            continue
+        # Two files with the same look name would give duplicate looks
+        look = get_lut_look_name(filename)
+        if look in looks:
+            duplicates.append(f"{filename} (same look as {looks[look]})")
+            continue
+        sources[filename] = get_file_hash(os.path.join(source_dir, filename))
+        looks[look] = filename
+
+    copied = []
+    for filename, content_hash in sources.items():
+        target = os.path.join(luts_dir, filename)
+        if manifest.get(filename) == content_hash and os.path.isfile(target):
+            continue
+        shutil.copyfile(os.path.join(source_dir, filename), target)
+        copied.append(filename)
+
+    # LUTs the add-on installed earlier whose source is gone
+    removed = [filename for filename in manifest if filename not in sources]
+    for filename in removed:
+        if os.path.isfile(os.path.join(luts_dir, filename)):
+            os.remove(os.path.join(luts_dir, filename))
+
+    with open(config_file, "r") as file:
+        config = file.read()
+    new_config = update_lut_config(config, list(sources), set(manifest) | set(sources))
+    if new_config != config:
+        with open(config_file + ".tmp", "w") as file:
+            file.write(new_config)
+        os.replace(config_file + ".tmp", config_file)
+
+    manifest_path = os.path.join(colormanagement_dir, LUT_MANIFEST_NAME)
+    with open(manifest_path + ".tmp", "w") as file:
+        json.dump(sources, file, indent=4)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    return list(sources), copied, removed, duplicates
+
+def backup_colormanagement(colormanagement_dir):
+    """Back up config.ocio and the bundled LUTs, only the first time so the backup stays the original."""
+    config_file = os.path.join(colormanagement_dir, 'config.ocio')
+    config_backup = config_file + '.backup'
+    if os.path.isfile(config_backup):
+        return False
+
+    backup_luts_dir = os.path.join(colormanagement_dir, 'backup')
+    os.makedirs(backup_luts_dir, exist_ok=True)
+    luts_dir = os.path.join(colormanagement_dir, 'luts')
+    for lut in os.listdir(luts_dir):
+        if os.path.isfile(os.path.join(luts_dir, lut)):
+            shutil.copy2(os.path.join(luts_dir, lut), os.path.join(backup_luts_dir, lut))
+
+    # The config backup is written last and marks the backup as complete
+    shutil.copy2(config_file, config_backup)
+    return True
+
+def is_lut_sync_installed(colormanagement_dir):
+    config_file = os.path.join(colormanagement_dir, 'config.ocio')
+    if os.path.isfile(os.path.join(colormanagement_dir, LUT_MANIFEST_NAME)):
+        return True
+    # Installed by an earlier version, which only appended to the config
+    return (os.path.isfile(config_file) and os.path.isfile(config_file + '.backup')
+            and os.path.getsize(config_file) != os.path.getsize(config_file + '.backup'))
+
+class RENDER_OT_lut_apply(Operator):
+    bl_idname = "object.apply_luts"
+    bl_label = "Apply LUTs"
+    bl_description = "Install the LUTs of the folder, updating changed ones and removing deleted ones"
+
+    def execute(self, context):
+        # Directory containing the LUT files
+        lut_dir = bpy.context.scene.lut_tool.lut_dir
+
+        blender_dir = bpy.utils.resource_path('LOCAL')
+        colormanagement_dir = get_colormanagement_dir()
+
+        if not os.path.isdir(lut_dir) or not any(f.lower().endswith('.cube') for f in os.listdir(lut_dir)):
+            self.report({'ERROR'}, f"No LUT files found in {lut_dir}. Please add LUT files and try again.")
+            return {'CANCELLED'}
+
+        try:
+            if backup_colormanagement(colormanagement_dir):
+                self.report({'INFO'}, f"Backup of config.ocio and LUTs created in {colormanagement_dir}")
+            installed, copied, removed, duplicates = sync_luts(lut_dir, colormanagement_dir)
+        except PermissionError:
+            if "WindowsApps" in blender_dir:
+                self.report({'ERROR'}, "Permission denied when trying to install LUTs. Blender installed from the Microsoft Store may have restricted permissions. Please install Blender from the official website and try again.")
+            else:
+                self.report({'ERROR'}, "Permission denied when trying to install LUTs. Please run Blender as an administrator and try again.")
+            return {'CANCELLED'}
+        except OSError as e:
+            self.report({'ERROR'}, f"Error installing LUTs: {str(e)}")
+            return {'CANCELLED'}
+
+        if duplicates:
+            self.report({'WARNING'}, f"Skipped LUTs whose look name is already taken: {', '.join(duplicates)}")
+
+        if not copied and not removed:
+            self.report({'INFO'}, f"All {len(installed)} LUTs from {lut_dir} are up to date.")
+        else:
+            self.report({'INFO'}, f"Installed {len(installed)} LUTs from {lut_dir} ({len(copied)} copied, {len(removed)} removed). Please restart Blender for the changes to take effect.")
+        return {'FINISHED'}
+    
+# ------------------------------------
+
+class RENDER_OT_lut_restore(Operator):
+    bl_idname = "object.restore_backup"
+    bl_label = "Restore Backup"
+
+    def execute(self, context):
+        # Get the paths
+        blender_dir = bpy.utils.resource_path('LOCAL')
+        luts_dir = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'luts')
+        config_file = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'config.ocio')
+        backup_luts_dir = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'backup')
+
+        # Backup directory for config.ocio
+        backup_config_dir = os.path.dirname(config_file)
+
+        # Remove the current LUT files
+        for lut in os.listdir(luts_dir):
+            if os.path.isfile(os.path.join(luts_dir, lut)):
+                try:
+                    os.remove(os.path.join(luts_dir, lut))                
+                except PermissionError:
+                    if "WindowsApps" in blender_dir:
+                        self.report({'ERROR'}, "Permission denied. Blender installed from the Microsoft Store may have restricted permissions. Please install Blender from the official website and try again.")
+                    else:
+                        self.report({'ERROR'}, "Permission denied. Please run Blender as an administrator and try again.")
+                    return {'CANCELLED'}
+
+        # Restore the LUT files from the backup
+        for lut in os.listdir(backup_luts_dir):
+            shutil.copy(os.path.join(backup_luts_dir, lut), os.path.join(luts_dir, lut))
+
+        # Restore the config.ocio file from the backup
+        config_backup_file = os.path.join(backup_config_dir, 'config.ocio.backup')
+        if os.path.isfile(config_backup_file):
+            shutil.copy(config_backup_file, config_file)
+
+        # The next install starts from the original files again
+        manifest_path = os.path.join(backup_config_dir, LUT_MANIFEST_NAME)
+        if os.path.isfile(manifest_path):
+            os.remove(manifest_path)
+
+        self.report({'INFO'}, "Backup restoration complete. Please restart Blender for the changes to take effect.")
+        return {'FINISHED'}
+    
+# ------------------------------------
+
+class CubeLUT:
+    """A 1D or 3D LUT, the table is indexed (r * size + g) * size + b for 3D LUTs."""
+
+    def __init__(self, table, size, is_3d, domain_min, domain_max, title=""):
+        self.table = table
+        self.size = size
+        self.is_3d = is_3d
+        self.domain_min = np.asarray(domain_min, dtype=np.float32)
+        self.domain_max = np.asarray(domain_max, dtype=np.float32)
+        self.title = title
+
+    @classmethod
+    def read(cls, filepath):
+        """Parse a .cube file."""
+        title = ""
+        size = 0
+        is_3d = False
+        domain_min = np.zeros(3, dtype=np.float32)
+        domain_max = np.ones(3, dtype=np.float32)
+
+        values = []
+        with open(filepath, "r") as file:
+            for line in file:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line[0].isdigit() or line[0] in "-+.":
+                    values.append(line)
+                    continue
+
+                keyword, _, argument = line.partition(" ")
+                if keyword == "TITLE":
+                    title = argument.strip().strip('"')
+                elif keyword in ("LUT_1D_SIZE", "LUT_3D_SIZE"):
+                    size = int(argument)
+                    is_3d = keyword == "LUT_3D_SIZE"
+                elif keyword == "DOMAIN_MIN":
+                    domain_min = np.array(argument.split(), dtype=np.float32)
+                elif keyword == "DOMAIN_MAX":
+                    domain_max = np.array(argument.split(), dtype=np.float32)
+                elif keyword in ("LUT_1D_INPUT_RANGE", "LUT_3D_INPUT_RANGE"):
+                    low, high = (float(value) for value in argument.split())
+                    domain_min = np.full(3, low, dtype=np.float32)
+                    domain_max = np.full(3, high, dtype=np.float32)
+
+        if size < 2:
+            raise ValueError("missing LUT_1D_SIZE or LUT_3D_SIZE")
+
+        table = np.array(" ".join(values).split(), dtype=np.float32)
+        entries = size ** 3 if is_3d else size
+        if table.size != entries * 3:
+            raise ValueError(f"expected {entries} entries, found {table.size // 3}")
+
+        # Red changes fastest in the file
+        if is_3d:
+            table = table.reshape(size, size, size, 3).transpose(2, 1, 0, 3)
+        return cls(np.ascontiguousarray(table.reshape(-1, 3)), size, is_3d, domain_min, domain_max, title)
+
+    @classmethod
+    def from_array(cls, array):
+        """Return a LUT stored by to_array, the table stays a view of the array so a memory map is not read."""
+        is_3d, size = bool(array[0, 0]), int(array[0, 1])
+        return cls(array[3:], size, is_3d, np.array(array[1]), np.array(array[2]))
+
+    def to_array(self):
+        """Return the LUT as one float32 array: a header row (is 3D, size), the domain minimum and maximum, then the table."""
+        header = np.array([[float(self.is_3d), self.size, 0.0], self.domain_min, self.domain_max], dtype=np.float32)
+        return np.concatenate([header, self.table.astype(np.float32)])
+
+    def apply(self, rgb, method='TETRAHEDRAL', chunk_size=1 << 18):
+        """Return the LUT applied to an (N, 3) float array of RGB values."""
+        result = np.empty_like(rgb, dtype=np.float32)
+        for start in range(0, len(rgb), chunk_size):
+            chunk = rgb[start:start + chunk_size]
+            position = (chunk - self.domain_min) / (self.domain_max - self.domain_min) * (self.size - 1)
+            position = np.clip(position, 0, self.size - 1)
+
+            if not self.is_3d:
+                result[start:start + chunk_size] = self._apply_1d(position)
+            elif method == 'TRILINEAR':
+                result[start:start + chunk_size] = self._apply_trilinear(position)
+            else:
+                result[start:start + chunk_size] = self._apply_tetrahedral(position)
+        return result
+
+    def _apply_1d(self, position):
+        grid = np.arange(self.size, dtype=np.float32)
+        return np.stack([np.interp(position[:, c], grid, self.table[:, c]) for c in range(3)], axis=1)
+
+    def _split(self, position):
+        base = np.minimum(position.astype(np.int32), self.size - 2)
+        return base, position - base
+
+    def _apply_trilinear(self, position):
+        base, fraction = self._split(position)
+        strides = np.array([self.size * self.size, self.size, 1])
+        index = base @ strides
+
+        result = np.zeros((len(position), 3), dtype=np.float32)
+        for corner in np.ndindex(2, 2, 2):
+            weight = np.prod(np.where(corner, fraction, 1.0 - fraction), axis=1, keepdims=True)
+            result += weight * self.table[index + strides @ corner]
+        return result
+
+    def _apply_tetrahedral(self, position):
+        base, fraction = self._split(position)
+        strides = np.array([self.size * self.size, self.size, 1])
+        index = base @ strides
+
+        # Walk from the base corner to the opposite one along the axes, largest fraction first
+        order = np.argsort(-fraction, axis=1)
+        rows = np.arange(len(position))[:, None]
+        f = fraction[rows, order]
+        step = strides[order]
+
+        index_1 = index + step[:, 0]
+        index_2 = index_1 + step[:, 1]
+        index_3 = index + strides.sum()
+
+        return ((1.0 - f[:, :1]) * self.table[index] + (f[:, :1] - f[:, 1:2]) * self.table[index_1]
+                + (f[:, 1:2] - f[:, 2:]) * self.table[index_2] + f[:, 2:] * self.table[index_3])
+
+def get_lut_cache_dir():
+    return bpy.utils.user_resource('CONFIG', path=os.path.join("render_palette", "lut_cache"), create=True)
+
+def evict_lut_cache(cache_dir, max_bytes):
+    """Remove the least recently used cached LUTs until the cache fits in max_bytes."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".tmp") or not entry.is_file():
+            continue
+        try:
+            stat = entry.stat()
+        except OSError:
+            # Evicted by another thread
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _mtime, size, _path in entries)
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            # Still mapped on Windows, it goes in a later eviction
+            continue
+        total -= size
+
+# Why the last LUT could not be written to the cache, shown with the cache size setting
+lut_cache_error = ""
+
+def get_lut_key(filepath):
+    """Return a key that changes whenever the LUT file is moved or edited."""
+    stat = os.stat(filepath)
+    return hashlib.sha1(f"{os.path.abspath(filepath)}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8")).hexdigest()
+
+def load_lut(filepath, max_cache_bytes=1024 * 1024 * 1024, cache_dir=None):
+    """Return the LUT of a .cube file, memory-mapped from the binary cache when the file was read before.
+
+    Cache entries are keyed by path, size and modification time, so edited LUTs are parsed again.
+    Pass cache_dir when calling from a worker thread, which must not use bpy.
+    """
+    global lut_cache_error
+
+    cache_dir = cache_dir or get_lut_cache_dir()
+    cache_path = os.path.join(cache_dir, f"{get_lut_key(filepath)}.npy")
+
+    if os.path.isfile(cache_path):
+        try:
+            lut = CubeLUT.from_array(np.load(cache_path, mmap_mode='r'))
+            # The modification time orders the entries for eviction
+            os.utime(cache_path)
+            return lut
+        except (OSError, ValueError, IndexError):
+            pass
+
+    lut = CubeLUT.read(filepath)
+    try:
+        with open(cache_path + ".tmp", "wb") as file:
+            np.save(file, lut.to_array())
+        os.replace(cache_path + ".tmp", cache_path)
+        evict_lut_cache(cache_dir, max_cache_bytes)
+    except OSError as e:
+        # The LUT still works, only the next load parses the file again
+        lut_cache_error = f"Could not cache {os.path.basename(filepath)}: {e}"
+    return lut
+
+def get_lut_cache_bytes(context):
+    return context.preferences.addons[__name__].preferences.lut_cache_size * 1024 * 1024
+
+LUT_PREVIEW_IMAGE = "LUT Preview"
+
+def get_lut_files(lut_dir):
+    try:
+        return sorted(f for f in os.listdir(lut_dir) if f.lower().endswith('.cube'))
+    except OSError:
+        return []
+
+# Blender needs the enum item strings to stay referenced, the items are kept per LUT directory so
+# scenes with different directories don't free each other's items
+lut_file_items = {}
+
+def get_lut_file_items(self, context):
+    lut_dir = bpy.path.abspath(self.lut_dir)
+    items = [(filename, get_lut_look_name(filename), os.path.join(lut_dir, filename),
+              get_lut_sheet_icon(filename), index)
+             for index, filename in enumerate(get_lut_files(lut_dir))]
+    # Unchanged items keep the strings Blender may still point to
+    if lut_file_items.get(lut_dir) != items:
+        lut_file_items[lut_dir] = items
+    return lut_file_items[lut_dir]
+
+def get_render_pixels(scene, max_size):
+    """Return the Render Result as 8-bit RGBA, top row first, downsampled to max_size when set."""
+    tga_path = os.path.join(bpy.app.tempdir, "render_palette_lut_preview.tga")
+    save_render_result(scene, tga_path, 'TARGA_RAW')
+    try:
+        pixels = read_targa(tga_path)
+        pixels = downsample(pixels, max_size) if max_size else np.array(pixels)
+    finally:
+        os.remove(tga_path)
+
+    height, width, channels = pixels.shape
+    rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+    if channels >= 3:
+        rgba[..., :channels] = pixels[..., get_rgb_order(channels)]
+    else:
+        rgba[..., :3] = pixels[..., :1]
+    return rgba
+
+def apply_lut_to_pixels(lut, pixels, method):
+    """Return 8-bit RGBA pixels with the LUT applied, as RGBA floats."""
+    height, width = pixels.shape[:2]
+    result = pixels.reshape(-1, 4) / np.float32(255.0)
+    result[:, :3] = np.clip(lut.apply(result[:, :3], method), 0.0, 1.0)
+    return result.reshape(height, width, 4)
+
+def show_image(context, name, pixels):
+    """Put RGBA float pixels, top row first, into an image and show it in an open Image Editor.
+
+    Returns False when no Image Editor is open.
+    """
+    height, width = pixels.shape[:2]
+    image = bpy.data.images.get(name)
+    if image is None or tuple(image.size) != (width, height):
+        if image is not None:
+            bpy.data.images.remove(image)
+        image = bpy.data.images.new(name, width, height, alpha=True)
+    # The pixels already are display values, so they are shown as they are
+    image.colorspace_settings.is_data = True
+    image.pixels.foreach_set(pixels[::-1].ravel())
+    image.update()
+
+    for area in context.screen.areas:
+        if area.type == 'IMAGE_EDITOR':
+            area.spaces.active.image = image
+            area.tag_redraw()
+            return True
+    return False
+
+class RENDER_OT_lut_preview(Operator):
+    bl_idname = "render_palette.lut_preview"
+    bl_label = "Preview LUT"
+    bl_description = "Apply the LUT to the last render and show it in an Image Editor, without installing it"
+
+    def execute(self, context):
+        scene = context.scene
+        lut_tool = scene.lut_tool
+        filepath = os.path.join(bpy.path.abspath(lut_tool.lut_dir), lut_tool.preview_lut)
+
+        try:
+            lut = load_lut(filepath, get_lut_cache_bytes(context))
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Error reading {lut_tool.preview_lut}: {str(e)}")
+            return {'CANCELLED'}
+
+        try:
+            pixels = get_render_pixels(scene, lut_tool.preview_size)
+        except (KeyError, RuntimeError):
+            self.report({'ERROR'}, "No render to preview, render an image first")
+            return {'CANCELLED'}
 
-# ----------------------------------------------------------------------------
+        if not show_image(context, LUT_PREVIEW_IMAGE, apply_lut_to_pixels(lut, pixels, lut_tool.preview_interpolation)):
+            self.report({'INFO'}, f"Open the '{LUT_PREVIEW_IMAGE}' image in an Image Editor to see the preview")
 
-class RENDER_OT_lut_apply(Operator):
-    bl_idname = "object.apply_luts"
-    bl_label = "Apply LUTs"
+        return {'FINISHED'}
 
-    def execute(self, context):
-        # Directory containing the LUT files
-        lut_dir = bpy.context.scene.lut_tool.lut_dir
+# ------------------------------------
 
-        # Get the paths
-        blender_dir = bpy.utils.resource_path('LOCAL')
-        luts_dir = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'luts')
-        config_file = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'config.ocio')
-        backup_luts_dir = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'backup')
+# 5x7 glyphs for the contact sheet labels, one hex byte per row with the leftmost pixel in bit 4
+FONT_5X7 = {
+    "A": "0E11111F111111", "B": "1E11111E11111E", "C": "0E11101010110E",
+    "D": "1E11111111111E", "E": "1F10101E10101F", "F": "1F10101E101010", "G": "0E11101711110F",
+    "H": "1111111F111111", "I": "0E04040404040E", "J": "0702020202120C", "K": "11121418141211",
+    "L": "1010101010101F", "M": "111B1515111111", "N": "11111915131111", "O": "0E11111111110E",
+    "P": "1E11111E101010", "Q": "0E11111115120D", "R": "1E11111E141211", "S": "0F10100E01011E",
+    "T": "1F040404040404", "U": "1111111111110E", "V": "11111111110A04", "W": "1111111515150A",
+    "X": "11110A040A1111", "Y": "11110A04040404", "Z": "1F01020408101F",
+    "0": "0E11131519110E", "1": "040C040404040E", "2": "0E11010204081F", "3": "1F02040201110E",
+    "4": "02060A121F0202", "5": "1F101E0101110E", "6": "0608101E11110E", "7": "1F010204080808",
+    "8": "0E11110E11110E", "9": "0E11110F01020C", "-": "0000001F000000", "_": "0000000000001F",
+    ".": "00000000000C0C", "(": "02040808080402", ")": "08040202020408", " ": "00000000000000",
+    "?": "0E110102040004",
+}
 
-        backup_config_dir = os.path.dirname(config_file)
+def draw_text(pixels, text, x, y, scale=2, color=(1.0, 1.0, 1.0, 1.0)):
+    """Draw text with the 5x7 font into RGBA float pixels, top left corner at (x, y)."""
+    for index, char in enumerate(text.upper()):
+        rows = bytes.fromhex(FONT_5X7.get(char, FONT_5X7["?"]))
+        glyph = (np.array(list(rows), dtype=np.uint8)[:, None] >> np.arange(4, -1, -1)) & 1
+        mask = np.kron(glyph, np.ones((scale, scale), dtype=np.uint8)).astype(bool)
+
+        left = x + index * 6 * scale
+        region = pixels[y:y + mask.shape[0], left:left + mask.shape[1]]
+        region[mask[:region.shape[0], :region.shape[1]]] = color
+
+LUT_SHEET_IMAGE = "LUT Contact Sheet"
+LUT_SHEET_SIZE = 256
+
+# Per-LUT thumbnails of the last contact sheet, by LUT file name
+lut_sheet_previews = None
+
+def get_lut_sheet_icon(filename):
+    if lut_sheet_previews is None or filename not in lut_sheet_previews:
+        return 0
+    return lut_sheet_previews[filename].icon_id
+
+def get_lut_sheet_dir():
+    return bpy.utils.user_resource('CONFIG', path=os.path.join("render_palette", "lut_sheet"), create=True)
+
+def make_lut_thumbnail(lut_path, pixels, method, cache_base, max_cache_bytes, lut_cache_dir):
+    """Apply a LUT to the downsampled render and cache the result as .npy for the sheet and .png for
+    the previews. Runs on a worker thread."""
+    lut = load_lut(lut_path, max_cache_bytes, lut_cache_dir)
+    result = np.round(apply_lut_to_pixels(lut, pixels, method) * 255.0).astype(np.uint8)
+
+    with PNGStreamWriter(cache_base + ".png.tmp", result.shape[1], result.shape[0], 4) as writer:
+        writer.write_rows(result)
+    os.replace(cache_base + ".png.tmp", cache_base + ".png")
+
+    with open(cache_base + ".npy.tmp", "wb") as file:
+        np.save(file, result)
+    os.replace(cache_base + ".npy.tmp", cache_base + ".npy")
+
+def build_contact_sheet(thumbnails, names, scale=2):
+    """Lay out 8-bit RGBA thumbnails in a grid with a label under each, returns RGBA floats."""
+    columns = math.ceil(math.sqrt(len(thumbnails)))
+    rows = math.ceil(len(thumbnails) / columns)
+    cell_height = max(thumbnail.shape[0] for thumbnail in thumbnails)
+    cell_width = max(thumbnail.shape[1] for thumbnail in thumbnails)
+    label_height = 7 * scale + 6
+    gap = 4
+
+    sheet = np.full((rows * (cell_height + label_height + gap) + gap, columns * (cell_width + gap) + gap, 4),
+                    (0.1, 0.1, 0.1, 1.0), dtype=np.float32)
+    max_chars = max(1, (cell_width - 4) // (6 * scale))
+
+    for index, (thumbnail, name) in enumerate(zip(thumbnails, names)):
+        top = gap + index // columns * (cell_height + label_height + gap)
+        left = gap + index % columns * (cell_width + gap)
+        sheet[top:top + thumbnail.shape[0], left:left + thumbnail.shape[1]] = thumbnail / 255.0
+        draw_text(sheet, name[:max_chars], left + 2, top + cell_height + 3, scale)
+
+    return sheet
+
+class RENDER_OT_lut_contact_sheet(Operator):
+    bl_idname = "render_palette.lut_contact_sheet"
+    bl_label = "LUT Contact Sheet"
+    bl_description = "Apply every LUT of the LUT directory to the last render and show them side by side"
+
+    _timer = None
+
+    def execute(self, context):
+        scene = context.scene
+        lut_tool = scene.lut_tool
+        lut_dir = bpy.path.abspath(lut_tool.lut_dir)
+
+        self.filenames = get_lut_files(lut_dir)
+        if not self.filenames:
+            self.report({'ERROR'}, f"No LUT files found in {lut_dir}")
+            return {'CANCELLED'}
 
-        # Create the backup directories
         try:
-            os.makedirs(backup_luts_dir, exist_ok=True)
-            os.makedirs(backup_config_dir, exist_ok=True)
-        except PermissionError:
-            if "WindowsApps" in blender_dir:
-                self.report({'ERROR'}, "Permission denied when trying to create backup directories. Blender installed from the Microsoft Store may have restricted permissions. Please install Blender from the official website and try again.")
-            else:
-                self.report({'ERROR'}, "Permission denied when trying to create backup directories. Please run Blender as an administrator or choose a different backup location.")
+            pixels = get_render_pixels(scene, LUT_SHEET_SIZE)
+        except (KeyError, RuntimeError):
+            self.report({'ERROR'}, "No render to preview, render an image first")
             return {'CANCELLED'}
 
-        # Backup the config.ocio file if it exists
-        if os.path.exists(config_file):
-            shutil.copy(config_file, os.path.join(backup_config_dir, 'config.ocio.backup'))
-            self.report({'INFO'}, f"Backup of config.ocio created in {backup_config_dir}")
-        else:
-            # Create an empty config.ocio.backup file if it doesn't exist
-            open(os.path.join(backup_config_dir, 'config.ocio.backup'), 'w').close()
-            self.report({'INFO'}, f"Backup of config.ocio created in {backup_config_dir}")
+        # Results are cached by render and LUT, so an unchanged sheet opens without applying anything
+        render_hash = hashlib.sha1(pixels.tobytes() + lut_tool.preview_interpolation.encode()).hexdigest()[:16]
+        sheet_dir = get_lut_sheet_dir()
+        self.sheet_dir = sheet_dir
+        self.cache_bases = {}
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        self.futures = {}
+
+        for filename in self.filenames:
+            lut_path = os.path.join(lut_dir, filename)
+            cache_base = os.path.join(sheet_dir, f"{render_hash}_{get_lut_key(lut_path)[:16]}")
+            self.cache_bases[filename] = cache_base
+
+            if os.path.isfile(cache_base + ".npy") and os.path.isfile(cache_base + ".png"):
+                os.utime(cache_base + ".npy")
+                os.utime(cache_base + ".png")
+                continue
+            self.futures[filename] = self.executor.submit(make_lut_thumbnail, lut_path, pixels, lut_tool.preview_interpolation,
+                                                          cache_base, get_lut_cache_bytes(context), get_lut_cache_dir())
+
+        context.window_manager.progress_begin(0, max(1, len(self.futures)))
+        self._timer = context.window_manager.event_timer_add(0.1, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
 
-        # Read all the LUT files, converting the extensions to lowercase
-        lut_files = [f for f in os.listdir(lut_dir) if f.lower().endswith(('.cube'))]
-        if not lut_files:
-            self.report({'ERROR'}, f"No LUT files found in {lut_dir}. Please add LUT files and try again.")
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.finish(context, cancel=True)
+            self.report({'WARNING'}, "Contact sheet cancelled")
             return {'CANCELLED'}
 
-        with open(config_file, 'a') as f:
-            
-            for lut in os.listdir(luts_dir):
-                shutil.copy(os.path.join(luts_dir, lut), os.path.join(backup_luts_dir, lut))
-            self.report({'INFO'}, f"Backup of LUTs created in {backup_luts_dir}")
-            
-            for lut in lut_files:
-                # Copy the LUT file to the luts directory
-                shutil.copy(os.path.join(lut_dir, lut), os.path.join(luts_dir, lut))
-                
-                # Write the LUT to the config.ocio file
-                f.write(f"""
-  
-  - !<Look>
-    name: {os.path.splitext(lut)[0].replace('_', ' ').title()}
-    process_space: sRGB
-    transform: !<FileTransform> {{src: {lut}, interpolation: tetrahedral}}
-""")
-        self.report({'INFO'}, f"Applied {len(lut_files)} LUTs from {lut_dir}. Please restart Blender for the changes to take effect.")
-        return {'FINISHED'}
-    
-# ------------------------------------
-
-class RENDER_OT_lut_restore(Operator):
-    bl_idname = "object.restore_backup"
-    bl_label = "Restore Backup"
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
 
-    def execute(self, context):
-        # Get the paths
-        blender_dir = bpy.utils.resource_path('LOCAL')
-        luts_dir = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'luts')
-        config_file = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'config.ocio')
-        backup_luts_dir = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'backup')
+        done = sum(future.done() for future in self.futures.values())
+        context.window_manager.progress_update(done)
+        if done < len(self.futures):
+            return {'PASS_THROUGH'}
 
-        # Backup directory for config.ocio
-        backup_config_dir = os.path.dirname(config_file)
+        self.finish(context)
 
-        # Remove the current LUT files
-        for lut in os.listdir(luts_dir):
-            if os.path.isfile(os.path.join(luts_dir, lut)):
-                try:
-                    os.remove(os.path.join(luts_dir, lut))                
-                except PermissionError:
-                    if "WindowsApps" in blender_dir:
-                        self.report({'ERROR'}, "Permission denied. Blender installed from the Microsoft Store may have restricted permissions. Please install Blender from the official website and try again.")
-                    else:
-                        self.report({'ERROR'}, "Permission denied. Please run Blender as an administrator and try again.")
-                    return {'CANCELLED'}
+        failed = {filename: future.exception() for filename, future in self.futures.items() if future.exception()}
+        names, thumbnails = [], []
+        lut_sheet_previews.clear()
+        for filename in self.filenames:
+            if filename in failed:
+                continue
+            cache_base = self.cache_bases[filename]
+            thumbnails.append(np.load(cache_base + ".npy"))
+            names.append(get_lut_look_name(filename))
+            lut_sheet_previews.load(filename, cache_base + ".png", 'IMAGE')
 
-        # Restore the LUT files from the backup
-        for lut in os.listdir(backup_luts_dir):
-            shutil.copy(os.path.join(backup_luts_dir, lut), os.path.join(luts_dir, lut))
+        evict_lut_cache(self.sheet_dir, get_lut_cache_bytes(context))
 
-        # Restore the config.ocio file from the backup
-        config_backup_file = os.path.join(backup_config_dir, 'config.ocio.backup')
-        if os.path.isfile(config_backup_file):
-            shutil.copy(config_backup_file, config_file)
+        if thumbnails and not show_image(context, LUT_SHEET_IMAGE, build_contact_sheet(thumbnails, names)):
+            self.report({'INFO'}, f"Open the '{LUT_SHEET_IMAGE}' image in an Image Editor to see the contact sheet")
 
-        self.report({'INFO'}, "Backup restoration complete. Please restart Blender for the changes to take effect.")
+        if failed:
+            self.report({'WARNING'}, "Could not apply: " + ", ".join(f"{filename} ({error})" for filename, error in failed.items()))
         return {'FINISHED'}
-    
+
+    def finish(self, context, cancel=False):
+        context.window_manager.event_timer_remove(self._timer)
+        context.window_manager.progress_end()
+        self.executor.shutdown(wait=not cancel, cancel_futures=cancel)
+
+class RENDER_PT_lut_preview(Panel):
+    """LUT Preview Panel"""
+    bl_label = "LUT Preview"
+    bl_idname = "RENDER_PT_lut_preview"
+    bl_parent_id = "RENDER_PT_main_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Render Palette"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        lut_tool = context.scene.lut_tool
+
+        layout.prop(lut_tool, "lut_dir", text="")
+        if lut_sheet_previews:
+            # Thumbnails of the last contact sheet
+            layout.template_icon_view(lut_tool, "preview_lut", show_labels=True, scale=6.0)
+        scaled_row(layout, "LUT:", lut_tool, "preview_lut")
+        scaled_row(layout, "Interpolation:", lut_tool, "preview_interpolation")
+        scaled_row(layout, "Max Size:", lut_tool, "preview_size")
+        layout.separator()
+
+        row = layout.row(align=True)
+        row.enabled = bool(lut_tool.preview_lut)
+        row.operator("render_palette.lut_preview", icon='IMAGE_RGB')
+        row.operator("render_palette.lut_contact_sheet", icon='IMGDISPLAY', text="Contact Sheet")
+
 # ------------------------------------
 
 class RENDER_PT_lut_properties(PropertyGroup):
@@ -1757,6 +4879,23 @@ class RENDER_PT_lut_properties(PropertyGroup):
         subtype='DIR_PATH',
         default=os.path.join(blender_dir, 'datafiles', 'colormanagement', 'luts')
     )
+
+    preview_lut: EnumProperty(name="LUT", description="LUT of the LUT directory to preview", items=get_lut_file_items)
+    preview_interpolation: EnumProperty(
+        name="Interpolation",
+        items=[
+            ('TETRAHEDRAL', "Tetrahedral", "Interpolate between 4 LUT entries, like the installed looks"),
+            ('TRILINEAR', "Trilinear", "Interpolate between 8 LUT entries"),
+        ],
+        default='TETRAHEDRAL',
+    )
+    preview_size: IntProperty(
+        name="Max Size",
+        description="Longest side of the preview in pixels, 0 uses the full render",
+        default=1024,
+        min=0,
+        subtype='PIXEL',
+    )
     
 # ------------------------------------
     
@@ -1790,34 +4929,396 @@ class RENDER_OT_lut_info(bpy.types.Operator):
 
 # ----------------------------------------------------------------------------
 
+# State of the autosaved render in progress, None when there is none
+autosave_state = None
+
+# Thumbnails of the autosave history, loaded when the list draws them
+autosave_previews = None
+
+HISTORY_INDEX_NAME = "render_history.json"
+HISTORY_THUMBNAIL_DIR = ".render_history"
+HISTORY_THUMBNAIL_SIZE = 128
+
+def read_targa(filepath):
+    """Memory-map an uncompressed TGA as written by Blender.
+
+    Returns an array of shape (height, width, channels), top row first, in BGR(A) order.
+    """
+    with open(filepath, "rb") as file:
+        header = file.read(18)
+    id_length, image_type = header[0], header[2]
+    width, height, bits, descriptor = struct.unpack("<HHBB", header[12:18])
+    if image_type not in (2, 3):
+        raise ValueError("not an uncompressed TGA file")
+
+    pixels = np.memmap(filepath, dtype=np.uint8, mode='r', offset=18 + id_length, shape=(height, width, bits // 8))
+    # Rows are stored bottom up unless the descriptor says otherwise
+    return pixels if descriptor & 0x20 else pixels[::-1]
+
+def get_rgb_order(channels):
+    return [2, 1, 0, 3][:channels] if channels >= 3 else list(range(channels))
+
+def downsample(pixels, max_size):
+    """Return a small copy of an image by sampling every n-th pixel, reading only those pixels."""
+    step = max(1, math.ceil(max(pixels.shape[:2]) / max_size))
+    return np.array(pixels[::step, ::step])
+
+def get_image_hash(pixels):
+    """Return the 64-bit difference hash of BGR(A) pixels as hex, similar images differ in a few bits."""
+    small = downsample(pixels, 256).astype(np.float32)
+    if min(small.shape[:2]) < 9:
+        return ""
+
+    gray = small[..., 0] if small.shape[2] < 3 else small[..., 0] * 0.114 + small[..., 1] * 0.587 + small[..., 2] * 0.299
+
+    # Average into 8 rows of 9 cells and compare neighbouring cells
+    rows = np.linspace(0, gray.shape[0], 9).astype(int)
+    cols = np.linspace(0, gray.shape[1], 10).astype(int)
+    cells = np.add.reduceat(np.add.reduceat(gray, rows[:-1], axis=0), cols[:-1], axis=1)
+    cells /= np.outer(np.diff(rows), np.diff(cols))
+
+    return np.packbits(cells[:, 1:] > cells[:, :-1]).tobytes().hex()
+
+def get_hash_distance(hash_a, hash_b):
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count("1")
+
+def read_history_index(directory):
+    try:
+        with open(os.path.join(directory, HISTORY_INDEX_NAME), "r") as file:
+            return json.load(file).get("images", [])
+    except (OSError, ValueError, AttributeError):
+        return []
+
+def append_history_index(directory, entry):
+    images = read_history_index(directory)
+    images.append(entry)
+
+    index_path = os.path.join(directory, HISTORY_INDEX_NAME)
+    with open(index_path + ".tmp", "w") as file:
+        json.dump({"version": 1, "images": images}, file, indent=4)
+    os.replace(index_path + ".tmp", index_path)
+
+def find_duplicate(images, image_hash, threshold):
+    """Return the history entry of an image that looks the same as the given hash, if there is one."""
+    for image in reversed(images):
+        if image.get("hash") and get_hash_distance(image["hash"], image_hash) <= threshold:
+            return image
+    return None
+
+def write_history_thumbnail(tga_path, thumbnail_path):
+    """Write a small PNG of a dumped render."""
+    small = downsample(read_targa(tga_path), HISTORY_THUMBNAIL_SIZE)
+    os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+    with PNGStreamWriter(thumbnail_path + ".tmp", small.shape[1], small.shape[0], small.shape[2]) as writer:
+        writer.write_rows(small[..., get_rgb_order(small.shape[2])])
+    os.replace(thumbnail_path + ".tmp", thumbnail_path)
+
+def read_tiff(filepath):
+    """Memory-map an uncompressed single strip TIFF as written by Blender.
+
+    Returns an array of shape (height, width, channels), top row first, in RGB(A) order, and whether
+    the alpha is premultiplied.
+    """
+    with open(filepath, "rb") as file:
+        header = file.read(8)
+        if header[:4] not in (b"II*\x00", b"MM\x00*"):
+            raise ValueError("not a TIFF file")
+        order = "<" if header[:2] == b"II" else ">"
+        file.seek(struct.unpack(order + "I", header[4:])[0])
+        count = struct.unpack(order + "H", file.read(2))[0]
+        entries = [struct.unpack(order + "HHI4s", file.read(12)) for _ in range(count)]
+
+        tags = {}
+        for tag, field_type, length, value in entries:
+            size = {3: 2, 4: 4}.get(field_type)
+            if size is None:
+                continue
+            data = value
+            if size * length > 4:
+                file.seek(struct.unpack(order + "I", value)[0])
+                data = file.read(size * length)
+            tags[tag] = struct.unpack(order + ("H" if size == 2 else "I") * length, data[:size * length])
+
+    width, height = tags[256][0], tags[257][0]
+    bits = tags.get(258, (1,))[0]
+    channels = tags.get(277, (1,))[0]
+    offsets, lengths = tags[273], tags[279]
+    if tags.get(259, (1,))[0] != 1 or tags.get(284, (1,))[0] != 1 or bits not in (8, 16):
+        raise ValueError("not an uncompressed 8 or 16-bit TIFF file")
+    if any(offsets[i] + lengths[i] != offsets[i + 1] for i in range(len(offsets) - 1)):
+        raise ValueError("TIFF strips are not contiguous")
+
+    dtype = np.dtype(order + "u2") if bits == 16 else np.dtype("u1")
+    pixels = np.memmap(filepath, dtype=dtype, mode='r', offset=offsets[0], shape=(height, width, channels))
+    premultiplied = tags.get(338, (0,))[0] == 1
+    # Orientation 4 stores the bottom row first
+    return (pixels[::-1] if tags.get(274, (1,))[0] == 4 else pixels), premultiplied
+
+def write_png_rows(pixels, filepath, compression, bit_depth=8, order=None, premultiplied=False, chunk_rows=64):
+    """Encode an image array as PNG, a few rows at a time, reordering the channels by order."""
+    height, width, channels = pixels.shape
+    order = order or list(range(channels))
+    maximum = (1 << bit_depth) - 1
+
+    with PNGStreamWriter(filepath, width, height, channels, bit_depth, compression) as writer:
+        for row in range(0, height, chunk_rows):
+            chunk = pixels[row:row + chunk_rows][..., order]
+            if premultiplied and channels in (2, 4):
+                # PNG stores straight alpha
+                alpha = chunk[..., -1:].astype(np.float32)
+                color = chunk[..., :-1] * np.float32(maximum) / np.maximum(alpha, 1.0)
+                chunk = np.concatenate((np.clip(color + 0.5, 0, maximum).astype(chunk.dtype), chunk[..., -1:]), axis=-1)
+            writer.write_rows(chunk)
+
+def write_png_from_targa(tga_path, filepath, compression, chunk_rows=64):
+    """Encode a dumped render as an 8-bit PNG, a few rows at a time."""
+    pixels = read_targa(tga_path)
+    write_png_rows(pixels, filepath, compression, 8, get_rgb_order(pixels.shape[2]), chunk_rows=chunk_rows)
+
+# Autosaved images that are still being written, so their names are not given out again
+autosave_pending = set()
+
+# Why the last image written on a worker thread failed, shown in the history panel
+autosave_write_error = ""
+
+def write_autosave_files(tga_path, filepath, file_format, compression, thumbnail_path, tiff_path=None):
+    """Write an autosaved image and its thumbnail from the dumped render, runs on a worker thread.
+
+    The file is written under a temporary name and renamed once complete. When file_format is
+    None the image was already saved and only the thumbnail is made. 16-bit PNGs are written from
+    the 16-bit TIFF dump at tiff_path.
+    """
+    global autosave_write_error
+
+    try:
+        if thumbnail_path:
+            write_history_thumbnail(tga_path, thumbnail_path)
+
+        if file_format == 'PNG' and tiff_path:
+            pixels, premultiplied = read_tiff(tiff_path)
+            write_png_rows(pixels, filepath + ".tmp", compression, pixels.dtype.itemsize * 8, premultiplied=premultiplied)
+            del pixels
+            os.replace(filepath + ".tmp", filepath)
+        elif file_format == 'PNG':
+            write_png_from_targa(tga_path, filepath + ".tmp", compression)
+            os.replace(filepath + ".tmp", filepath)
+        elif file_format == 'TARGA_RAW':
+            # The dump already is the image
+            shutil.move(tga_path, filepath)
+    except (KeyError, OSError, ValueError) as e:
+        autosave_write_error = f"Could not write {os.path.basename(filepath)}: {e}"
+    finally:
+        autosave_pending.discard(filepath)
+        for path in (tga_path, tiff_path):
+            if path and os.path.isfile(path):
+                os.remove(path)
+
+def get_threaded_autosave_format(image_settings):
+    """Return the file format when the image can be written from a dump on a worker thread."""
+    if image_settings.file_format == 'PNG' and image_settings.color_depth in {'8', '16'}:
+        return 'PNG'
+    if image_settings.file_format == 'TARGA_RAW':
+        return 'TARGA_RAW'
+    return None
+
+def save_render_result(scene, filepath, file_format=None, **settings):
+    """Save the Render Result, optionally in another file format than the scene output and with
+    other image settings, e.g. color_depth."""
+    image_settings = scene.render.image_settings
+    # Switching the format can change the color mode and depth, so those are restored as well
+    keys = ["file_format", "color_mode", "color_depth"] + [key for key in settings if key not in ("color_mode", "color_depth")]
+    original = [getattr(image_settings, key) for key in keys]
+    if file_format:
+        image_settings.file_format = file_format
+    for key, value in settings.items():
+        setattr(image_settings, key, value)
+    try:
+        bpy.data.images["Render Result"].save_render(filepath, scene=scene)
+    finally:
+        for key, value in zip(keys, original):
+            setattr(image_settings, key, value)
+
+def get_history_icon(entry):
+    """Return the icon of an entry's thumbnail, loading it the first time the entry is drawn."""
+    path = entry.thumbnail
+    if autosave_previews is None or not path or not os.path.isfile(path):
+        return 0
+    if path not in autosave_previews:
+        autosave_previews.load(path, path, 'IMAGE')
+    return autosave_previews[path].icon_id
+
+def add_history_entry(history, directory, image):
+    entry = history.add()
+    entry.filepath = os.path.join(directory, image["file"])
+    entry.thumbnail = os.path.join(directory, image["thumbnail"]) if image.get("thumbnail") else ""
+    entry.image_hash = image.get("hash", "")
+    entry.date = image.get("date", "")
+    entry.duration = image.get("duration", 0.0)
+    entry.engine = image.get("engine", "")
+    entry.resolution = image.get("resolution", "")
+    entry.samples = image.get("samples", 0)
+    entry.peak_memory = image.get("peak_memory", "")
+    entry.stats = image.get("stats", "")
+    return entry
+
+def get_autosave_handlers():
+    return ((bpy.app.handlers.render_init, autosave_render_init),
+            (bpy.app.handlers.render_stats, autosave_render_stats),
+            (bpy.app.handlers.render_complete, autosave_render_complete),
+            (bpy.app.handlers.render_cancel, autosave_render_cancel))
+
+def add_autosave_handlers():
+    for handlers, handler in get_autosave_handlers():
+        if handler not in handlers:
+            handlers.append(handler)
+
+def remove_autosave_handlers():
+    for handlers, handler in get_autosave_handlers():
+        if handler in handlers:
+            handlers.remove(handler)
+
+def finish_autosave(scene):
+    """Remove the handlers and restore the output path, called once the render ends in any way."""
+    global autosave_state
+
+    state, autosave_state = autosave_state, None
+    remove_autosave_handlers()
+    if state and scene is not None:
+        scene.render.filepath = state["original_output_path"]
+    return state
+
+@persistent
+def autosave_render_init(scene, *args):
+    if autosave_state:
+        autosave_state["start"] = time.perf_counter()
+
+@persistent
+def autosave_render_stats(stats):
+    if autosave_state:
+        autosave_state["stats"] = stats
+
+@persistent
+def autosave_render_complete(scene, *args):
+    # This runs on the render thread, the image is saved on the main thread
+    if autosave_state:
+        bpy.app.timers.register(functools.partial(save_autosave_render, scene.name))
+
+def save_autosave_render(scene_name):
+    """Timer that saves the finished autosave render and adds it to the history."""
+    scene = bpy.data.scenes.get(scene_name)
+    state = finish_autosave(scene)
+    if not state or scene is None:
+        return None
+
+    props = scene.render_palette_autosave_props
+    props.last_error = ""
+    duration = time.perf_counter() - state.get("start", state["requested"])
+    directory, filename = os.path.split(state["filepath"])
+    stem = os.path.splitext(filename)[0]
+
+    # Dump the result uncompressed to hash it, and to write the image and thumbnail from
+    tga_path = os.path.join(bpy.app.tempdir, f"render_palette_{stem}_{int(time.time() * 1000)}.tga")
+    try:
+        save_render_result(scene, tga_path, 'TARGA_RAW')
+        image_hash = get_image_hash(read_targa(tga_path))
+    except (KeyError, OSError, RuntimeError, ValueError) as e:
+        props.last_error = f"Could not hash the render: {e}"
+        image_hash = ""
+
+    if props.skip_duplicates and image_hash:
+        duplicate = find_duplicate(read_history_index(directory), image_hash, props.duplicate_threshold)
+        if duplicate:
+            props.last_duplicate = duplicate["file"]
+            if os.path.isfile(tga_path):
+                os.remove(tga_path)
+            return
+
+    # PNG and TGA are encoded from the dumps on a worker thread so the next render can start,
+    # other formats are saved by Blender here
+    image_settings = scene.render.image_settings
+    file_format = get_threaded_autosave_format(image_settings) if os.path.isfile(tga_path) else None
+    tiff_path = None
+    if file_format == 'PNG' and image_settings.color_depth == '16':
+        tiff_path = os.path.splitext(tga_path)[0] + ".tif"
+        try:
+            save_render_result(scene, tiff_path, 'TIFF', color_depth='16', tiff_codec='NONE')
+        except (KeyError, RuntimeError, TypeError):
+            file_format, tiff_path = None, None
+
+    props.last_blocking_save = ""
+    if file_format is None:
+        props.last_blocking_save = image_settings.file_format
+        try:
+            save_render_result(scene, state["filepath"])
+        except (KeyError, RuntimeError) as e:
+            props.last_error = f"Could not save {state['filepath']}: {e}"
+            return
+    props.last_duplicate = ""
+
+    stats = state.get("stats", "")
+    peak = re.search(r"Peak[: ]+([\d.]+ ?[KMG]i?B?)", stats)
+    image = {
+        "file": filename,
+        "hash": image_hash,
+        "date": datetime.datetime.now().isoformat(sep=" ", timespec='seconds'),
+        "duration": round(duration, 3),
+        "engine": scene.render.engine,
+        "resolution": f"{state['width']}x{state['height']}",
+        "samples": scene.cycles.samples if scene.render.engine == 'CYCLES' else 0,
+        "peak_memory": peak.group(1) if peak else "",
+        "camera": scene.camera.name if scene.camera else "",
+        "view_transform": scene.view_settings.view_transform,
+        "look": scene.view_settings.look,
+        "stats": stats,
+    }
+
+    if os.path.isfile(tga_path):
+        image["thumbnail"] = os.path.join(HISTORY_THUMBNAIL_DIR, f"{stem}.png")
+        if file_format:
+            autosave_pending.add(state["filepath"])
+        threading.Thread(target=write_autosave_files, daemon=True,
+                         args=(tga_path, state["filepath"], file_format, min(9, image_settings.compression // 10),
+                               os.path.join(directory, image["thumbnail"]), tiff_path)).start()
+
+    try:
+        append_history_index(directory, image)
+    except OSError as e:
+        props.last_error = f"Could not update {HISTORY_INDEX_NAME}: {e}"
+
+    add_history_entry(props.history, directory, image)
+    props.history_index = len(props.history) - 1
+
+@persistent
+def autosave_render_cancel(scene, *args):
+    finish_autosave(scene)
+
+@persistent
+def autosave_load_post(*args):
+    """Forget an autosave whose render was interrupted by loading a file, so the next one can start."""
+    global autosave_state
+
+    autosave_state = None
+    remove_autosave_handlers()
+
+def get_autosave_directory(scene):
+    output_path = bpy.path.abspath(scene.render.filepath)
+    return output_path if os.path.isdir(output_path) else os.path.dirname(output_path)
+
 class RENDER_OT_autosave(Operator):
     """Autosave Operator"""
     bl_idname = "render.autosave_operator"
     bl_label = "Render and Save Image"
 
-    render_counter = 1
-    render_timer = None
-    progress_value = 0.0
-
-    is_rendering: bpy.props.BoolProperty(default=False)
-
-    def modal(self, context, event):
-        if event.type == 'TIMER':
-            if not self.is_rendering:
-                self.report({'INFO'}, "Rendering completed or canceled.")
-                return {'FINISHED'}
-        return {'PASS_THROUGH'}
-
     def execute(self, context):
-        self.is_rendering = True
-        if not hasattr(self.__class__, 'original_output_path'):
-            self.__class__.original_output_path = bpy.context.scene.render.filepath
-            
-        AutosaveOperator = RENDER_OT_autosave
+        global autosave_state, autosave_write_error
 
-        output_path = self.__class__.original_output_path
-        
-        bpy.context.scene.render_file_format = 'PNG'
+        if autosave_state is not None:
+            self.report({'WARNING'}, "An autosaved render is already running")
+            return {'CANCELLED'}
+        autosave_write_error = ""
+
+        scene = context.scene
+        rd = scene.render
 
         if bpy.data.is_saved:
             base_name = bpy.path.basename(bpy.context.blend_data.filepath)
@@ -1825,36 +5326,114 @@ class RENDER_OT_autosave(Operator):
         else:
             project_name = "Render"
 
-        if os.path.isdir(bpy.path.abspath(output_path)):
-            directory = output_path
-        else:
-            directory = os.path.dirname(output_path)
+        directory = get_autosave_directory(scene)
+
+        # Number the image after the existing ones and the ones still being written
+        extension = rd.file_extension
+        counter = 1
+        while (os.path.isfile(os.path.join(directory, f"{project_name}_{counter}{extension}"))
+               or os.path.join(directory, f"{project_name}_{counter}{extension}") in autosave_pending):
+            counter += 1
+
+        # The handlers save the image once the render is done, unless it duplicates an earlier one,
+        # and then remove themselves
+        autosave_state = {
+            "original_output_path": rd.filepath,
+            "filepath": os.path.join(directory, f"{project_name}_{counter}{extension}"),
+            "requested": time.perf_counter(),
+            "width": rd.resolution_x * rd.resolution_percentage // 100,
+            "height": rd.resolution_y * rd.resolution_percentage // 100,
+        }
+        add_autosave_handlers()
 
-        filename = f"{project_name}_{AutosaveOperator.render_counter}.png"
-        output_path = os.path.join(directory, filename)
+        if 'CANCELLED' in bpy.ops.render.render("INVOKE_DEFAULT", animation=False, write_still=False):
+            finish_autosave(scene)
+            self.report({'WARNING'}, "Render could not be started")
+            return {'CANCELLED'}
 
-        abs_output_path = bpy.path.abspath(output_path)
+        return {'FINISHED'}
 
-        while os.path.isfile(abs_output_path):
-            AutosaveOperator.render_counter += 1
-            filename = f"{project_name}_{AutosaveOperator.render_counter}.png"
-            output_path = os.path.join(directory, filename)
-            abs_output_path = bpy.path.abspath(output_path)
+class RENDER_OT_load_autosave_history(Operator):
+    bl_idname = "render.load_autosave_history"
+    bl_label = "Load History"
+    bl_description = "Load the autosave history of the output folder"
 
-        bpy.context.scene.render.filepath = output_path
+    def execute(self, context):
+        props = context.scene.render_palette_autosave_props
+        directory = get_autosave_directory(context.scene)
 
-        bpy.ops.render.render("INVOKE_DEFAULT", animation=False, write_still=True)
+        props.history.clear()
+        for image in read_history_index(directory):
+            if isinstance(image, dict) and "file" in image:
+                add_history_entry(props.history, directory, image)
+        props.history_index = max(0, len(props.history) - 1)
 
-        self.render_timer = context.window_manager.event_timer_add(1.0, window=context.window)
-        context.window_manager.modal_handler_add(self)
+        self.report({'INFO'}, f"{len(props.history)} autosaved render(s) in {directory}")
+        return {'FINISHED'}
 
-        return {'RUNNING_MODAL'}
+class RENDER_UL_autosave_history(UIList):
+    def draw_item(self, _context, layout, _data, item, _icon, _active_data, _active_propname, index):
+        # Only visible rows are drawn, so only their thumbnails get loaded
+        icon = get_history_icon(item)
+        name = bpy.path.basename(item.filepath)
+
+        if self.layout_type == 'GRID':
+            layout.template_icon(icon_value=icon or 0, scale=4.0)
+            return
+
+        row = layout.row(align=True)
+        if icon:
+            row.label(text=name, icon_value=icon)
+        else:
+            row.label(text=name, icon='IMAGE_DATA')
+        row.label(text=format_duration(item.duration))
+
+class RENDER_PT_autosave_history(Panel):
+    """Autosave History Panel"""
+    bl_label = "Render History"
+    bl_idname = "RENDER_PT_autosave_history"
+    bl_parent_id = "RENDER_PT_main_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Render Palette"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.render_type == 'IMAGE' and context.scene.render_palette_autosave_props.enable_autosave
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.render_palette_autosave_props
+
+        row = layout.row(align=True)
+        row.prop(props, "skip_duplicates")
+        sub = row.row(align=True)
+        sub.active = props.skip_duplicates
+        sub.prop(props, "duplicate_threshold", text="Tolerance")
+
+        if props.last_duplicate:
+            layout.label(text=f"Last render matches {props.last_duplicate}, not saved", icon='INFO')
+        if props.last_error or autosave_write_error:
+            layout.label(text=props.last_error or autosave_write_error, icon='ERROR')
+        if props.last_blocking_save:
+            layout.label(text=f"{props.last_blocking_save} is saved before the next render can start", icon='INFO')
+
+        row = layout.row()
+        row.template_list("RENDER_UL_autosave_history", "", props, "history", props, "history_index", rows=4)
+        row.operator("render.load_autosave_history", icon='FILE_REFRESH', text="")
 
-    def cancel(self, context):
-        if self.render_timer:
-            context.window_manager.event_timer_remove(self.render_timer)
+        if 0 <= props.history_index < len(props.history):
+            entry = props.history[props.history_index]
+            icon = get_history_icon(entry)
+            if icon:
+                layout.template_icon(icon_value=icon, scale=6.0)
 
-        self.progress_value = 0.0
+            col = layout.column(align=True)
+            col.label(text=f"{entry.date}, {format_duration(entry.duration)}")
+            col.label(text=f"{entry.engine}, {entry.resolution}" + (f", {entry.samples} samples" if entry.samples else ""))
+            if entry.peak_memory:
+                col.label(text=f"Peak Memory: {entry.peak_memory}")
 
 class RENDER_OT_toggle_autosave(Operator):
     bl_idname = "render.toggle_autosave"
@@ -1866,8 +5445,37 @@ class RENDER_OT_toggle_autosave(Operator):
         scene.render_palette_autosave_props.enable_autosave = not scene.render_palette_autosave_props.enable_autosave
         return {'FINISHED'}
 
+class RENDER_PG_autosave_entry(PropertyGroup):
+    filepath: StringProperty(name="File Path", subtype='FILE_PATH')
+    thumbnail: StringProperty(name="Thumbnail", subtype='FILE_PATH')
+    image_hash: StringProperty(name="Image Hash")
+    date: StringProperty(name="Date")
+    duration: bpy.props.FloatProperty(name="Duration", subtype='TIME_ABSOLUTE', unit='TIME_ABSOLUTE')
+    engine: StringProperty(name="Render Engine")
+    resolution: StringProperty(name="Resolution")
+    samples: IntProperty(name="Samples")
+    peak_memory: StringProperty(name="Peak Memory")
+    stats: StringProperty(name="Render Stats")
+
 class RENDER_PG_autosave_props(PropertyGroup):
     enable_autosave: bpy.props.BoolProperty(name="Enable Autosave", default=False)
+    history: CollectionProperty(type=RENDER_PG_autosave_entry)
+    history_index: IntProperty(name="Active Render")
+    skip_duplicates: bpy.props.BoolProperty(
+        name="Skip Duplicates",
+        description="Don't save renders that look the same as one already in the output folder",
+        default=True,
+    )
+    duplicate_threshold: IntProperty(
+        name="Duplicate Tolerance",
+        description="Number of the 64 image hash bits that may differ for renders to count as the same",
+        default=2,
+        min=0,
+        max=16,
+    )
+    last_duplicate: StringProperty(name="Last Duplicate")
+    last_error: StringProperty(name="Last Error", description="Why the last autosave could not be completed")
+    last_blocking_save: StringProperty(name="Last Blocking Save", description="File format of the last autosave that could not be written in the background")
 
 # ----------------------------------------------------------------------------
 
@@ -1891,18 +5499,27 @@ def custom_overwrite_update(self, context):
     else:
         scene.render.use_overwrite = False
 
+# Set while a preset is applied, the preset writes the values the update callbacks would derive itself
+preset_updates_suspended = False
+
 # define file format presets
 def update_file_format(self, context):
+    if preset_updates_suspended:
+        return
+
     bpy.context.scene.render.image_settings.file_format = context.scene.file_format
     
     rd = context.scene.render
-    if self.render_file_format == 'MP4':
-        rd.image_settings.file_format = 'FFMPEG'
-        rd.ffmpeg.format = 'MPEG4'
-        rd.ffmpeg.codec = 'H264'
-        rd.ffmpeg.constant_rate_factor = 'HIGH'
-    else:
-        rd.image_settings.file_format = self.render_file_format
+    for owner, attr, value in get_file_format_settings(rd, self.render_file_format):
+        setattr(owner, attr, value)
+
+def get_file_format_settings(rd, render_file_format):
+    if render_file_format == 'MP4':
+        return [(rd.image_settings, 'file_format', 'FFMPEG'),
+                (rd.ffmpeg, 'format', 'MPEG4'),
+                (rd.ffmpeg, 'codec', 'H264'),
+                (rd.ffmpeg, 'constant_rate_factor', 'HIGH')]
+    return [(rd.image_settings, 'file_format', render_file_format)]
 
 Scene.render_file_format = EnumProperty(
     name="File Format",
@@ -1921,19 +5538,42 @@ Scene.render_file_format = EnumProperty(
 )
 
 
+RESOLUTION_PRESETS = {
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+    '1440p': (2560, 1440),
+    '4K': (3840, 2160),
+    '8K': (7680, 4320),
+}
+
+SAMPLES_PRESETS = {
+    'LOW': 64,
+    'MEDIUM': 128,
+    'HIGH': 256,
+}
+
+FPS_PRESETS = {
+    '23.98': (24, 1.001),
+    '24': (24, 1.0),
+    '25': (25, 1.0),
+    '29.97': (30, 1.001),
+    '30': (30, 1.0),
+    '50': (50, 1.0),
+    '59.94': (60, 1.001),
+    '60': (60, 1.0),
+    '120': (120, 1.0),
+    '240': (240, 1.0),
+}
+
 # define resolution presetss
 def update_resolution(self, context):
-    resolution_presets = {
-        '720p': (1280, 720),
-        '1080p': (1920, 1080),
-        '1440p': (2560, 1440),
-        '4K': (3840, 2160),
-        '8K': (7680, 4320),
-    }
+    if preset_updates_suspended:
+        return
+
     if context.scene.resolution_preset == 'Custom':
         resolution = (context.scene.custom_resolution_x, context.scene.custom_resolution_y)
     else:
-        resolution = resolution_presets[context.scene.resolution_preset]
+        resolution = RESOLUTION_PRESETS[context.scene.resolution_preset]
     context.scene.render.resolution_x = resolution[0]
     context.scene.render.resolution_y = resolution[1]
 
@@ -1953,32 +5593,21 @@ def get_samples_items(self, context):
     return items
 
 def update_samples(self, context):
-    samples_presets = {
-        'LOW': 64,
-        'MEDIUM': 128,
-        'HIGH': 256,
-    }
-    
-    if self.samples_preset != 'CUSTOM':
-        context.scene.cycles.samples = samples_presets.get(self.samples_preset)
+    if preset_updates_suspended:
+        return
+
+    if self.samples_preset in SAMPLES_PRESETS:
+        context.scene.cycles.samples = SAMPLES_PRESETS[self.samples_preset]
 
 # define framerate presets
 def update_fps(self, context):
-    fps_mapping = {
-        '23.98': (24, 1.001),
-        '24': (24, 1.0),
-        '25': (25, 1.0),
-        '29.97': (30, 1.001),
-        '30': (30, 1.0),
-        '50': (50, 1.0),
-        '59.94': (60, 1.001),
-        '60': (60, 1.0),
-        '120': (120, 1.0),
-        '240': (240, 1.0),
-        'CUSTOM': (context.scene.custom_fps, 1.0)
-    }
+    if preset_updates_suspended:
+        return
 
-    fps, fps_base = fps_mapping.get(self.framerate_preset, (24, 1.0))
+    if self.framerate_preset == 'CUSTOM':
+        fps, fps_base = context.scene.custom_fps, 1.0
+    else:
+        fps, fps_base = FPS_PRESETS.get(self.framerate_preset, (24, 1.0))
     
     context.scene.render.fps = fps
     context.scene.render.fps_base = fps_base
@@ -2008,26 +5637,148 @@ class RENDER_OT_check_for_updates(Operator):
     bl_description = "Checks for available updates for the Render Palette addon."
 
     def execute(self, context):
-        message = context.preferences.addons[__name__].preferences.check_for_updates()
+        if bpy.app.background:
+            self.report({'ERROR'}, "Update checks are disabled in background mode")
+            return {'CANCELLED'}
+
+        if not start_update_check(context.preferences.addons[__name__].preferences):
+            self.report({'INFO'}, "An update check is already running")
         return {'FINISHED'}
 
 # -------------------------------
- 
-# automatic update check
-@persistent
-def show_update_popup(dummy):
+
+UPDATE_URL = "https://raw.githubusercontent.com/Jishnu-jithu/render-palette/main/latest_version.txt"
+UPDATE_TIMEOUT = 5.0
+UPDATE_CACHE_NAME = "update_check.json"
+
+# Result of the update check running on a worker thread, handed to the main thread by a timer
+update_check_results = queue.Queue()
+update_check_thread = None
+update_check_show_popup = False
+
+def parse_version(text):
+    """Return a version string like "1.10" as a tuple of ints, so it compares numerically."""
+    return tuple(int(part) for part in text.strip().split("."))
+
+def fetch_latest_version(url=UPDATE_URL, timeout=UPDATE_TIMEOUT):
+    """Return the latest version published at url, raises OSError or ValueError when it can't be read."""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        text = response.read(64).decode("utf-8").strip()
+    parse_version(text)
+    return text
+
+def get_update_cache_path():
+    return os.path.join(bpy.utils.user_resource('CONFIG', path="render_palette", create=True), UPDATE_CACHE_NAME)
+
+def read_update_cache(path):
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def write_update_cache(path, latest_version, checked=None):
+    data = {"latest_version": latest_version, "checked": checked if checked is not None else time.time()}
+    with open(path + ".tmp", "w") as file:
+        json.dump(data, file)
+    os.replace(path + ".tmp", path)
+
+def is_update_check_due(cache, interval_days, now=None):
+    """Return True when the last successful check is older than the interval, 0 days checks every start."""
+    if not cache.get("latest_version"):
+        return True
+    now = now if now is not None else time.time()
+    return now - cache.get("checked", 0) >= interval_days * 86400
+
+def update_check_worker(url, timeout, results):
+    try:
+        results.put((fetch_latest_version(url, timeout), None))
+    except (OSError, ValueError) as e:
+        results.put((None, e))
+
+def apply_update_result(prefs, latest_version, checked):
+    """Show a check result in the preferences, returns True when a newer version is available."""
+    prefs.latest_version_number = latest_version
+    prefs.last_update_check = datetime.datetime.fromtimestamp(checked).strftime("%Y-%m-%d %H:%M:%S")
+
+    if parse_version(latest_version) > tuple(bl_info["version"]):
+        prefs.update_check_status = "New Update Available"
+        return True
+    prefs.update_check_status = "Add-on is Up to Date"
+    return False
+
+def start_update_check(prefs, url=UPDATE_URL, timeout=UPDATE_TIMEOUT, show_popup=False):
+    """Check for updates on a worker thread, returns False when a check is already running."""
+    global update_check_thread, update_check_show_popup
+
+    if update_check_thread is not None and update_check_thread.is_alive():
+        return False
+
+    prefs.update_check_status = "Checking..."
+    prefs.update_check_error = ""
+    update_check_show_popup = show_popup
+    update_check_thread = threading.Thread(target=update_check_worker, args=(url, timeout, update_check_results), daemon=True)
+    update_check_thread.start()
+    if not bpy.app.timers.is_registered(process_update_check):
+        bpy.app.timers.register(process_update_check, first_interval=0.2)
+    return True
+
+def process_update_check():
+    """Timer on the main thread that applies the result of the update check once it arrives."""
+    try:
+        latest_version, error = update_check_results.get_nowait()
+    except queue.Empty:
+        return 0.2
+
     prefs = bpy.context.preferences.addons[__name__].preferences
-    prefs.check_for_updates()
-    if prefs.update_check_status == "New Update Available":
-        bpy.ops.render_palette.show_update_popup('INVOKE_DEFAULT')
+    if error is not None:
+        prefs.update_check_status = "No Internet Connection"
+        prefs.update_check_error = str(error)
+        return None
+
+    checked = time.time()
+    try:
+        write_update_cache(get_update_cache_path(), latest_version, checked)
+    except OSError as e:
+        # The result still shows, the next start just checks again
+        prefs.update_check_error = f"Could not save the result to {UPDATE_CACHE_NAME}: {e}"
+
+    if apply_update_result(prefs, latest_version, checked) and update_check_show_popup:
+        show_update_popup()
+    return None
+
+def show_update_popup():
+    windows = bpy.context.window_manager.windows
+    if not windows:
+        return
+    window = windows[0]
+    if hasattr(bpy.context, "temp_override"):
+        with bpy.context.temp_override(window=window, screen=window.screen):
+            bpy.ops.render_palette.show_update_popup('INVOKE_DEFAULT')
+    else:
+        # Blender 3.0 and 3.1 only take a context override dict
+        bpy.ops.render_palette.show_update_popup({'window': window, 'screen': window.screen}, 'INVOKE_DEFAULT')
 
-def delayed_popup():
-    time.sleep(1)
-    show_update_popup(None)
+def auto_check_for_updates():
+    """Check for updates once after startup, unless the last check is recent enough or Blender runs without UI."""
+    if bpy.app.background:
+        return None
 
-t1 = threading.Thread(target=delayed_popup)
+    prefs = bpy.context.preferences.addons[__name__].preferences
+    if not prefs.auto_check_for_updates:
+        return None
 
-t1.start()
+    cache = read_update_cache(get_update_cache_path())
+    if is_update_check_due(cache, prefs.interval_weeks * 7 + prefs.interval_days):
+        start_update_check(prefs, show_popup=True)
+    else:
+        # Reuse the cached result without touching the network
+        try:
+            if apply_update_result(prefs, cache["latest_version"], cache.get("checked", 0)):
+                show_update_popup()
+        except ValueError:
+            pass
+    return None
 
 class RENDER_OT_show_update_popup(bpy.types.Operator):
     bl_idname = "render_palette.show_update_popup"
@@ -2116,8 +5867,8 @@ class RENDER_OT_lut_warning(bpy.types.Operator):
 
     def draw(self, context):
         layout = self.layout
-        layout.label(text="To install more LUTs,")
-        layout.label(text="you need to first remove the currently installed LUTs and try reinstall after removing")
+        layout.label(text="LUTs are installed. 'Update LUTs' copies new and changed LUTs from the folder")
+        layout.label(text="and removes the ones deleted from it. 'Remove LUTs' restores the original files.")
 
 def draw_luts_properties(layout, preferences, context):
     """Draw the luts preferences section"""
@@ -2132,37 +5883,26 @@ def draw_luts_properties(layout, preferences, context):
     sub.label(text="Color Management")
     
     # Get Blender directory
-    blender_dir = bpy.utils.resource_path('LOCAL')
     path_blender_dir = os.path.dirname(bpy.utils.resource_path('LOCAL'))
 
-    # Restore/Reset button
-    config_file = os.path.join(blender_dir, 'datafiles', 'colormanagement', 'config.ocio')
-    config_backup_file = config_file + '.backup'
+    # Restore/Reset button, checked without reading the config on every redraw
+    installed = is_lut_sync_installed(get_colormanagement_dir())
     
-    # Check if both files exist before comparing
-    if os.path.exists(config_file) and os.path.isfile(config_backup_file):
-        backup_same = filecmp.cmp(config_file, config_backup_file)
-    else:
-        backup_same = True
-
-    # Check if both files exist before comparing
-    if os.path.exists(config_file) and os.path.isfile(config_backup_file):
-        backup_different = not filecmp.cmp(config_file, config_backup_file)
+    sub = row.row()
+    sub.alignment = 'RIGHT'
+    if installed:
+        sub.operator("render_palette.lut_warning", text="", icon="QUESTION", emboss=False)
     else:
-        backup_different = False
-    
-    if backup_same:
-        sub = row.row()
-        sub.alignment = 'RIGHT'
         sub.operator("render_palette.lut_info", text="", icon="QUESTION", emboss=False)
-    elif backup_different:
-        sub = row.row()
-        sub.alignment = 'RIGHT'
-        sub.operator("render_palette.lut_warning", text="", icon="QUESTION", emboss=False)
 
     if scene.expand_luts:        
         lut_tool = scene.lut_tool
 
+        row = box.row()
+        row.prop(preferences, "lut_cache_size", text="LUT Cache Size (MB)")
+        if lut_cache_error:
+            box.label(text=lut_cache_error, icon='ERROR')
+
         if not is_admin():
             row = box.row(align=True)
             row.label(text="To use this function, run Blender as administrator.", icon="FAKE_USER_ON")
@@ -2181,16 +5921,11 @@ def draw_luts_properties(layout, preferences, context):
         split = box.split()
         split = box.split(align=True)
         
-        if lut_tool.lut_dir:            
-            if backup_different:
-                col = split.column(align=True)
-                col.enabled=False
-                col.operator("object.apply_luts", text="Install LUTs")
-            elif backup_same:
-                col = split.column(align=True)
-                col.operator("object.apply_luts", text="Install LUTs")
-
-        if backup_different:
+        if lut_tool.lut_dir:
+            col = split.column(align=True)
+            col.operator("object.apply_luts", text="Update LUTs" if installed else "Install LUTs")
+
+        if installed:
             col = split.column(align=True)
             col.operator("object.restore_backup", text="Remove LUTs")
 
@@ -2256,6 +5991,11 @@ def draw_check_updates(layout, preferences, context):
                 
         # Add a checkbox for enabling/disabling auto-check for updates
         row.prop(preferences, "auto_check_for_updates", text="Auto Check for Updates")
+        if preferences.auto_check_for_updates:
+            row = box.row(align=True)
+            row.label(text="Interval:")
+            row.prop(preferences, "interval_weeks")
+            row.prop(preferences, "interval_days")
         
         row = box.row()
         col = row.column()
@@ -2296,6 +6036,10 @@ def draw_check_updates(layout, preferences, context):
             split.scale_y = 2
             split.operator("render_palette.check_for_updates", text="Check Now for updates")
 
+        if preferences.update_check_error:
+            row = box.row()
+            row.label(text=preferences.update_check_error, icon='ERROR')
+
         # Display last update check time
         if preferences.last_update_check:
             row = box.row()
@@ -2396,6 +6140,7 @@ class RENDERPALATTE_Preferences(bpy.types.AddonPreferences):
     # Properties related to update checking
     last_update_check: bpy.props.StringProperty(name="Last Update Check")
     update_check_status: bpy.props.StringProperty(default="")
+    update_check_error: bpy.props.StringProperty(default="")
     latest_version_number: bpy.props.StringProperty(default="")
 
     # Directory for automatically importing EXR files
@@ -2412,6 +6157,43 @@ class RENDERPALATTE_Preferences(bpy.types.AddonPreferences):
         description="Set the directory where presets are saved and imported from",
         subtype='DIR_PATH',
         default="",
+        update=update_preset_watcher,
+    )
+
+    # Keep the preset list in sync with the preset directory
+    watch_preset_directory: bpy.props.BoolProperty(
+        name="Watch Preset Directory",
+        description="Update the preset list automatically when presets are added, changed or removed in the preset directory",
+        default=False,
+        update=update_preset_watcher,
+    )
+
+    watch_interval: bpy.props.FloatProperty(
+        name="Watch Interval",
+        description="Seconds between checks of the preset directory",
+        default=2.0,
+        min=0.5,
+        max=60.0,
+        subtype='TIME',
+        update=update_preset_watcher,
+    )
+
+    watch_debounce: bpy.props.FloatProperty(
+        name="Settle Time",
+        description="Seconds a changed preset file has to stay unchanged before the list is updated, e.g. during a large copy",
+        default=1.0,
+        min=0.0,
+        max=60.0,
+        subtype='TIME',
+        update=update_preset_watcher,
+    )
+
+    lut_cache_size: bpy.props.IntProperty(
+        name="LUT Cache Size",
+        description="Disk space in MB for parsed LUTs, the least recently used ones are removed first",
+        default=1024,
+        min=16,
+        max=65536,
     )
 
     # Toggle options for various panels
@@ -2451,41 +6233,22 @@ class RENDERPALATTE_Preferences(bpy.types.AddonPreferences):
         default=True
     )
     
-    bpy.types.Scene.interval_days = bpy.props.IntProperty(
-        name="Interval Days", 
-        default=1, 
-        min=0, 
+    interval_days: bpy.props.IntProperty(
+        name="Days",
+        description="Days between automatic update checks",
+        default=1,
+        min=0,
         max=31
     )
     
-    bpy.types.Scene.interval_weeks = bpy.props.IntProperty(
-        name="Interval Weeks", 
-        default=1, 
-        min=0, 
+    interval_weeks: bpy.props.IntProperty(
+        name="Weeks",
+        description="Weeks between automatic update checks",
+        default=1,
+        min=0,
         max=4
     )
     
-    def check_for_updates(self):
-        self.update_check_status = "Checking..."
-        
-        try:
-            url = "https://raw.githubusercontent.com/Jishnu-jithu/render-palette/main/latest_version.txt"
-            response = urllib.request.urlopen(url)
-            self.latest_version_number = response.read().decode('utf-8').strip()
-        except urllib.error.URLError:
-            self.update_check_status = "No Internet Connection"
-            return
-        
-        now = datetime.datetime.now()
-        self.last_update_check = now.strftime("%Y-%m-%d %H:%M:%S")
-
-        # Compare with current version
-        current_version = '.'.join(map(str, bl_info["version"]))
-        if self.latest_version_number > current_version:
-            self.update_check_status = "New Update Available"
-        else:
-            self.update_check_status = "Add-on is Up to Date"
-                
     def draw(self, context):
         layout = self.layout
         
@@ -2497,6 +6260,14 @@ class RENDERPALATTE_Preferences(bpy.types.AddonPreferences):
         box.label(text="Paths:")
         box.prop(self, "exr_import_location", text="EXR Location")
         box.prop(self, "preset_directory", text="Preset Location")
+        row = box.row()
+        row.prop(self, "watch_preset_directory", text="Watch for Changes")
+        sub = row.row()
+        sub.active = self.watch_preset_directory
+        sub.prop(self, "watch_interval", text="Interval")
+        sub.prop(self, "watch_debounce", text="Settle")
+        if preset_watcher_error:
+            box.label(text=preset_watcher_error, icon='ERROR')
         
         draw_enable_panel_settings(layout, self, context)
     
@@ -2546,14 +6317,26 @@ classes = [
     RENDER_PT_camera_properties,
     RENDER_PT_tracking_constraints,
     RENDER_OT_Camera_Orientation,
+    RENDER_OT_crop_to_subject,
+    RENDER_PG_border_props,
+    RENDER_PT_subject_border,
     OBJECT_OT_apply_remove_constraint,
     RENDER_OT_create_camera_to_view,
     RENDER_OT_align_camera_to_view,
     
     RENDER_PT_Batch_Render,
+    RENDER_PT_batch_optimization,
+    RENDER_PT_batch_lut_bake,
+    RENDER_PG_batch_props,
     RENDER_OT_Batch_Render,
     RENDER_CAM_UL_List,
     RENDER_OT_Camera_List,
+    RENDER_OT_Camera_List_Bulk_Add,
+    RENDER_PG_batch_camera,
+    
+    RENDER_OT_tiled_render,
+    RENDER_PG_tiled_props,
+    RENDER_PT_tiled_render,
     
     RENDER_PT_preset_panel,
     RENDER_OT_initialize,
@@ -2562,17 +6345,26 @@ classes = [
     RENDER_OT_remove_preset,
     RENDER_OT_export_preset,
     RENDER_OT_import_preset,
+    RENDER_OT_export_preset_bundle,
+    RENDER_OT_import_preset_bundle,
     RENDER_OT_apply_preset,
+    RENDER_OT_apply_preset_to_files,
     RENDER_OT_save_preset,
     RENDER_OT_move_preset,
     RENDER_MT_preset_menu,
     RENDER_OT_refresh_presets,
     RENDER_UL_presets,
     RENDER_PG_preset,
+    RENDER_OT_benchmark_preset,
+    RENDER_PG_benchmark_props,
     RENDER_OT_show_preset_info,
     
     RENDER_OT_autosave,
     RENDER_OT_toggle_autosave,
+    RENDER_OT_load_autosave_history,
+    RENDER_UL_autosave_history,
+    RENDER_PT_autosave_history,
+    RENDER_PG_autosave_entry,
     RENDER_PG_autosave_props,
     RENDER_OT_toggle_dof,
     
@@ -2580,6 +6372,9 @@ classes = [
     RENDER_OT_lut_apply, 
     RENDER_OT_lut_restore,
     RENDER_OT_lut_info,
+    RENDER_OT_lut_preview,
+    RENDER_OT_lut_contact_sheet,
+    RENDER_PT_lut_preview,
     RENDER_OT_lut_warning,
     
     RENDERPALATTE_Preferences,
@@ -2591,12 +6386,20 @@ classes = [
 ]
 
 def register():
+    global autosave_previews, lut_sheet_previews
+
     for cls in classes:
         bpy.utils.register_class(cls)
     
+    autosave_previews = bpy.utils.previews.new()
+    lut_sheet_previews = bpy.utils.previews.new()
+    
     # Call auto_restore_paths after a delay
     bpy.app.timers.register(lambda: auto_restore_paths(None))
     
+    # Start watching the preset directory once the preferences are available
+    bpy.app.timers.register(start_preset_watcher_on_load)
+    
     bpy.types.Scene.render_type = bpy.props.EnumProperty(
         name="Render Type",
         description="Select render type",
@@ -2707,9 +6510,18 @@ def register():
     bpy.types.VIEW3D_MT_view.append(draw_func)
     
     # Register Batch Render Camera List
-    bpy.types.Scene.batch_render_cameras = bpy.props.CollectionProperty(type=bpy.types.PropertyGroup)
+    bpy.types.Scene.batch_render_cameras = bpy.props.CollectionProperty(type=RENDER_PG_batch_camera)
     bpy.types.Scene.active_camera_index = bpy.props.IntProperty()
     
+    # Register Batch Render Properties
+    bpy.types.Scene.render_palette_batch_props = PointerProperty(type=RENDER_PG_batch_props)
+    
+    # Register Subject Border Properties
+    bpy.types.Scene.render_palette_border_props = PointerProperty(type=RENDER_PG_border_props)
+    
+    # Register Tiled Render Properties
+    bpy.types.Scene.render_palette_tiled_props = PointerProperty(type=RENDER_PG_tiled_props)
+    
     # Register World Properties
     bpy.types.Scene.render_palette_exr_props = PointerProperty(type=RENDER_PG_exr_props)
     
@@ -2722,6 +6534,7 @@ def register():
     # Register Presets Properties
     bpy.types.Scene.render_palette_presets = CollectionProperty(type=RENDER_PG_preset)
     bpy.types.Scene.render_palette_presets_index = IntProperty()
+    bpy.types.Scene.render_palette_benchmark_props = PointerProperty(type=RENDER_PG_benchmark_props)
     
     # Register addon preference bool properties
     bpy.types.Scene.expand_prop = bpy.props.BoolProperty(name="Expand Box", default=False)
@@ -2729,9 +6542,31 @@ def register():
     bpy.types.Scene.expand_luts = bpy.props.BoolProperty(name="Expand Box", default=False)
     bpy.types.Scene.expand_update = bpy.props.BoolProperty(name="Expand Box", default=False)
     
-    bpy.app.handlers.load_post.append(show_update_popup)
+    # Check for updates once the preferences are available, without delaying startup
+    bpy.app.timers.register(auto_check_for_updates, first_interval=1.0)
+
+    bpy.app.handlers.load_post.append(autosave_load_post)
         
 def unregister():
+    global autosave_previews, lut_sheet_previews
+
+    remove_autosave_handlers()
+    if autosave_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(autosave_load_post)
+    for previews in (autosave_previews, lut_sheet_previews):
+        if previews is not None:
+            bpy.utils.previews.remove(previews)
+    autosave_previews = lut_sheet_previews = None
+    if bpy.app.timers.is_registered(start_preset_watcher_on_load):
+        bpy.app.timers.unregister(start_preset_watcher_on_load)
+    stop_preset_watcher()
+    if bpy.app.timers.is_registered(process_preset_watcher_events):
+        bpy.app.timers.unregister(process_preset_watcher_events)
+    if bpy.app.timers.is_registered(auto_check_for_updates):
+        bpy.app.timers.unregister(auto_check_for_updates)
+    if bpy.app.timers.is_registered(process_update_check):
+        bpy.app.timers.unregister(process_update_check)
+    
     for cls in classes:
         bpy.utils.unregister_class(cls)
     
@@ -2752,6 +6587,10 @@ def unregister():
     del bpy.types.Scene.framerate_preset
     
     del bpy.types.Scene.batch_render_cameras
+    del bpy.types.Scene.render_palette_batch_props
+    del bpy.types.Scene.render_palette_border_props
+    del bpy.types.Scene.render_palette_tiled_props
+    del bpy.types.Scene.render_palette_benchmark_props
     del bpy.types.Scene.active_camera_index
     del bpy.types.Scene.render_type
     del bpy.types.Scene.location_type
@@ -0,0 +1,126 @@
+"""Update check tests, run without Blender: bpy is replaced by a stand-in just good enough to import the add-on."""
+
+import http.server
+import importlib.util
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest import mock
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "render_pelette.py")
+
+
+class _AnyName(types.ModuleType):
+    """Module whose missing attributes are dummy classes, so the add-on can subclass bpy.types."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = type(name, (), {})
+        setattr(self, name, value)
+        return value
+
+
+def import_addon():
+    bpy = types.ModuleType("bpy")
+    bpy.__path__ = []
+    bpy.types = _AnyName("bpy.types")
+    for name in ("props", "app", "utils", "context", "data", "ops", "path"):
+        setattr(bpy, name, mock.MagicMock())
+    bpy.app.handlers.persistent = lambda function: function
+    bpy_extras = mock.MagicMock()
+    bpy_extras.io_utils.ImportHelper = type("ImportHelper", (), {})
+
+    modules = {
+        "bpy": bpy,
+        "bpy.types": bpy.types,
+        "bpy.props": bpy.props,
+        "bpy.app": bpy.app,
+        "bpy.app.handlers": bpy.app.handlers,
+        "bpy.utils": bpy.utils,
+        "bpy.utils.previews": bpy.utils.previews,
+        "bpy_extras": bpy_extras,
+        "bpy_extras.io_utils": bpy_extras.io_utils,
+    }
+    with mock.patch.dict(sys.modules, modules):
+        spec = importlib.util.spec_from_file_location("render_pelette", ADDON_PATH)
+        addon = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(addon)
+    return addon
+
+
+class VersionHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(2)
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+        body = b"not a version\n" if self.path == "/garbage" else b"1.10\n"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FetchLatestVersionTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addon = import_addon()
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), VersionHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_reads_version_from_url(self):
+        self.assertEqual(self.addon.fetch_latest_version(self.base_url + "/latest_version.txt"), "1.10")
+
+    def test_newer_version_compares_numerically(self):
+        self.assertGreater(self.addon.parse_version("1.10"), tuple(self.addon.bl_info["version"]))
+
+    def test_http_error_raises_oserror(self):
+        with self.assertRaises(OSError):
+            self.addon.fetch_latest_version(self.base_url + "/missing")
+
+    def test_invalid_version_raises_valueerror(self):
+        with self.assertRaises(ValueError):
+            self.addon.fetch_latest_version(self.base_url + "/garbage")
+
+    def test_timeout_is_applied(self):
+        start = time.monotonic()
+        with self.assertRaises(OSError):
+            self.addon.fetch_latest_version(self.base_url + "/slow", timeout=0.3)
+        self.assertLess(time.monotonic() - start, 1.5)
+
+    def test_worker_reports_result_and_error(self):
+        results = self.addon.queue.Queue()
+        self.addon.update_check_worker(self.base_url + "/latest_version.txt", 1.0, results)
+        self.assertEqual(results.get_nowait(), ("1.10", None))
+
+        self.addon.update_check_worker(self.base_url + "/missing", 1.0, results)
+        latest_version, error = results.get_nowait()
+        self.assertIsNone(latest_version)
+        self.assertIsInstance(error, OSError)
+
+    def test_failure_is_shown_in_preferences(self):
+        prefs = self.addon.bpy.context.preferences.addons[self.addon.__name__].preferences
+        self.addon.update_check_worker(self.base_url + "/missing", 1.0, self.addon.update_check_results)
+        self.assertIsNone(self.addon.process_update_check())
+        self.assertEqual(prefs.update_check_status, "No Internet Connection")
+        self.assertIn("404", prefs.update_check_error)
+
+
+if __name__ == "__main__":
+    unittest.main()